@@ -0,0 +1,169 @@
+"""Chat Completions API를 흉내 내는 로컬 테스트 서버
+
+프로젝트 루트에서 실행합니다:
+    python -m benchmarks.fake_gpt_server [--port 8765] [--delay 0.05]
+                                         [--rate-limit-every N]
+
+앱은 .env(또는 환경변수)에 GPT_BASE_URL=http://127.0.0.1:8765/v1 과
+아무 CHATGPT_API_KEY를 주고 실행합니다. "stream": true 요청에는 답변을
+단어마다 delay초 간격의 SSE 이벤트로 보내므로, 스트리밍 표시와 중지
+버튼, 동시에 보낸 질문을 API 비용 없이 확인할 수 있습니다.
+--rate-limit-every N이면 N번째 요청마다 429와 Retry-After: 1을 보냅니다.
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_answer(messages):
+    """질문을 되풀이하는 가짜 답변"""
+    question = ""
+    if messages:
+        question = str(messages[-1].get("content", ""))
+        # 견적서 JSON 뒤의 질문만 사용
+        question = question.rsplit("질문:", 1)[-1].strip()[:200]
+    return (
+        f"테스트 서버 답변입니다. 질문 \"{question}\" 을 받았습니다. "
+        "이 답변은 단어 단위로 나뉘어 스트리밍됩니다. "
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+    )
+
+
+class FakeGPTHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 서버 설정 (make_server에서 채움)
+    delay = 0.05
+    rate_limit_every = 0
+    counter = None
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 답변 중지로 연결을 끊음
+            pass
+
+    def log_message(self, fmt, *args):
+        print(f"[가짜 GPT] {self.address_string()} {fmt % args}")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "invalid JSON"}})
+            return
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        number = next(self.counter)
+        if self.rate_limit_every and number % self.rate_limit_every == 0:
+            self._send_json(
+                429, {"error": {"message": "rate limited (test)"}},
+                {"Retry-After": "1"}
+            )
+            return
+        answer = make_answer(request.get("messages"))
+        if request.get("stream"):
+            self._stream(answer, request.get("model"))
+        else:
+            self._send_json(200, {
+                "object": "chat.completion",
+                "model": request.get("model"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": answer},
+                    "finish_reason": "stop",
+                }],
+            })
+
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, answer, model):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for word in answer.split(" "):
+            self._send_event({
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{
+                    "index": 0, "delta": {"content": word + " "},
+                }],
+            })
+            time.sleep(self.delay)
+        self._send_chunk(b"data: [DONE]\n\n")
+        self._send_chunk(b"")
+
+    def _send_event(self, data):
+        line = "data: " + json.dumps(data, ensure_ascii=False) + "\n\n"
+        self._send_chunk(line.encode("utf-8"))
+
+    def _send_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+def make_server(host="127.0.0.1", port=8765, delay=0.05,
+                rate_limit_every=0):
+    """가짜 GPT 서버를 만듭니다 (port=0이면 빈 포트)."""
+    handler = type("Handler", (FakeGPTHandler,), {
+        "delay": delay,
+        "rate_limit_every": rate_limit_every,
+        "counter": itertools.count(1),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(**kwargs):
+    """백그라운드 스레드에서 서버를 시작하고 (서버, 기본 URL)을 반환합니다."""
+    server = make_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/v1"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Chat Completions API를 흉내 내는 로컬 테스트 서버"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--delay", type=float, default=0.05,
+        help="스트리밍 단어 사이 간격(초, 기본값: 0.05)"
+    )
+    parser.add_argument(
+        "--rate-limit-every", type=int, default=0,
+        help="N번째 요청마다 429 응답 (기본값: 0 = 사용 안 함)"
+    )
+    args = parser.parse_args(argv)
+    server = make_server(
+        args.host, args.port, args.delay, args.rate_limit_every
+    )
+    print(f"가짜 GPT 서버: http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""견적서 처리 성능 벤치마크
+
+프로젝트 루트에서 실행합니다:
+    python -m benchmarks.run [--sizes 100 1000 5000] [--repeat 3]
+                             [--save-baseline] [--compare 기준파일]
+
+합성 견적서(benchmarks.synthetic_workbook)로 크기별 실행 시간을 재고
+결과를 JSON으로 저장합니다. --save-baseline이면 benchmarks/baseline.json에
+기준값으로 저장하고, --compare를 주면 기준값보다 threshold 이상 느려진
+항목을 표시하고 종료 코드 1을 반환합니다. 의존성이 없어 실행할 수 없는
+항목은 건너뛰고 사유를 결과에 남깁니다.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from .synthetic_workbook import (
+    make_quotation_data, make_quotation_text, make_quotation_workbook
+)
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+RESULT_FILE = os.path.join(BENCH_DIR, "results", "latest.json")
+
+_app = None
+
+
+def _qt_app():
+    """위젯 벤치마크용 QApplication (화면이 없으면 offscreen)"""
+    global _app
+    from PyQt5.QtWidgets import QApplication
+    if _app is None:
+        _app = QApplication.instance()
+    if _app is None:
+        if not os.environ.get("DISPLAY") and sys.platform.startswith(
+            "linux"
+        ):
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _app = QApplication(sys.argv[:1])
+    return _app
+
+
+def _workbook(workdir, size):
+    path = os.path.join(workdir, f"quotation_{size}.xlsx")
+    if not os.path.exists(path):
+        make_quotation_workbook(path, rows=size, language="mixed")
+    return path
+
+
+# 각 항목은 (workdir, size)를 받아 한 번 실행할 함수를 반환합니다.
+# 준비 단계(파일 생성, 모듈 임포트)는 측정하지 않습니다.
+
+def _load_uncached(service, path, table_widget):
+    # 메모리에 남은 시트를 내려 매번 워크북을 다시 읽음
+    service.forget_sheets(path)
+    return service.load_excel(path, table_widget)
+
+
+def bench_load_headless(workdir, size):
+    from src.services.excel_service import ExcelService
+    path = _workbook(workdir, size)
+    service = ExcelService()
+    return lambda: service.load_excel(path, None)
+
+
+def bench_load_view(workdir, size):
+    from src.services.excel_service import ExcelService
+    from src.ui.widgets.zoomable_table import ZoomableTableView
+    _qt_app()
+    path = _workbook(workdir, size)
+    service = ExcelService()
+    view = ZoomableTableView()
+    return lambda: _load_uncached(service, path, view)
+
+
+def bench_load_widget(workdir, size):
+    from PyQt5.QtWidgets import QTableWidget
+    from src.services.excel_service import ExcelService
+    _qt_app()
+    path = _workbook(workdir, size)
+    service = ExcelService()
+    widget = QTableWidget()
+    return lambda: _load_uncached(service, path, widget)
+
+
+def bench_save_to_json(workdir, size):
+    from src.services.excel_service import ExcelService
+    path = _workbook(workdir, size)
+    service = ExcelService()
+    _, items = service.load_excel(path, None)
+    json_path = os.path.join(workdir, f"save_{size}.json")
+    header = {"DATE": "2025-01-02"}
+    summary = {"total_due": 1000}
+    return lambda: service._save_to_json(json_path, items, header, summary)
+
+
+def bench_split_text(workdir, size):
+    from pdf_to_json_gpt import split_text
+    text = make_quotation_text(size)
+    return lambda: split_text(text)
+
+
+def bench_save_pdf(workdir, size):
+    from reportlab_invoice_sample import save_invoice_to_pdf
+    data = make_quotation_data(size)
+    pdf_path = os.path.join(workdir, f"invoice_{size}.pdf")
+    return lambda: save_invoice_to_pdf(data, pdf_path)
+
+
+def bench_viewer_load_json(workdir, size):
+    _qt_app()
+    from invoice_viewer import InvoiceTemplateViewer
+    json_path = os.path.join(workdir, f"invoice_{size}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(make_quotation_data(size), f, ensure_ascii=False)
+    viewer = InvoiceTemplateViewer(workdir)
+    return lambda: viewer.load_json(json_path)
+
+
+BENCHMARKS = {
+    "load_excel_headless": bench_load_headless,
+    "load_excel_view": bench_load_view,
+    "load_excel_widget": bench_load_widget,
+    "save_to_json": bench_save_to_json,
+    "split_text": bench_split_text,
+    "save_invoice_to_pdf": bench_save_pdf,
+    "viewer_load_json": bench_viewer_load_json,
+}
+
+
+def _time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "min_ms": round(min(times) * 1000, 3),
+        "runs": len(times),
+    }
+
+
+def _environment():
+    env = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        import openpyxl
+        env["openpyxl"] = openpyxl.__version__
+    except ImportError:
+        pass
+    return env
+
+
+def run(names, sizes, repeat, workdir):
+    """벤치마크를 실행하고 결과 dict를 반환합니다."""
+    results = {}
+    skipped = {}
+    for name in names:
+        for size in sizes:
+            try:
+                func = BENCHMARKS[name](workdir, size)
+            except Exception as e:
+                skipped[name] = f"{type(e).__name__}: {e}"
+                print(f"[건너뜀] {name}: {skipped[name]}")
+                break
+            # 첫 실행(임포트/캐시 준비)은 측정에서 제외
+            func()
+            stats = _time(func, repeat)
+            results.setdefault(name, {})[str(size)] = stats
+            print(
+                f"{name:22} {size:>7}행  중앙값 {stats['median_ms']:>10.1f}ms"
+                f"  최소 {stats['min_ms']:>10.1f}ms"
+            )
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": _environment(),
+        "repeat": repeat,
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(current, baseline, threshold=0.1):
+    """기준값 대비 중앙값 비율을 출력하고 느려진 항목 목록을 반환합니다."""
+    regressions = []
+    base_results = baseline.get("results", {})
+    print(f"\n기준값 ({baseline.get('created', '?')}) 대비:")
+    for name, sizes in current["results"].items():
+        for size, stats in sizes.items():
+            base = base_results.get(name, {}).get(size)
+            if base is None or not base["median_ms"]:
+                continue
+            ratio = stats["median_ms"] / base["median_ms"]
+            mark = ""
+            if ratio > 1 + threshold:
+                mark = "  <-- 느려짐"
+                regressions.append((name, size, ratio))
+            print(f"{name:22} {size:>7}행  x{ratio:.2f}{mark}")
+    if baseline.get("environment") != current["environment"]:
+        print("(주의) 기준값과 실행 환경이 다릅니다.")
+    return regressions
+
+
+def _write_json(path, data):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="합성 견적서로 처리 성능을 측정합니다."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 5000],
+        help="품목 행 수 목록 (기본값: 100 1000 5000)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="크기별 반복 횟수 (기본값: 3)"
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(BENCHMARKS),
+        help="실행할 항목만 지정"
+    )
+    parser.add_argument(
+        "--output", default=RESULT_FILE, help="결과 JSON 파일 경로"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="결과를 benchmarks/baseline.json에 기준값으로 저장"
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=BASELINE_FILE, default=None,
+        help="비교할 기준 결과 파일 (기본값: benchmarks/baseline.json)"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="느려짐으로 볼 비율 (기본값: 0.1 = 10%%)"
+    )
+    args = parser.parse_args(argv)
+
+    names = args.only or list(BENCHMARKS)
+    with tempfile.TemporaryDirectory(prefix="invoice_bench_") as workdir:
+        current = run(names, args.sizes, args.repeat, workdir)
+    _write_json(args.output, current)
+    print(f"\n결과 저장: {args.output}")
+    if args.save_baseline:
+        _write_json(BASELINE_FILE, current)
+        print(f"기준값 저장: {BASELINE_FILE}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(current, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""벤치마크용 합성 견적서 생성기
+
+실제 견적서와 비슷한 구조(상단 고정 레이블, 품목 표, 카테고리 행,
+요약 레이블)의 엑셀 파일과, 견적서 뷰어/PDF용 JSON 데이터를 만듭니다.
+같은 인자와 seed로는 항상 같은 내용을 만듭니다.
+"""
+import random
+
+# 품목 표 헤더 (열 순서: 품목, 단가, 수량, 단위, 금액, 비고)
+HEADERS = {
+    "ko": ["품목", "단가", "수량", "단위", "금액", "비고"],
+    "en": ["Description", "Unit(KRW)", "Qty", "Unit", "Amount", "Remark"],
+}
+
+# 상단 고정 레이블 (레이블, 값)
+TOP_LABELS = {
+    "ko": [
+        ("발급일", "2025-01-02"), ("상호", "유스튜디오"),
+        ("대표이사", "홍길동"), ("등록번호", "123-45-67890"),
+    ],
+    "en": [
+        ("DATE", "2025-01-02"), ("QUOTATION #", "Q-2025-001"),
+        ("Payment date", "2025-02-01"), ("SHIP TO", "Seoul"),
+    ],
+}
+
+SUMMARY_LABELS = {
+    "ko": ["소계", "세금", "총액"],
+    "en": ["Sub total", "Tax due", "TOTAL Due"],
+}
+
+ITEM_WORDS = {
+    "ko": ["조명", "음향", "무대", "영상", "설치", "운송", "인건비", "장비"],
+    "en": ["Lighting", "Audio", "Stage", "Video", "Setup", "Truck",
+           "Crew", "Rental"],
+}
+
+
+def make_quotation_workbook(path, rows=1000, styles=True, merges=True,
+                            theme_fills=True, language="ko", seed=0):
+    """합성 견적서 엑셀 파일을 path에 저장합니다.
+
+    rows: 품목 행 수 (20행마다 카테고리 행이 더해짐)
+    styles: 글꼴/테두리/정렬/단색 배경 적용 여부
+    merges: 제목과 카테고리 행을 병합할지 여부
+    theme_fills: 테마 색 + 틴트 배경을 쓸지 여부
+    language: 헤더/레이블 언어 ("ko", "en", "mixed"는 행마다 섞음)
+    """
+    import openpyxl
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.styles.colors import Color
+
+    rng = random.Random(seed)
+    header_lang = "en" if language == "en" else "ko"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "견적서"
+
+    ws["A1"] = "견적서 QUOTATION"
+    for r, (label, value) in enumerate(TOP_LABELS[header_lang], 3):
+        ws.cell(row=r, column=1, value=label)
+        ws.cell(row=r, column=2, value=value)
+
+    thin = Side("thin")
+    cell_border = Border(left=thin, right=thin, bottom=thin)
+    header_border = Border(
+        top=thin, bottom=Side("medium"), left=thin, right=thin
+    )
+    header_font = Font(name="맑은 고딕", sz=11, b=True)
+    body_font = Font(name="맑은 고딕", sz=10)
+    center = Alignment(horizontal="center", vertical="center")
+    if theme_fills:
+        header_fill = PatternFill("solid", fgColor=Color(theme=4, tint=0.4))
+        category_fill = PatternFill(
+            "solid", fgColor=Color(theme=8, tint=0.6)
+        )
+    else:
+        header_fill = PatternFill("solid", fgColor="FF95B3D7")
+        category_fill = PatternFill("solid", fgColor="FFDDEEFF")
+    stripe_fill = PatternFill("solid", fgColor=Color(indexed=22))
+
+    header_row = 10
+    cols = len(HEADERS[header_lang])
+    for c, text in enumerate(HEADERS[header_lang], 1):
+        cell = ws.cell(row=header_row, column=c, value=text)
+        if styles:
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = center
+            cell.border = header_border
+
+    r = header_row + 1
+    for k in range(rows):
+        if k % 20 == 0:
+            ws.cell(row=r, column=1, value=f"카테고리 Category {k // 20}")
+            if styles:
+                ws.cell(row=r, column=1).fill = category_fill
+            if merges:
+                ws.merge_cells(
+                    start_row=r, start_column=1, end_row=r, end_column=4
+                )
+            r += 1
+        lang = language
+        if lang == "mixed":
+            lang = "ko" if k % 2 else "en"
+        price = rng.randint(1, 2000) * 1000
+        qty = rng.randint(1, 10)
+        word = rng.choice(ITEM_WORDS[lang])
+        values = [
+            f"{word} {k}", price, qty, "EA", price * qty,
+            "note" if k % 7 == 0 else None,
+        ]
+        for c, value in enumerate(values, 1):
+            cell = ws.cell(row=r, column=c, value=value)
+            if styles:
+                cell.font = body_font
+                cell.border = cell_border
+                if k % 3 == 0:
+                    cell.fill = stripe_fill
+        r += 1
+
+    for label in SUMMARY_LABELS[header_lang]:
+        ws.cell(row=r, column=cols - 2, value=label)
+        ws.cell(row=r, column=cols - 1, value=rng.randint(1, 999) * 1000)
+        r += 1
+    if merges:
+        ws.merge_cells(
+            start_row=1, start_column=1, end_row=1, end_column=cols
+        )
+        ws.cell(row=r, column=1, value="참고 사항")
+        ws.merge_cells(
+            start_row=r, start_column=1, end_row=r + 1, end_column=2
+        )
+    ws.column_dimensions["A"].width = 40
+    ws.row_dimensions[header_row].height = 30
+    wb.save(path)
+    return path
+
+
+def make_quotation_data(rows=1000, seed=0):
+    """견적서 뷰어/PDF 생성용 카테고리 구조 JSON 데이터를 만듭니다."""
+    rng = random.Random(seed)
+    categories = []
+    total = 0
+    for k in range(0, rows, 20):
+        items = []
+        amount = 0
+        for i in range(k, min(k + 20, rows)):
+            price = rng.randint(1, 2000) * 1000
+            qty = rng.randint(1, 10)
+            items.append({
+                "품목명": f"{rng.choice(ITEM_WORDS['ko'])} {i}",
+                "수량": qty,
+                "단가": price,
+                "금액": price * qty,
+                "비고": "note" if i % 7 == 0 else "",
+            })
+            amount += price * qty
+        categories.append({
+            "category": f"카테고리 {k // 20}",
+            "amount": amount,
+            "items": items,
+        })
+        total += amount
+    tax = total // 10
+    return {
+        "견적번호": "Q-2025-001",
+        "견적일자": "2025-01-02",
+        "거래처명": "유스튜디오",
+        "카테고리": categories,
+        "합계금액": total,
+        "세액": tax,
+        "총액": total + tax,
+        "other_comments": "",
+    }
+
+
+def make_quotation_text(rows=1000, seed=0):
+    """PDF에서 뽑은 것과 비슷한 견적서 텍스트 (split_text 입력)"""
+    rng = random.Random(seed)
+    lines = ["견적서 QUOTATION", "견적번호: Q-2025-001", "거래처명: 유스튜디오"]
+    for i in range(rows):
+        price = rng.randint(1, 2000) * 1000
+        qty = rng.randint(1, 10)
+        word = rng.choice(ITEM_WORDS["ko"] + ITEM_WORDS["en"])
+        lines.append(f"{word} {i}  {qty} EA  {price:,}  {price * qty:,}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,152 @@
+"""폴더의 엑셀 견적서를 병렬로 JSON 추출하는 명령줄 도구
+
+프로젝트 루트에서 실행합니다:
+    python -m src.batch_extract [폴더] [--workers N] [--recursive] [--force]
+                                [--no-cache] [--no-sidecar]
+
+폴더를 생략하면 .env의 LOCAL_BID_FOLDER를 사용합니다.
+JSON이 엑셀 파일보다 새로우면 변경되지 않은 것으로 보고 건너뜁니다.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.config.settings import (
+    LOCAL_BID_FOLDER, PARSE_CACHE_DIR, PARSE_CACHE_MAX_MB, PROFILE,
+    PROFILE_TRACE
+)
+
+# 작업 프로세스마다 하나씩 만드는 ExcelService
+_service = None
+
+
+def _init_worker(use_cache, use_sidecar=True):
+    global _service
+    from src.services.excel_service import ExcelService
+    from src.services.parse_cache import ParseCache
+    from src.utils.profiling import StageProfiler
+    parse_cache = None
+    if use_cache:
+        parse_cache = ParseCache(
+            PARSE_CACHE_DIR, PARSE_CACHE_MAX_MB * 1024 * 1024
+        )
+    # 추적 파일은 프로세스들이 한 줄씩 덧붙임
+    _service = ExcelService(
+        parse_cache=parse_cache,
+        use_sidecar=use_sidecar,
+        profiler=StageProfiler(PROFILE, PROFILE_TRACE)
+    )
+
+
+def _extract_file(path):
+    """단일 엑셀 파일을 헤드리스 모드로 추출합니다 (작업 프로세스)."""
+    start = time.perf_counter()
+    _, items = _service.load_excel(path, None)
+    return len(items), time.perf_counter() - start
+
+
+def find_workbooks(folder, recursive=False):
+    """폴더의 .xlsx 파일 목록 (엑셀 임시 잠금 파일 제외)"""
+    paths = []
+    for root, dirs, files in os.walk(folder):
+        for name in sorted(files):
+            if name.lower().endswith(".xlsx") and not name.startswith("~$"):
+                paths.append(os.path.join(root, name))
+        if not recursive:
+            break
+    return paths
+
+
+def is_up_to_date(path):
+    """JSON이 엑셀 파일 이후에 만들어졌는지 확인합니다."""
+    json_path = os.path.splitext(path)[0] + ".json"
+    try:
+        return os.path.getmtime(json_path) >= os.path.getmtime(path)
+    except OSError:
+        return False
+
+
+def run(folder, workers=None, recursive=False, force=False, use_cache=True,
+        use_sidecar=True):
+    """폴더의 엑셀 파일을 병렬로 추출하고 실패한 파일 목록을 반환합니다.
+
+    use_sidecar이면 뷰어가 엑셀 옆에 저장한 .sheet 사이드카가 있을 때
+    XML을 다시 파싱하지 않고 사이드카에서 추출합니다.
+    """
+    paths = find_workbooks(folder, recursive)
+    todo = [p for p in paths if force or not is_up_to_date(p)]
+    skipped = len(paths) - len(todo)
+    print(
+        f"총 {len(paths)}개 파일 중 {len(todo)}개를 처리합니다 "
+        f"(변경 없음 {skipped}개 건너뜀)"
+    )
+    failed = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(use_cache, use_sidecar)
+    ) as executor:
+        futures = {executor.submit(_extract_file, p): p for p in todo}
+        for future in as_completed(futures):
+            path = futures[future]
+            name = os.path.relpath(path, folder)
+            try:
+                item_count, seconds = future.result()
+                print(f"[완료] {name} ({seconds:.2f}s, 품목 {item_count}개)")
+            except Exception as e:
+                print(f"[실패] {name}: {e}")
+                failed.append(path)
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n처리 완료: {len(todo) - len(failed)}/{len(todo)} 성공, "
+        f"{elapsed:.1f}s"
+    )
+    if failed:
+        print("\n실패한 파일 목록:")
+        for path in failed:
+            print(f"- {os.path.relpath(path, folder)}")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="폴더의 엑셀 견적서를 병렬로 JSON 추출합니다."
+    )
+    parser.add_argument(
+        "folder", nargs="?", default=LOCAL_BID_FOLDER,
+        help="엑셀 파일 폴더 (기본값: LOCAL_BID_FOLDER)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="작업 프로세스 수 (기본값: CPU 코어 수)"
+    )
+    parser.add_argument(
+        "--recursive", action="store_true", help="하위 폴더까지 처리"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="변경 없는 파일도 다시 추출"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="파싱 캐시를 쓰지 않음"
+    )
+    parser.add_argument(
+        "--no-sidecar", action="store_true",
+        help=".sheet 사이드카 파일을 읽지 않음"
+    )
+    args = parser.parse_args(argv)
+    if not args.folder or not os.path.isdir(args.folder):
+        parser.error(
+            "엑셀 폴더를 지정하거나 .env에 LOCAL_BID_FOLDER를 설정하세요."
+        )
+    failed = run(
+        args.folder, args.workers, args.recursive, args.force,
+        not args.no_cache, not args.no_sidecar
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import json
+
+# 품목 표의 열 헤더 후보 (normalize_header 결과와 정확히 일치)
+HEADER_COLUMNS = {
+    "description": ["description", "item", "품목", "상세내역"],
+    "unit_krw": [
+        "unitkrw", "unitcost", "unitprice", "단가", "단가원", "단가$",
+        "unit", "unit$"
+    ],
+    "quantity": ["qty", "quantity", "수량"],
+    "amount": ["amount", "totalamount", "금액", "합계"],
+    "unit": ["unit", "단위"],
+    "remark": ["remark", "비고", "note"],
+}
+
+# 상단 헤더 레이블 (오른쪽 또는 아래 셀이 값)
+HEADER_LABELS = [
+    "DATE", "QUOTATION #", "Payment date", "SHIP TO",
+    "발급일", "공급자", "등록번호", "상호", "대표이사", "사업자 주소"
+]
+
+# 요약 정보 레이블 (셀 텍스트에 포함되면 오른쪽 셀이 값)
+SUMMARY_LABELS = {
+    "subtotal": ["Sub total", "소계"],
+    "tax_rate": ["Tax rate", "세율"],
+    "tax_due": ["Tax due", "세금"],
+    "other": ["Other", "기타"],
+    "total_due": ["TOTAL Due", "총액", "합계", "TOTAL"]
+}
+
+# 품목에서 제외할 요약 키워드 (소문자 품목명에 포함되면 제외)
+ITEM_SKIP_KEYWORDS = [
+    "합계", "총액", "vat", "참고", "소계", "tax", "total", "sum"
+]
+
+
+def load_vocabulary(extra_path=None):
+    """기본 레이블 어휘에 고객사별 동의어 파일을 더해 반환합니다.
+
+    extra_path는 아래 형식의 JSON 파일이며, 모든 키는 생략할 수 있습니다.
+    {"header_columns": {"quantity": ["EA수량"]},
+     "header_labels": ["견적번호"],
+     "summary_labels": {"total_due": ["최종금액"]},
+     "item_skip_keywords": ["할인"]}
+    """
+    vocabulary = {
+        "header_columns": {
+            field: list(keys) for field, keys in HEADER_COLUMNS.items()
+        },
+        "header_labels": list(HEADER_LABELS),
+        "summary_labels": {
+            field: list(keys) for field, keys in SUMMARY_LABELS.items()
+        },
+        "item_skip_keywords": list(ITEM_SKIP_KEYWORDS),
+    }
+    if not extra_path:
+        return vocabulary
+    with open(extra_path, "r", encoding="utf-8") as f:
+        extra = json.load(f)
+    for name in ("header_columns", "summary_labels"):
+        for field, keys in extra.get(name, {}).items():
+            vocabulary[name].setdefault(field, []).extend(keys)
+    for name in ("header_labels", "item_skip_keywords"):
+        vocabulary[name].extend(extra.get(name, []))
+    return vocabulary
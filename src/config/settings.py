@@ -1,18 +1,87 @@
+"""환경변수 설정
+
+.env는 설정 값을 처음 읽을 때 한 번만 불러옵니다 (모듈 __getattr__).
+"""
 import os
-from dotenv import load_dotenv
-
-# .env에서 모든 환경변수 불러오기
-load_dotenv()
-
-# Dropbox 관련 환경변수
-DROPBOX_APP_KEY = os.getenv("DROPBOX_APP_KEY", "")
-DROPBOX_APP_SECRET = os.getenv("DROPBOX_APP_SECRET", "")
-DROPBOX_ACCESS_TOKEN = os.getenv("DROPBOX_ACCESS_TOKEN", "")
-DROPBOX_REFRESH_TOKEN = os.getenv("DROPBOX_REFRESH_TOKEN", "")
-DROPBOX_SHARED_FOLDER_ID = os.getenv("DROPBOX_SHARED_FOLDER_ID", "")
-DROPBOX_SHARED_FOLDER_NAME = os.getenv("DROPBOX_SHARED_FOLDER_NAME", "")
-LOCAL_BID_FOLDER = os.getenv("LOCAL_BID_FOLDER", "")
-
-# ChatGPT 관련 환경변수
-GPT_API_KEY = os.getenv("CHATGPT_API_KEY", "")
-GPT_MODEL = "gpt-4.1-mini"  # 모델을 gpt-4.1-mini로 고정 
\ No newline at end of file
+
+_values = None
+
+
+def _load():
+    from dotenv import load_dotenv
+
+    # .env에서 모든 환경변수 불러오기
+    load_dotenv()
+    return {
+        # Dropbox 관련 환경변수
+        "DROPBOX_APP_KEY": os.getenv("DROPBOX_APP_KEY", ""),
+        "DROPBOX_APP_SECRET": os.getenv("DROPBOX_APP_SECRET", ""),
+        "DROPBOX_ACCESS_TOKEN": os.getenv("DROPBOX_ACCESS_TOKEN", ""),
+        "DROPBOX_REFRESH_TOKEN": os.getenv("DROPBOX_REFRESH_TOKEN", ""),
+        "DROPBOX_SHARED_FOLDER_ID": os.getenv("DROPBOX_SHARED_FOLDER_ID", ""),
+        "DROPBOX_SHARED_FOLDER_NAME": os.getenv(
+            "DROPBOX_SHARED_FOLDER_NAME", ""
+        ),
+        "LOCAL_BID_FOLDER": os.getenv("LOCAL_BID_FOLDER", ""),
+
+        # ChatGPT 관련 환경변수
+        "GPT_API_KEY": os.getenv("CHATGPT_API_KEY", ""),
+        "GPT_MODEL": "gpt-4.1-mini",  # 모델을 gpt-4.1-mini로 고정
+        # 호환 API 서버나 프록시를 쓸 때 변경
+        "GPT_BASE_URL": os.getenv(
+            "GPT_BASE_URL", "https://api.openai.com/v1"
+        ),
+        # 연결/응답 대기 시간(초)과 429·5xx 재시도 횟수
+        "GPT_CONNECT_TIMEOUT": float(os.getenv("GPT_CONNECT_TIMEOUT", "5")),
+        "GPT_READ_TIMEOUT": float(os.getenv("GPT_READ_TIMEOUT", "60")),
+        "GPT_MAX_RETRIES": int(os.getenv("GPT_MAX_RETRIES", "4")),
+        # 질문에 넣는 견적서 문맥의 최대 토큰 수 (넘으면 관련 품목만)
+        "GPT_CONTEXT_TOKENS": int(os.getenv("GPT_CONTEXT_TOKENS", "8000")),
+        # 같은 견적서에 같은 질문이면 저장해 둔 답변 사용 (0이면 끔)
+        "GPT_CACHE_DIR": os.getenv(
+            "GPT_CACHE_DIR",
+            os.path.join(
+                os.path.expanduser("~"), ".invoice_sheet", "gpt_cache"
+            )
+        ),
+        "GPT_CACHE_MAX_MB": int(os.getenv("GPT_CACHE_MAX_MB", "32")),
+        "GPT_CACHE_TTL_HOURS": float(
+            os.getenv("GPT_CACHE_TTL_HOURS", "168")
+        ),
+
+        # 엑셀 파싱 캐시
+        "PARSE_CACHE_DIR": os.getenv(
+            "PARSE_CACHE_DIR",
+            os.path.join(
+                os.path.expanduser("~"), ".invoice_sheet", "parse_cache"
+            )
+        ),
+        "PARSE_CACHE_MAX_MB": int(os.getenv("PARSE_CACHE_MAX_MB", "256")),
+
+        # 열어 둔 시트를 메모리에 유지하는 예산 (넘으면 오래된 시트부터 내림)
+        "SHEET_CACHE_MAX_MB": int(os.getenv("SHEET_CACHE_MAX_MB", "512")),
+
+        # 고객사별 헤더/요약 레이블 동의어 JSON 파일 (선택)
+        "LABELS_FILE": os.getenv("LABELS_FILE", ""),
+
+        # 단계별 프로파일링 (INVOICE_PROFILE=1이면 켜짐)과 추적 파일
+        "PROFILE": os.getenv("INVOICE_PROFILE", "") not in ("", "0"),
+        "PROFILE_TRACE": os.getenv(
+            "INVOICE_PROFILE_TRACE",
+            os.path.join(
+                os.path.expanduser("~"), ".invoice_sheet", "profile.jsonl"
+            )
+        ),
+    }
+
+
+def __getattr__(name):
+    global _values
+    if _values is None:
+        _values = _load()
+    try:
+        return _values[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
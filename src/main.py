@@ -1,12 +1,44 @@
+import time
+
+_START = time.perf_counter()
+
 import sys
 from PyQt5.QtWidgets import QApplication
-from ui.main_window import ExcelGPTViewer
+from PyQt5.QtCore import QObject, QEvent
+from src.ui.main_window import ExcelGPTViewer
+
+_IMPORTED = time.perf_counter()
+
+
+class StartupTimer(QObject):
+    """창이 처음 그려질 때 시작 시간(임포트/창 생성/첫 페인트)을 기록"""
+
+    def __init__(self, viewer, created):
+        super().__init__(viewer)
+        self.viewer = viewer
+        self.created = created
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            painted = time.perf_counter()
+            self.viewer.log(
+                "[시작] 임포트 {:.0f}ms, 창 생성 {:.0f}ms, "
+                "첫 화면 {:.0f}ms".format(
+                    (_IMPORTED - _START) * 1000,
+                    (self.created - _IMPORTED) * 1000,
+                    (painted - _START) * 1000
+                )
+            )
+        return False
+
 
 def main():
     app = QApplication(sys.argv)
     viewer = ExcelGPTViewer()
+    viewer.installEventFilter(StartupTimer(viewer, time.perf_counter()))
     viewer.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
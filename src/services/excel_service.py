@@ -1,95 +1,437 @@
+import hashlib
 import os
-import json
-import openpyxl
+import threading
+from collections import OrderedDict
+
 from PyQt5.QtWidgets import QTableWidgetItem
-from PyQt5.QtGui import QFont, QColor
 from PyQt5.QtCore import Qt
-from ..utils.color_utils import apply_tint
-import re
+from ..utils.color_utils import ThemePalette, hex_to_rgb
+from ..utils.file_utils import atomic_write_json, sheet_file_stem
+from ..utils.profiling import StageProfiler
+from ..utils.style_cache import StyleCache
+from ..config.labels import load_vocabulary
+from ..config import settings
+from .label_matcher import LabelMatcher, normalize_label
+from .sheet_sidecar import read_sidecar, sidecar_path, write_sidecar
+from .sheet_snapshot import MergeIndex, SheetSnapshot, StyleSpec
+
+
+HEADER_LABEL_MAX_ROW = 15
 
 
 class ExcelService:
-    def __init__(self):
-        self.accent_colors = {1: '3B4E87'}  # accent1 파랑 계열 RGB를 하드코딩
+    def __init__(self, parse_cache=None, use_sidecar=False, labels=None,
+                 max_sheets=8, max_sheet_bytes=None, profiler=None,
+                 log=print):
+        # 테마가 없는 워크북에 쓰는 Office 기본 테마
+        self.default_palette = ThemePalette()
+        self.style_cache = StyleCache()
+        # ParseCache가 있으면 같은 내용의 파일은 openpyxl 없이 엶
+        self.parse_cache = parse_cache
+        # 파싱한 시트를 엑셀 옆 .sheet 파일로 저장하고 다시 열 때 사용
+        self.use_sidecar = use_sidecar
+        # 헤더/요약 레이블 어휘 (기본값 + LABELS_FILE 동의어)
+        self.labels = labels or LabelMatcher(
+            load_vocabulary(settings.LABELS_FILE)
+        )
+        # 파싱한 시트 (경로, 시트) → (파일 스탬프, 스냅샷, 추정 크기),
+        # 최근 사용 순. 개수와 메모리 예산(max_sheet_bytes)을 넘으면
+        # 오래된 시트부터 내림
+        self.max_sheets = max_sheets
+        self.max_sheet_bytes = max_sheet_bytes
+        self._sheets = OrderedDict()
+        self._sheet_bytes = 0
+        self._sheets_lock = threading.Lock()
+        # 단계별 시간/할당 기록 (기본은 꺼짐)
+        self.profiler = profiler or StageProfiler()
+        # 캐시/사이드카 오류와 프로파일 요약을 보낼 곳. 워커 스레드에서도
+        # 부르므로 GUI는 스레드에 안전한 함수를 넘겨야 함
+        self.log = log
 
     def load_excel(self, path, table_widget):
-        """엑셀 파일을 로드하여 테이블 위젯에 표시합니다."""
-        wb = openpyxl.load_workbook(path, data_only=True)
-        ws = wb.active
-        rows, cols = ws.max_row, ws.max_column
-        
-        if table_widget is not None:
-            table_widget.blockSignals(True)
-            table_widget.clear()
-            table_widget.setRowCount(rows)
-            table_widget.setColumnCount(cols)
+        """엑셀 파일을 로드하여 테이블 위젯에 표시합니다.
 
-            # 헤더 정보 추출
-            header_row, header_map = self._extract_header_info(ws)
-            
-            # 품목 정보 추출
-            items = self._extract_items(ws, header_row, header_map)
+        table_widget에 set_snapshot()이 있으면(ZoomableTableView) 뷰가
+        스냅샷으로 모델을 만들고, 그 외(QTableWidget)는 셀마다 아이템을
+        만듭니다.
+        table_widget이 None이면 스타일을 읽지 않고 행을 스트리밍하는
+        헤드리스 모드로 데이터만 추출합니다.
+        """
+        with self.profiler.run("load_excel", file=path) as trace:
+            result = self._load_excel(path, table_widget)
+        if trace is not None:
+            self.log(trace.summary())
+        return result
 
-            # 셀 스타일 적용
-            self._apply_cell_styles(ws, table_widget)
+    def _load_excel(self, path, table_widget):
+        prof = self.profiler
+        if table_widget is None:
+            with prof.stage("cache_read"):
+                entry = self._cache_get(path)
+                snapshot = (
+                    self._read_sidecar(path) if entry is None else None
+                )
+            if entry is not None:
+                items, header, summary = entry["extracted"]
+            elif snapshot is not None:
+                with prof.stage("merges"):
+                    merges = snapshot.merge_index()
+                items, header, summary = self._extract_rows(
+                    snapshot.iter_rows(), snapshot.cols, merges=merges
+                )
+                # 사이드카에서 읽은 결과로 파싱 캐시도 다시 채움
+                with prof.stage("cache_write"):
+                    self._cache_put(path, snapshot, (items, header, summary))
+            else:
+                items, header, summary = self._extract_streaming(path)
+                with prof.stage("cache_write"):
+                    self._cache_put(path, None, (items, header, summary))
+            json_path = self.json_path(path)
+            self._save_to_json(json_path, items, header, summary)
+            return json_path, items
+
+        for snapshot, _ in self.iter_load(path):
+            pass
+        json_path, items = self.finish_load(path, snapshot)
+        with prof.stage("view"):
+            self.show_snapshot(snapshot, table_widget)
+        return json_path, items
 
-            # 병합 셀 처리
-            self._handle_merged_cells(ws, table_widget)
+    def list_sheets(self, path):
+        """(워크시트 이름 목록, 활성 시트 이름)을 셀을 읽지 않고 반환합니다."""
+        # openpyxl은 실제로 파일을 읽을 때 처음 불러옴 (시작 시간 단축)
+        from .workbook_reader import WorkbookReader
 
-            # 열 너비/행 높이 설정
-            self._set_dimensions(ws, table_widget)
+        return WorkbookReader(path).list_sheets()
 
-            table_widget.blockSignals(False)
-        else:
-            # UI 없이 데이터만 추출
-            header_row, header_map = self._extract_header_info(ws)
-            items = self._extract_items(ws, header_row, header_map)
+    def cached_sheet(self, path, sheet=None):
+        """이미 파싱해 메모리에 있는 시트의 스냅샷, 없으면 None"""
+        key = (os.path.abspath(path), sheet)
+        with self._sheets_lock:
+            cached = self._sheets.get(key)
+            if cached is None:
+                return None
+            if cached[0] != self._file_stamp(path):
+                self._drop_sheet(key)
+                return None
+            self._sheets.move_to_end(key)
+            return cached[1]
+
+    def forget_sheets(self, path):
+        """파일의 모든 시트를 메모리에서 내립니다 (문서를 닫을 때)."""
+        path = os.path.abspath(path)
+        with self._sheets_lock:
+            for key in [k for k in self._sheets if k[0] == path]:
+                self._drop_sheet(key)
 
-        # JSON 파일 저장
-        json_path = os.path.splitext(path)[0] + ".json"
-        self._save_to_json(json_path, ws, items)
+    def _remember_sheet(self, path, sheet, snapshot):
+        key = (os.path.abspath(path), sheet)
+        size = snapshot.estimated_bytes()
+        with self._sheets_lock:
+            if key in self._sheets:
+                # 같은 스냅샷을 다시 넣을 때는 매핑을 유지
+                old = self._sheets[key][1]
+                self._drop_sheet(key, close=old is not snapshot)
+            self._sheets[key] = (self._file_stamp(path), snapshot, size)
+            self._sheet_bytes += size
+            # 방금 넣은 시트는 예산을 넘어도 유지
+            while len(self._sheets) > 1 and (
+                len(self._sheets) > self.max_sheets
+                or (self.max_sheet_bytes is not None
+                    and self._sheet_bytes > self.max_sheet_bytes)
+            ):
+                self._drop_sheet(next(iter(self._sheets)))
+
+    def _drop_sheet(self, key, close=True):
+        _, snapshot, size = self._sheets.pop(key)
+        self._sheet_bytes -= size
+        if close:
+            # 사이드카 매핑을 닫아야 새 사이드카로 덮어쓸 수 있음 (Windows)
+            snapshot.close()
+
+    def _file_stamp(self, path):
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def iter_load(self, path, block_rows=None, sheet=None):
+        """워크북을 읽으며 (스냅샷, 채운 행 수)를 블록 단위로 반환합니다.
+
+        첫 값은 셀이 비어 있는 스냅샷과 0이며, 이후 block_rows행마다
+        채워진 행 수를 반환합니다. 백그라운드 로딩에서 사용합니다.
+        sheet가 None이면 활성 시트를 읽으며, 다른 시트는 파싱하지
+        않습니다.
+        """
+        prof = self.profiler
+        with prof.stage("cache_read"):
+            snapshot = self.cached_sheet(path, sheet)
+            if snapshot is None:
+                snapshot = self._read_sidecar(path, sheet)
+            if snapshot is None:
+                entry = self._cache_get(path, sheet)
+                if entry is not None and entry["snapshot"] is not None:
+                    snapshot = entry["snapshot"]
+                    snapshot.extracted = entry["extracted"]
+        if snapshot is not None:
+            yield snapshot, 0
+            yield snapshot, snapshot.rows
+            return
+
+        from .workbook_reader import WorkbookReader
+
+        with prof.stage("openpyxl"):
+            ws = WorkbookReader(path, sheet).read_sheet()
+        with prof.stage("theme"):
+            # 테마 색은 워크북마다 한 번만 읽음
+            palette = ThemePalette.from_workbook(ws.parent)
+
+        def resolve_style(cell):
+            with prof.stage("styles"):
+                return self._style_spec(cell, palette)
+
+        with prof.stage("dimensions"):
+            snapshot = SheetSnapshot.for_worksheet(ws)
+        yield snapshot, 0
+        # cells 단계에는 셀 스타일 변환(styles)도 포함됨
+        with prof.stage("cells"):
+            for rows_done in snapshot.scan(ws, resolve_style, block_rows):
+                if rows_done == snapshot.rows:
+                    break
+                yield snapshot, rows_done
+        with prof.stage("sidecar_write"):
+            self._write_sidecar(path, snapshot, sheet)
+        yield snapshot, snapshot.rows
+
+    def finish_load(self, path, snapshot, sheet=None):
+        """채워진 스냅샷에서 데이터를 추출해 JSON으로 저장합니다."""
+        prof = self.profiler
+        if snapshot.extracted is None:
+            with prof.stage("merges"):
+                merges = snapshot.merge_index()
+            snapshot.extracted = self._extract_rows(
+                snapshot.iter_rows(), snapshot.cols, merges=merges
+            )
+            with prof.stage("cache_write"):
+                self._cache_put(path, snapshot, snapshot.extracted, sheet)
+        self._remember_sheet(path, sheet, snapshot)
+        with prof.stage("search_index"):
+            # 시트 검색 색인도 로딩 스레드에서 미리 만듦
+            snapshot.text_index()
+        items, header, summary = snapshot.extracted
+        json_path = self.json_path(path, sheet)
+        self._save_to_json(json_path, items, header, summary)
         return json_path, items
 
+    def show_snapshot(self, snapshot, table_widget, loaded_rows=None):
+        """스냅샷을 테이블 위젯/뷰에 표시합니다.
+
+        loaded_rows를 주면 그 행까지만 모델에 노출하고, 병합 셀과
+        행 높이는 모든 행이 채워진 뒤 apply_layout()으로 적용합니다.
+        """
+        table_widget.blockSignals(True)
+        if hasattr(table_widget, "set_snapshot"):
+            # 모델/뷰: 보이는 셀만 스냅샷에서 그때그때 그림
+            table_widget.set_snapshot(
+                snapshot, self.style_cache, loaded_rows
+            )
+        else:
+            table_widget.clear()
+            table_widget.setRowCount(snapshot.rows)
+            table_widget.setColumnCount(snapshot.cols)
+
+            # 셀 스타일 적용
+            self._apply_cell_styles(snapshot, table_widget)
+            loaded_rows = None
+
+        # 열 너비 설정
+        self._set_column_widths(snapshot, table_widget)
+        if loaded_rows is None:
+            self.apply_layout(snapshot, table_widget)
+        table_widget.blockSignals(False)
+
+    def apply_layout(self, snapshot, table_widget):
+        """병합 셀과 행 높이를 적용합니다."""
+        self._handle_merged_cells(snapshot, table_widget)
+        self._set_row_heights(snapshot, table_widget)
+
+    def _cache_tag(self, sheet):
+        # 추출 규칙(레이블 어휘)과 시트를 구분
+        tag = self.labels.fingerprint
+        if sheet is not None:
+            digest = hashlib.sha1(sheet.encode("utf-8")).hexdigest()
+            tag = f"{tag}-{digest[:8]}"
+        return tag
+
+    def _cache_get(self, path, sheet=None):
+        if self.parse_cache is None:
+            return None
+        try:
+            entry = self.parse_cache.get(path, self._cache_tag(sheet))
+        except OSError as e:
+            self.log(f"[캐시 오류] {e}")
+            return None
+        return entry
+
+    def _cache_put(self, path, snapshot, extracted, sheet=None):
+        if self.parse_cache is None:
+            return
+        try:
+            self.parse_cache.put(
+                path, snapshot, extracted, self._cache_tag(sheet)
+            )
+        except OSError as e:
+            self.log(f"[캐시 오류] {e}")
+
+    def _read_sidecar(self, path, sheet=None):
+        if not self.use_sidecar:
+            return None
+        try:
+            return read_sidecar(sidecar_path(path, sheet), source_path=path)
+        except (OSError, ValueError) as e:
+            self.log(f"[사이드카 오류] {e}")
+            return None
+
+    def _write_sidecar(self, path, snapshot, sheet=None):
+        if not self.use_sidecar:
+            return
+        try:
+            write_sidecar(
+                sidecar_path(path, sheet), snapshot, source_path=path
+            )
+        except OSError as e:
+            self.log(f"[사이드카 오류] {e}")
+
+    def json_path(self, path, sheet=None):
+        """추출 결과 JSON 경로 (활성 시트가 아니면 시트 이름을 붙임)"""
+        return sheet_file_stem(path, sheet) + ".json"
+
+    def _extract_streaming(self, path):
+        """읽기 전용 모드로 값만 스트리밍하며 데이터를 추출합니다."""
+        import openpyxl
+        from .workbook_reader import read_merged_ranges
+
+        prof = self.profiler
+        with prof.stage("openpyxl"):
+            wb = openpyxl.load_workbook(
+                path, read_only=True, data_only=True
+            )
+        try:
+            ws = wb.active
+            with prof.stage("merges"):
+                merges = MergeIndex(
+                    read_merged_ranges(path, ws.title),
+                    ws.max_row, ws.max_column
+                )
+            return self._extract_rows(
+                ws.iter_rows(values_only=True), ws.max_column, merges=merges
+            )
+        finally:
+            wb.close()
+
     def normalize_header(self, text):
-        return re.sub(r'[^a-z0-9가-힣]', '', text.lower()) if text else ''
+        return normalize_label(text)
+
+    def _row_texts(self, row):
+        return [str(v).strip() if v is not None else "" for v in row]
 
-    def _extract_header_info(self, ws, max_header_row=40):
+    def _extract_rows(self, rows, cols=None, max_header_row=40,
+                      merges=None):
+        """행 값 이터레이터를 한 번 순회하며 품목/헤더/요약을 추출합니다.
+
+        현재 행과 직전 행만 참조하므로 시트 크기와 무관하게
+        메모리 사용량이 일정합니다. merges(MergeIndex)를 주면 병합 셀은
+        기준 셀 값으로 읽고, 레이블 값은 병합 범위 다음 열에서 찾습니다.
+        """
+        items = []
+        header = {}
+        fixed = {}
+        summary = {}
         header_row = None
         header_map = {}
-        unit_krw_candidates = [
-            "unitkrw", "unitcost", "unitprice", "단가", "단가원", "단가$", "unit", "unitkrw", "unit$"
-        ]
-        quantity_candidates = ["qty", "quantity", "수량"]
-        amount_candidates = ["amount", "totalamount", "금액", "합계"]
-        description_candidates = ["description", "item", "품목", "상세내역"]
-        unit_candidates = ["unit", "단위"]
-        remark_candidates = ["remark", "비고", "note"]
-        for r in range(1, min(ws.max_row, max_header_row) + 1):
-            row_values = [
-                str(ws.cell(row=r, column=c).value).strip() if ws.cell(row=r, column=c).value is not None else ""
-                for c in range(1, ws.max_column + 1)
-            ]
-            norm_row = [self.normalize_header(cell) for cell in row_values]
-            for idx, norm_cell in enumerate(norm_row):
-                if norm_cell in description_candidates:
-                    header_map["description"] = idx
-                if norm_cell in unit_krw_candidates:
-                    header_map["unit_krw"] = idx
-                if norm_cell in quantity_candidates:
-                    header_map["quantity"] = idx
-                if norm_cell in amount_candidates:
-                    header_map["amount"] = idx
-                if norm_cell in unit_candidates:
-                    header_map["unit"] = idx
-                if norm_cell in remark_candidates:
-                    header_map["remark"] = idx
-            if len(header_map) >= 2:
-                header_row = r
-                break
-        if not header_row or not header_map:
-            print(f"[헤더 인식 실패] row_values: {row_values}")
-            print(f"[헤더 인식 실패] header_map: {header_map}")
-        return header_row, header_map
+        header_done = False
+        row_values = []
+        prev = None
+        prev_spans = None
+        r = 0
+        # 헤더 행을 찾을 때까지는 header, 이후는 items 단계
+        # (스트리밍 모드에서는 행을 읽는 시간도 포함됨)
+        prof = self.profiler
+        prof.switch("header")
+        if cols:
+            rows = self._pad_rows(rows, cols)
+        if merges:
+            rows = merges.fill_rows(rows)
+        else:
+            merges = None
+        for r, row in enumerate(rows, 1):
+            spans = merges.row_spans(r) if merges is not None else None
+            if prev is not None:
+                self._scan_labels(
+                    r - 1, prev, row, header, fixed, summary, prev_spans
+                )
+            prev, prev_spans = row, spans
+
+            if header_row is not None:
+                if spans and not self._has_own_values(r, row, spans):
+                    # 위 행의 병합 셀이 이어질 뿐인 행
+                    continue
+                item = self._row_to_item(self._row_texts(row), header_map)
+                if item is not None:
+                    items.append(item)
+            elif not header_done:
+                row_values = self._row_texts(row)
+                self._match_header(row_values, header_map, spans)
+                if len(header_map) >= 2:
+                    header_row = r
+                    header_done = True
+                elif r >= max_header_row:
+                    header_done = True
+                    self._report_header_failure(row_values, header_map)
+                if header_done:
+                    prof.switch("items")
+        if prev is not None:
+            self._scan_labels(
+                r, prev, None, header, fixed, summary, prev_spans
+            )
+        if not header_done:
+            self._report_header_failure(row_values, header_map)
+
+        prof.switch(None)
+        # 상단 고정 레이블이 헤더 레이블보다 우선
+        header.update(fixed)
+        return items, header, summary
+
+    def _pad_rows(self, rows, cols):
+        for row in rows:
+            if len(row) < cols:
+                row = tuple(row) + (None,) * (cols - len(row))
+            yield row
+
+    def _has_own_values(self, r, row, spans):
+        """병합 범위가 이어진 셀 말고 직접 값이 있는 셀이 있는지 확인합니다."""
+        for c, value in enumerate(row):
+            if value is None or value == "":
+                continue
+            span = spans.get(c)
+            if span is None or (span[2], span[0]) == (r, c):
+                return True
+        return False
+
+    def _report_header_failure(self, row_values, header_map):
+        self.log(f"[헤더 인식 실패] row_values: {row_values}")
+        self.log(f"[헤더 인식 실패] header_map: {header_map}")
+
+    def _match_header(self, row_values, header_map, spans=None):
+        """행에서 헤더 후보를 찾아 header_map에 열 인덱스를 기록합니다.
+
+        가로로 병합된 헤더는 범위의 첫 열을 사용합니다.
+        """
+        for idx, cell in enumerate(row_values):
+            if not cell:
+                continue
+            if spans and idx in spans and spans[idx][0] != idx:
+                continue
+            for field in self.labels.header_fields(normalize_label(cell)):
+                header_map[field] = idx
 
     def clean_number(self, val):
         try:
@@ -102,115 +444,180 @@ class ExcelService:
         except Exception:
             return val
 
-    def _extract_items(self, ws, header_row, header_map):
-        items = []
-        if not header_row or not header_map:
-            return items
-        for r in range(header_row + 1, ws.max_row + 1):
-            row_values = [
-                str(ws.cell(row=r, column=c).value).strip()
-                if ws.cell(row=r, column=c).value is not None else ""
-                for c in range(1, ws.max_column + 1)
-            ]
-            desc_idx = header_map.get("description")
-            if desc_idx is None or not row_values[desc_idx]:
-                continue
-            # summary 키워드 스킵
-            if any(k in row_values[desc_idx].lower() for k in ["합계", "총액", "vat", "참고", "소계", "tax", "total", "sum"]):
+    def _row_to_item(self, row_values, header_map):
+        """품목 행을 item dict로 변환합니다. 품목이 아니면 None."""
+        desc_idx = header_map.get("description")
+        if desc_idx is None or not row_values[desc_idx]:
+            return None
+        # summary 키워드 스킵
+        if self.labels.is_skip(row_values[desc_idx]):
+            return None
+        return {
+            "description": row_values[desc_idx],
+            "unit_krw": self.clean_number(row_values[header_map["unit_krw"]]) if "unit_krw" in header_map else None,
+            "quantity": self.clean_number(row_values[header_map["quantity"]]) if "quantity" in header_map else None,
+            "unit": row_values[header_map["unit"]] if "unit" in header_map else None,
+            "amount": self.clean_number(row_values[header_map["amount"]]) if "amount" in header_map else None,
+            "remark": row_values[header_map["remark"]] if "remark" in header_map else None
+        }
+
+    def _scan_labels(self, r, row, next_row, header, fixed, summary,
+                     spans=None):
+        """r행에서 헤더/요약/상단 고정 레이블 값을 찾습니다.
+
+        spans(r행의 병합 셀)가 있으면 레이블은 병합 범위의 기준 셀에서만
+        읽고, 값은 범위 바로 다음 열에서 읽습니다.
+        """
+        labels = self.labels
+        last = len(row) - 1
+        for c in range(last):
+            raw = row[c]
+            if raw is None:
                 continue
-            item = {
-                "description": row_values[desc_idx],
-                "unit_krw": self.clean_number(row_values[header_map["unit_krw"]]) if "unit_krw" in header_map else None,
-                "quantity": self.clean_number(row_values[header_map["quantity"]]) if "quantity" in header_map else None,
-                "unit": row_values[header_map["unit"]] if "unit" in header_map else None,
-                "amount": self.clean_number(row_values[header_map["amount"]]) if "amount" in header_map else None,
-                "remark": row_values[header_map["remark"]] if "remark" in header_map else None
-            }
-            items.append(item)
-        return items
-
-    def _apply_cell_styles(self, ws, table_widget):
+            value_col = c + 1
+            if spans and c in spans:
+                first, end, anchor_row = spans[c]
+                if (anchor_row, first) != (r, c):
+                    continue
+                value_col = end + 1
+            value = row[value_col] if value_col <= last else None
+            txt = str(raw).strip()
+            # 헤더 정보
+            if r <= HEADER_LABEL_MAX_ROW:
+                key = txt.rstrip(":")
+                if labels.is_header_label(key):
+                    below = (
+                        next_row[c]
+                        if next_row is not None and c < len(next_row)
+                        else None
+                    )
+                    header[key] = value or below
+            # 요약 정보
+            for fld in labels.summary_fields(txt):
+                summary[fld] = value
+
+        # 상단 고정 레이블 (D열 키, E열 값)
+        if 3 <= r <= 9 and last >= 3 and row[3]:
+            value_col = 4
+            if spans and 3 in spans:
+                first, end, anchor_row = spans[3]
+                if (anchor_row, first) != (r, 3):
+                    return
+                value_col = end + 1
+            key = str(row[3]).strip().rstrip(':')
+            fixed[key] = row[value_col] if last >= value_col else None
+
+    def _apply_cell_styles(self, snapshot, table_widget):
         """셀 스타일을 적용합니다."""
-        for r in range(1, ws.max_row + 1):
-            for c in range(1, ws.max_column + 1):
-                cell = ws.cell(r, c)
-                text = cell.value or ""
-                item = QTableWidgetItem(str(text))
-
-                # 폰트
-                f = cell.font
-                point_size = int(f.sz) if f.sz is not None else -1
-                qf = QFont(f.name, point_size)
-                qf.setBold(f.b)
-                qf.setItalic(f.i)
-                item.setFont(qf)
-
-                # 배경색
-                color = self._get_cell_color(cell)
-                if (color and 
-                    (color.red(), color.green(), color.blue()) != (255, 255, 255)):
-                    item.setBackground(color)
-
-                # 정렬
-                align = cell.alignment
-                qt_align = 0
-                if align.horizontal == 'center':
-                    qt_align |= Qt.AlignHCenter
-                elif align.horizontal == 'right':
-                    qt_align |= Qt.AlignRight
-                else:
-                    qt_align |= Qt.AlignLeft
-                if align.vertical == 'center':
-                    qt_align |= Qt.AlignVCenter
-                elif align.vertical == 'bottom':
-                    qt_align |= Qt.AlignBottom
-                else:
-                    qt_align |= Qt.AlignTop
-                item.setTextAlignment(qt_align)
-
-                # 테두리
-                b = cell.border
-                border_info = {
-                    "top": bool(b.top and b.top.style),
-                    "bottom": bool(b.bottom and b.bottom.style),
-                    "left": bool(b.left and b.left.style),
-                    "right": bool(b.right and b.right.style),
-                }
-                item.setData(Qt.UserRole, border_info)
-                table_widget.setItem(r-1, c-1, item)
-
-    def _get_cell_color(self, cell):
-        """셀의 배경색을 가져옵니다."""
+        # 스타일 id별 Qt 객체를 한 번만 만들어 셀 사이에서 공유
+        styles = {
+            sid: self.style_cache.get(spec)
+            for sid, spec in snapshot.styles.items()
+        }
+        cols = snapshot.cols
+        style_ids = snapshot.style_ids
+        for i, value in enumerate(snapshot.values):
+            r, c = divmod(i, cols)
+            style = styles[style_ids[i]]
+            item = QTableWidgetItem(str(value or ""))
+            item.setFont(style.font)
+            if style.brush is not None:
+                item.setBackground(style.brush)
+            item.setTextAlignment(style.alignment)
+            item.setData(Qt.UserRole, style.border)
+            table_widget.setItem(r, c, item)
+
+    def _style_spec(self, cell, palette=None):
+        """셀의 폰트/배경/정렬/테두리를 StyleSpec으로 변환합니다."""
+        # 폰트
+        f = cell.font
+        point_size = int(f.sz) if f.sz is not None else -1
+
+        # 배경색 (흰색은 배경 없음으로 취급)
+        background = self._get_cell_color(
+            cell, palette or self.default_palette
+        )
+        if background == 'FFFFFF':
+            background = None
+
+        # 정렬
+        align = cell.alignment
+        qt_align = 0
+        if align.horizontal == 'center':
+            qt_align |= Qt.AlignHCenter
+        elif align.horizontal == 'right':
+            qt_align |= Qt.AlignRight
+        else:
+            qt_align |= Qt.AlignLeft
+        if align.vertical == 'center':
+            qt_align |= Qt.AlignVCenter
+        elif align.vertical == 'bottom':
+            qt_align |= Qt.AlignBottom
+        else:
+            qt_align |= Qt.AlignTop
+
+        # 테두리 (변마다 스타일과 색)
+        b = cell.border
+        border = tuple(
+            self._border_edge(side, palette or self.default_palette)
+            for side in (b.top, b.bottom, b.left, b.right)
+        )
+        return StyleSpec(
+            f.name, point_size, bool(f.b), bool(f.i),
+            background, int(qt_align), border
+        )
+
+    def _border_edge(self, side, palette):
+        """테두리 한 변을 (스타일, 'RRGGBB' 또는 None)으로 변환합니다."""
+        if side is None or not side.style:
+            return None
+        color = side.color
+        hex_rgb = None
+        try:
+            if color is None:
+                pass
+            elif color.type == 'theme':
+                hex_rgb = palette.color(color.theme, color.tint or 0.0)
+            elif color.type == 'rgb' and color.rgb:
+                hex_rgb = color.rgb[-6:].upper()
+            elif color.type == 'indexed' and color.indexed is not None:
+                from openpyxl.styles.colors import COLOR_INDEX
+                if 0 <= color.indexed < len(COLOR_INDEX):
+                    hex_rgb = COLOR_INDEX[color.indexed][2:8].upper()
+            hex_to_rgb(hex_rgb)
+        except (TypeError, ValueError):
+            hex_rgb = None
+        return side.style, hex_rgb
+
+    def _get_cell_color(self, cell, palette):
+        """셀의 배경색을 'RRGGBB' 문자열로 가져옵니다."""
+        hex_rgb = self._get_fill_hex(cell, palette)
+        try:
+            hex_to_rgb(hex_rgb)
+        except (TypeError, ValueError):
+            return None
+        return hex_rgb
+
+    def _get_fill_hex(self, cell, palette):
         try:
             fill = cell.fill
             fg = fill.fgColor if hasattr(fill, 'fgColor') else None
-            
+
             if (fill.patternType in ('solid', 'gray125', 'darkGrid', 'lightGrid')
                     and fg):
                 # 1) Theme 컬러 + 틴트
                 if fg.type == 'theme':
-                    tint = getattr(fg, 'tint', 0.0)
-                    hex_rgb = self.accent_colors[1]
-                    return apply_tint(hex_rgb, tint)
+                    return palette.color(fg.theme, fg.tint or 0.0)
                 # 2) RGB 컬러
                 elif fg.type == 'rgb' and fg.rgb:
                     rgb = fg.rgb[2:] if fg.rgb.startswith('FF') else fg.rgb
-                    return QColor(
-                        int(rgb[0:2], 16),
-                        int(rgb[2:4], 16),
-                        int(rgb[4:6], 16)
-                    )
+                    return rgb[0:6].upper()
                 # 3) Indexed 컬러
                 elif fg.type == 'indexed' and fg.indexed is not None:
-                    from openpyxl.styles.colors import COLOR_INDEX
                     idx = fg.indexed
+                    from openpyxl.styles.colors import COLOR_INDEX
                     if 0 <= idx < len(COLOR_INDEX):
-                        hexcol = COLOR_INDEX[idx][2:]
-                        return QColor(
-                            int(hexcol[0:2], 16),
-                            int(hexcol[2:4], 16),
-                            int(hexcol[4:6], 16)
-                        )
+                        return COLOR_INDEX[idx][2:8].upper()
                 # 4) Gradient Fill
                 elif hasattr(fill, 'gradientType') and fill.gradientType:
                     stops = getattr(fill, 'stop', None)
@@ -219,89 +626,38 @@ class ExcelService:
                         rgb = (stops[0].color.rgb[2:]
                                if stops[0].color.rgb.startswith('FF')
                                else stops[0].color.rgb)
-                        return QColor(
-                            int(rgb[0:2], 16),
-                            int(rgb[2:4], 16),
-                            int(rgb[4:6], 16)
-                        )
+                        return rgb[0:6].upper()
         except Exception:
             pass
         return None
 
-    def _handle_merged_cells(self, ws, table_widget):
+    def _handle_merged_cells(self, snapshot, table_widget):
         """병합된 셀을 처리합니다."""
-        for merged in ws.merged_cells.ranges:
-            r0, c0 = merged.min_row-1, merged.min_col-1
-            rs = merged.max_row - merged.min_row + 1
-            cs = merged.max_col - merged.min_col + 1
-            table_widget.setSpan(r0, c0, rs, cs)
-
-    def _set_dimensions(self, ws, table_widget):
-        """열 너비와 행 높이를 설정합니다."""
-        # 열 너비
-        for idx, col_dim in ws.column_dimensions.items():
-            col = openpyxl.utils.column_index_from_string(idx) - 1
-            if col < ws.max_column and col_dim.width:
-                table_widget.setColumnWidth(col, int(col_dim.width * 7))
-        # 행 높이
-        for r, row_dim in ws.row_dimensions.items():
-            if row_dim.height is not None and r-1 < ws.max_row:
-                table_widget.setRowHeight(r-1, int(row_dim.height * 1.2))
-
-    def _save_to_json(self, json_path, ws, items):
+        for min_row, min_col, max_row, max_col in snapshot.merged_ranges:
+            table_widget.setSpan(
+                min_row - 1, min_col - 1,
+                max_row - min_row + 1, max_col - min_col + 1
+            )
+
+    def _set_column_widths(self, snapshot, table_widget):
+        """열 너비를 설정합니다."""
+        for col, width in snapshot.col_widths.items():
+            table_widget.setColumnWidth(col - 1, int(width * 7))
+
+    def _set_row_heights(self, snapshot, table_widget):
+        """행 높이를 설정합니다."""
+        for r, height in snapshot.row_heights.items():
+            table_widget.setRowHeight(r - 1, int(height * 1.2))
+
+    def _save_to_json(self, json_path, items, header, summary):
         """데이터를 JSON 파일로 저장합니다."""
         data_dict = {
             "meta": {
                 "file_name": os.path.basename(json_path)
             },
             "items": items,
-            "header": {},
-            "summary": {}
+            "header": header,
+            "summary": summary
         }
-
-        # 헤더 정보 추출
-        header_labels = [
-            "DATE", "QUOTATION #", "Payment date", "SHIP TO",
-            "발급일", "공급자", "등록번호", "상호", "대표이사", "사업자 주소"
-        ]
-        for r in range(1, 16):
-            for c in range(1, ws.max_column):
-                raw = ws.cell(row=r, column=c).value
-                if raw is None:
-                    continue
-                key = str(raw).strip().rstrip(":")
-                if key in header_labels:
-                    val = ws.cell(row=r, column=c+1).value \
-                        or ws.cell(row=r+1, column=c).value
-                    data_dict["header"][key] = val
-
-        # 요약 정보 추출
-        summary_labels = {
-            "subtotal": ["Sub total", "소계"],
-            "tax_rate": ["Tax rate", "세율"],
-            "tax_due": ["Tax due", "세금", "Tax due"],
-            "other": ["Other", "기타"],
-            "total_due": ["TOTAL Due", "총액", "합계", "TOTAL"]
-        }
-        for r in range(1, ws.max_row + 1):
-            for c in range(1, ws.max_column):
-                raw = ws.cell(row=r, column=c).value
-                if raw is None:
-                    continue
-                txt = str(raw).strip()
-                for fld, keys in summary_labels.items():
-                    if any(k in txt for k in keys):
-                        data_dict["summary"][fld] = (
-                            ws.cell(row=r, column=c+1).value
-                        )
-
-        # 상단 고정 레이블 추출
-        for r in range(3, 10):
-            raw_key = ws.cell(row=r, column=4).value
-            if raw_key:
-                key = str(raw_key).strip().rstrip(':')
-                data_dict["header"][key] = ws.cell(row=r, column=5).value
-
-        # JSON 파일 저장
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(data_dict, f, ensure_ascii=False, indent=2, default=str) 
\ No newline at end of file
+        with self.profiler.stage("json"):
+            atomic_write_json(json_path, data_dict, indent=2, default=str)
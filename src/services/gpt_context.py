@@ -0,0 +1,210 @@
+import json
+import math
+import re
+import threading
+
+# 영문/숫자 단어와 한글 단어
+_WORD = re.compile(r'[a-z0-9]+|[가-힣]+')
+
+
+def compact_json(data):
+    """공백 없이 직렬화한 JSON (들여쓰기 토큰을 아낌)"""
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+
+
+class TokenCounter:
+    """모델 토큰 수 계산기
+
+    tiktoken이 설치되어 있으면 모델의 인코딩으로 세고, 없으면 ASCII는
+    4글자당 1토큰, 그 외(한글 등)는 글자당 1토큰으로 어림합니다.
+    인코딩 파일은 처음에 내려받을 수 있으므로 background=True이면 별도
+    스레드에서 불러오고, 준비될 때까지는 어림값을 씁니다.
+    """
+
+    def __init__(self, model=None, background=False):
+        self.model = model
+        self._encoding = None
+        if background:
+            threading.Thread(target=self._load, daemon=True).start()
+        else:
+            self._load()
+
+    def _load(self):
+        try:
+            import tiktoken
+            try:
+                encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # 미설치이거나 인코딩 파일을 받을 수 없으면 어림값 사용
+            return
+        self._encoding = encoding
+
+    @property
+    def exact(self):
+        return self._encoding is not None
+
+    def count(self, text):
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        ascii_chars = sum(1 for ch in text if ch < "\x80")
+        return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def terms(text):
+    """검색어/품목명의 색인 단어 (한글 단어는 두 글자 조각도 포함)
+
+    "조명은", "조명장비"처럼 조사나 복합어가 붙어도 겹치는 조각으로
+    찾을 수 있게 합니다.
+    """
+    result = []
+    for word in _WORD.findall(str(text).lower()):
+        result.append(word)
+        if len(word) > 2 and "가" <= word[0] <= "힣":
+            result.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return result
+
+
+class ItemIndex:
+    """품목 설명/비고에 대한 BM25 색인"""
+
+    def __init__(self, items, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        # 단어 → [(품목 번호, 빈도)]
+        self._postings = {}
+        self._lengths = []
+        for i, item in enumerate(items):
+            text = " ".join(
+                str(item.get(key) or "")
+                for key in ("description", "remark", "unit")
+            )
+            counts = {}
+            for term in terms(text):
+                counts[term] = counts.get(term, 0) + 1
+            for term, tf in counts.items():
+                self._postings.setdefault(term, []).append((i, tf))
+            self._lengths.append(sum(counts.values()))
+        self._avg_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0
+        )
+
+    def rank(self, query):
+        """질문과 관련 있는 품목 번호를 점수 순으로 반환합니다."""
+        n = len(self._lengths)
+        scores = {}
+        for term in set(terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5)
+                           / (len(postings) + 0.5))
+            for i, tf in postings:
+                norm = 1 - self.b + self.b * (
+                    self._lengths[i] / self._avg_length
+                )
+                scores[i] = scores.get(i, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + self.k1 * norm
+                )
+        return sorted(scores, key=lambda i: (-scores[i], i))
+
+
+class InvoiceContext:
+    """견적서 JSON을 토큰 예산 안의 GPT 프롬프트 문맥으로 만듭니다.
+
+    전체가 예산 안에 들어가면 그대로 보내고, 넘으면 헤더/요약과 질문에
+    관련된 품목만 (원래 순서대로) 보냅니다. 품목 색인과 품목별 토큰
+    수는 처음 한 번만 계산합니다.
+    """
+
+    def __init__(self, data, counter):
+        self.data = data
+        self.counter = counter
+        # 만들 때 정확한 토큰 수를 셌는지 (인코딩 준비 전이면 어림값)
+        self.exact = counter.exact
+        self.items = data.get("items") or []
+        self._full = compact_json(data)
+        self._full_tokens = counter.count(self._full)
+        self._index = None
+        self._item_tokens = None
+        self._min_item_tokens = 0
+
+    def build(self, question, max_tokens):
+        """(문맥 JSON 문자열, 토큰 수, 포함한 품목 수)를 반환합니다.
+
+        결과는 항상 max_tokens 이하입니다. 헤더/요약만으로 예산을 넘으면
+        헤더 항목부터 빼고 "truncated": true를 붙이며, 그래도 넘으면 빈
+        문자열을 반환합니다.
+        """
+        if self._full_tokens <= max_tokens:
+            return self._full, self._full_tokens, len(self.items)
+        if self._index is None:
+            self._index = ItemIndex(self.items)
+            # 품목 사이 쉼표 1토큰 포함
+            self._item_tokens = [
+                self.counter.count(compact_json(item)) + 1
+                for item in self.items
+            ]
+            self._min_item_tokens = min(self._item_tokens, default=0)
+        base = self._base(max_tokens)
+        if base is None:
+            return "", 0, 0
+        used = self.counter.count(compact_json(base))
+        chosen = []
+        ranked = self._index.rank(question)
+        # 관련 품목 다음에는 앞쪽 품목부터 예산이 남는 만큼 채움
+        seen = set(ranked)
+        ranked += [i for i in range(len(self.items)) if i not in seen]
+        for i in ranked:
+            if used + self._min_item_tokens > max_tokens:
+                break
+            cost = self._item_tokens[i]
+            if used + cost > max_tokens:
+                continue
+            chosen.append(i)
+            used += cost
+        # 품목별 토큰 수의 합과 실제 토큰 수가 조금 다를 수 있으므로
+        # 넘으면 관련도가 낮은 품목부터 뺌
+        while True:
+            base["items"] = [self.items[i] for i in sorted(chosen)]
+            text = compact_json(base)
+            tokens = self.counter.count(text)
+            if tokens <= max_tokens or not chosen:
+                return text, tokens, len(chosen)
+            chosen.pop()
+
+    def _base(self, max_tokens):
+        """품목을 뺀 문맥 (예산을 넘으면 메타/헤더, 요약 순으로 항목을 뺌)
+
+        빈 헤더/요약으로도 예산을 넘으면 None을 반환합니다.
+        """
+        base = {k: v for k, v in self.data.items() if k != "items"}
+        base["items_total"] = len(self.items)
+        base["items"] = []
+
+        def fits():
+            return self.counter.count(compact_json(base)) <= max_tokens
+
+        if fits():
+            return base
+        base["truncated"] = True
+        # 합계가 담긴 요약은 마지막까지 남김
+        keys = [
+            k for k in base if k not in ("items_total", "items", "truncated")
+        ]
+        keys.sort(key=lambda k: k != "summary")
+        for key in reversed(keys):
+            value = base[key]
+            if isinstance(value, dict):
+                value = base[key] = dict(value)
+                for field in reversed(list(value)):
+                    del value[field]
+                    if fits():
+                        return base
+            del base[key]
+            if fits():
+                return base
+        return None
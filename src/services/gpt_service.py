@@ -1,24 +1,284 @@
-import requests
+import email.utils
+import json
+import random
+import threading
+import time
 
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
 
-def ask_gpt_api(messages, api_key, model):
-    """GPT API를 호출하여 응답을 받아옵니다."""
+# 다시 시도할 HTTP 상태 (요청 한도 초과, 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class GPTError(Exception):
+    """다시 시도해도 GPT 응답을 받지 못했을 때 발생합니다."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def retry_after_seconds(value, now=None):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 기다릴 초로 바꿉니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+class GPTService:
+    """Chat Completions API 클라이언트
+
+    HTTP 세션을 유지해 연결(TLS 핸드셰이크 포함)을 질문마다 다시 맺지
+    않습니다. 429/5xx 응답과 연결 오류는 지수 백오프(지터 포함)로 다시
+    시도하며, Retry-After 헤더가 있으면 그 시간을 따릅니다 (max_retry_after
+    초보다 길면 기다리지 않고 GPTError). 재시도 알림은 log로 보내며,
+    chat/stream_chat의 log 인자로 요청마다 바꿀 수 있습니다.
+    여러 스레드에서 함께 써도 됩니다.
+    """
+
+    def __init__(self, api_key, model, base_url=DEFAULT_BASE_URL,
+                 connect_timeout=5.0, read_timeout=60.0, max_retries=4,
+                 backoff=1.0, max_backoff=30.0, max_retry_after=60.0,
+                 pool_size=4, log=print):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.pool_size = pool_size
+        self.log = log
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """연결 풀을 가진 requests.Session (처음 쓸 때 만듦)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._make_session()
+        return self._session
+
+    def _make_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # 재시도는 _post에서 직접 처리 (Retry-After, 지터)
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size, max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        })
+        return session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def chat(self, messages, max_tokens=2048, temperature=0.7, log=None):
+        """메시지를 보내고 답변 문자열을 반환합니다 (실패 시 GPTError)."""
+        resp = self._post("/chat/completions", {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }, log=log)
+        try:
+            return resp.json()["choices"][0]["message"]["content"].strip()
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise GPTError(f"응답 형식 오류: {e}") from e
+
+    def stream_chat(self, messages, max_tokens=2048, temperature=0.7,
+                    log=None):
+        """답변을 생성되는 대로 조각 단위로 받는 ChatStream을 반환합니다."""
+        return ChatStream(self, {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }, log=log)
+
+    def _post(self, path, payload, stream=False, cancel=None, log=None):
+        """재시도하며 POST 요청을 보내고 성공한 응답을 반환합니다.
+
+        cancel(threading.Event)이 설정되면 재시도 대기를 멈추고
+        GPTError를 발생시킵니다. 재시도 알림은 log(없으면 self.log)로
+        보냅니다.
+        """
+        import requests
+
+        log = log or self.log
+
+        url = self.base_url + path
+        attempt = 0
+        while True:
+            try:
+                resp = self.session.post(
+                    url, json=payload, timeout=self.timeout, stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise GPTError(f"연결 실패: {e}") from e
+                delay = self._backoff_delay(attempt)
+            else:
+                if resp.status_code < 400:
+                    return resp
+                message = self._error_message(resp)
+                if (resp.status_code not in RETRY_STATUS
+                        or attempt >= self.max_retries):
+                    resp.close()
+                    raise GPTError(message, resp.status_code)
+                delay = retry_after_seconds(resp.headers.get("Retry-After"))
+                resp.close()
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                elif delay > self.max_retry_after:
+                    raise GPTError(
+                        f"{message} ({delay:.0f}초 후 다시 시도하세요)",
+                        resp.status_code
+                    )
+            log(
+                f"[GPT 재시도] {attempt + 1}/{self.max_retries}, "
+                f"{delay:.1f}초 후"
+            )
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                raise GPTError("취소되었습니다")
+            attempt += 1
+
+    def _backoff_delay(self, attempt):
+        # 지수 백오프 상한 안에서 무작위로 기다림 (동시 재시도 분산)
+        cap = min(self.max_backoff, self.backoff * (2 ** attempt))
+        return random.uniform(cap / 2, cap)
+
+    def _error_message(self, resp):
+        try:
+            detail = resp.json()["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            detail = resp.text[:200]
+        return f"HTTP {resp.status_code}: {detail}"
+
+
+class ChatStream:
+    """스트리밍 답변 (SSE data: 이벤트)을 조각 문자열로 순회합니다.
+
+    close()는 다른 스레드에서 불러도 되며, 재시도 대기나 응답 읽기를
+    바로 끊습니다. 닫힌 뒤에는 오류 없이 순회가 끝납니다. 재시도는 첫
+    응답을 받기 전까지만 합니다.
+    """
+
+    def __init__(self, service, payload, log=None):
+        self.service = service
+        self.payload = payload
+        self.log = log
+        self._closed = threading.Event()
+        self._resp = None
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def close(self):
+        self._closed.set()
+        resp = self._resp
+        if resp is not None:
+            resp.close()
+
+    def __iter__(self):
+        try:
+            resp = self.service._post(
+                "/chat/completions", self.payload, stream=True,
+                cancel=self._closed, log=self.log
+            )
+        except GPTError:
+            if self.closed:
+                return
+            raise
+        self._resp = resp
+        try:
+            if self.closed:
+                return
+            for line in resp.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    # 끝까지 읽어야 연결을 풀에 돌려줌
+                    continue
+                try:
+                    choice = json.loads(data)["choices"][0]
+                except (ValueError, KeyError, IndexError, TypeError) as e:
+                    raise GPTError(f"응답 형식 오류: {e}") from e
+                text = (choice.get("delta") or {}).get("content")
+                if text:
+                    yield text
+        except GPTError:
+            raise
+        except Exception as e:
+            # 다른 스레드에서 연결을 닫으면 읽기 중 여러 종류의 오류가 남
+            if self.closed:
+                return
+            raise GPTError(f"응답 수신 실패: {e}") from e
+        finally:
+            resp.close()
+
+
+# ask_gpt_api 호출 사이에 연결을 재사용하기 위한 (키, 모델)별 클라이언트
+_services = {}
+_services_lock = threading.Lock()
+
+
+def ask_gpt_api(messages, api_key, model, cache=None, log=print):
+    """GPT API를 호출하여 응답을 받아옵니다.
+
+    cache(ResponseCache)를 주면 같은 질문은 저장해 둔 답변을 씁니다.
+    캐시를 읽거나 쓰지 못하면 log로 알리고 캐시 없이 진행합니다.
+    """
     if not api_key:
         return "[OpenAI API 키를 .env에 입력하세요]"
-    url = "https://api.openai.com/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    data = {
-        "model": model,
-        "messages": messages,
-        "max_tokens": 2048,
-        "temperature": 0.7
-    }
+    if cache is not None:
+        try:
+            answer = cache.get(model, messages)
+        except OSError as e:
+            log(f"[GPT 캐시 오류] {e}")
+            answer = None
+        if answer is not None:
+            return answer
+    with _services_lock:
+        service = _services.get((api_key, model))
+        if service is None:
+            service = _services[(api_key, model)] = GPTService(
+                api_key, model
+            )
     try:
-        resp = requests.post(url, headers=headers, json=data, timeout=30)
-        resp.raise_for_status()
-        return resp.json()["choices"][0]["message"]["content"].strip()
-    except Exception as e:
-        return f"[GPT 호출 오류] {e}"
\ No newline at end of file
+        answer = service.chat(messages, log=log)
+    except GPTError as e:
+        return f"[GPT 호출 오류] {e}"
+    if cache is not None:
+        try:
+            cache.put(model, messages, answer)
+        except OSError as e:
+            log(f"[GPT 캐시 오류] {e}")
+    return answer
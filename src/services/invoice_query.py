@@ -0,0 +1,329 @@
+import bisect
+import re
+
+# 설명/판단/검증이 필요한 질문은 GPT에 넘김
+_OPEN_ENDED = re.compile(
+    r'왜|이유|설명|요약|비교|추천|분석|번역|어떻게|확인|맞|검증|정확|'
+    r'why|explain|compare|summar|recommend|translate|how to|should|'
+    r'correct|right|check|verify|valid'
+)
+
+# 금액: 1,000,000 / 100만 / 1.5억 / 1m / 500k (뒤에 원/won/krw 허용)
+_AMOUNT = re.compile(
+    r'(\d[\d,]*(?:\.\d+)?)\s*(억|천만|백만|만|천|m\b|k\b)?\s*(?:원|won|krw)?'
+)
+_UNITS = {
+    "억": 100000000, "천만": 10000000, "백만": 1000000, "만": 10000,
+    "천": 1000, "m": 1000000, "k": 1000,
+}
+
+# 답할 수 있는 질문 유형 (유형마다 질문에서 찾는 표현)
+_INTENTS = {
+    "over": re.compile(
+        r'이상|초과|넘는|넘은|넘어|보다\s*(큰|비싼|많은)|'
+        r'\b(over|above|more than|greater than|at least)\b|>'
+    ),
+    "under": re.compile(
+        r'이하|미만|보다\s*(작은|싼|적은)|'
+        r'\b(under|below|less than|cheaper than|at most)\b|<'
+    ),
+    "max": re.compile(
+        r'(가장|제일)\s*(비싼|높은|큰)|(최고|최대)\s*(단가|가격)|'
+        r'\b(most expensive|highest|priciest|max(imum)?)\b'
+    ),
+    "min": re.compile(
+        r'(가장|제일)\s*(싼|저렴한|낮은|작은)|(최저|최소)\s*(단가|가격)|'
+        r'\b(cheapest|lowest|min(imum)?)\b'
+    ),
+    # "품목 수량"은 품목 수가 아님
+    "count": re.compile(
+        r'(품목|항목)\s*(수|개수)(?!량)|몇\s*(개|건|가지)|'
+        r'\b(how many|number of items|item count|count)\b'
+    ),
+    "tax": re.compile(r'세금|세액|부가세|\b(vat|tax)\b'),
+    "subtotal": re.compile(r'소계|공급가액?|\b(subtotal|sub total)\b'),
+    "total": re.compile(
+        r'총액|총\s*금액|합계|총합|전체\s*금액|총\s*얼마|'
+        r'\bgrand total\b|(?<!sub)(?<!sub )\btotal\b|\bsum\b'
+    ),
+}
+# 유형마다 질문에 함께 나와도 되는 단어 (무엇을 비교/합산하는지)
+_AMOUNT_WORDS = re.compile(r'금액|\b(amounts?|costs?|costing|worth)\b')
+_PRICE_WORDS = re.compile(r'단가|가격|\b(unit|prices?)\b')
+_INTENT_WORDS = {
+    "over": _AMOUNT_WORDS, "under": _AMOUNT_WORDS,
+    "max": _PRICE_WORDS, "min": _PRICE_WORDS,
+    "tax": _AMOUNT_WORDS, "subtotal": _AMOUNT_WORDS, "total": _AMOUNT_WORDS,
+}
+_LIST = re.compile(
+    r'목록|리스트|알려|보여|뭐|무엇|어떤|\b(list|show|which|what)\b'
+)
+
+# 유형/금액/카테고리 표현을 지운 뒤 남아도 되는 말. 이 밖의 단어(수량,
+# 세율, 품목 이름, 순번 등)가 남으면 답하지 않고 GPT에 넘김
+_KO_FILLERS = (
+    "품목", "항목", "제품", "물품", "카테고리", "분류", "견적서", "견적",
+    "전체", "모두", "모든", "총", "얼마", "알려", "보여", "주세요", "해줘",
+    "있어", "있나", "뭐", "무엇", "어떤", "목록", "리스트", "입니까",
+    "에서", "것", "거", "좀", "개", "원",
+)
+_KO_PARTICLES = set("은는이가을를의에서야요도만과와로으인지나니까죠줘다들중")
+_EN_FILLERS = frozenset((
+    "what", "s", "is", "are", "the", "a", "an", "of", "in", "on", "for",
+    "this", "that", "these", "those", "invoice", "quote", "quotation",
+    "item", "items", "product", "products", "line", "lines", "entry",
+    "entries", "there", "do", "does", "we", "i", "have", "has", "list",
+    "show", "me", "please", "all", "which", "with", "tell", "give", "how",
+    "much", "category", "our", "my", "to", "from", "can", "you", "get",
+    "find", "won", "krw",
+))
+_TOKEN = re.compile(r'[a-z]+|[가-힣]+|\d+')
+
+
+def _is_filler(token):
+    if token in _EN_FILLERS:
+        return True
+    if not "가" <= token[0] <= "힣":
+        return False
+    for word in _KO_FILLERS:
+        if token.startswith(word):
+            token = token[len(word):]
+            break
+    return all(ch in _KO_PARTICLES for ch in token)
+
+
+# 목록 답변에 보여줄 최대 품목 수
+MAX_LISTED = 20
+
+
+def _won(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if value.is_integer():
+        return f"{int(value):,}원"
+    return f"{value:,.2f}원"
+
+
+def _number(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_amount(question):
+    """질문 속 금액(원)을 반환합니다. 없으면 None."""
+    for m in _AMOUNT.finditer(question):
+        number, unit = m.group(1), m.group(2)
+        try:
+            value = float(number.replace(",", ""))
+        except ValueError:
+            continue
+        return value * _UNITS.get(unit, 1)
+    return None
+
+
+class InvoiceQueryEngine:
+    """추출한 견적서 데이터로 간단한 집계 질문에 바로 답합니다.
+
+    합계/소계/세금, 품목 수, 최고·최저 단가, 금액 기준 품목 목록,
+    카테고리별 품목/합계처럼 정해진 유형(한국어/영어)만 답하고,
+    알아듣지 못한 질문은 None을 반환해 GPT에 넘기게 합니다.
+    카테고리는 금액/수량/단가가 모두 비어 있는 품목 행으로 구분합니다.
+    금액 정렬과 최고·최저 단가는 처음에 한 번만 계산해 두므로 품목이
+    많아도 질문마다 전체를 훑지 않습니다.
+    """
+
+    def __init__(self, data):
+        self.summary = data.get("summary") or {}
+        self.items = []
+        # 카테고리 이름 → 품목 목록 (시트 순서)
+        self.categories = {}
+        category = None
+        for item in data.get("items") or []:
+            desc = str(item.get("description") or "").strip()
+            if not desc:
+                continue
+            values = [
+                _number(item.get(key))
+                for key in ("amount", "unit_krw", "quantity")
+            ]
+            if all(v is None for v in values):
+                category = desc
+                self.categories.setdefault(category, [])
+                continue
+            self.items.append(item)
+            if category is not None:
+                self.categories[category].append(item)
+        # 금액순 (금액, 품목 번호), 금액이 없는 품목은 제외
+        self._by_amount = sorted(
+            (amount, i) for i, amount in (
+                (i, _number(item.get("amount")))
+                for i, item in enumerate(self.items)
+            ) if amount is not None
+        )
+        self._amounts = [amount for amount, _ in self._by_amount]
+        priced = [
+            (_number(item.get("unit_krw")), i)
+            for i, item in enumerate(self.items)
+            if _number(item.get("unit_krw")) is not None
+        ]
+        self._cheapest = self.items[min(priced)[1]] if priced else None
+        self._priciest = (
+            self.items[max(priced, key=lambda p: (p[0], -p[1]))[1]]
+            if priced else None
+        )
+        self._total_amount = sum(self._amounts)
+        self._category_keys = sorted(
+            ((self._key(name), name) for name in self.categories
+             if len(self._key(name)) >= 2),
+            key=lambda pair: -len(pair[0])
+        )
+        # 질문에서 카테고리 이름을 지우는 패턴 (띄어쓰기 무시)
+        self._category_patterns = {
+            name: re.compile(r'\s*'.join(map(re.escape, key)))
+            for key, name in self._category_keys
+        }
+
+    def _key(self, text):
+        return re.sub(r'\s+', '', str(text).lower())
+
+    def answer(self, question):
+        """답할 수 있으면 답변 문자열, 아니면 None
+
+        질문의 유형이 하나로 정해지고, 유형/금액/카테고리 표현을 뺀
+        나머지가 조사나 "품목", "알려줘" 같은 말뿐일 때만 답합니다.
+        """
+        q = question.lower().strip()
+        if not q or not self.items or _OPEN_ENDED.search(q):
+            return None
+        rest = q
+        category = self._find_category(q)
+        if category is not None:
+            rest = self._category_patterns[category].sub(" ", rest)
+        intents = [
+            name for name, pattern in _INTENTS.items()
+            if pattern.search(rest)
+        ]
+        amount = None
+        m = _AMOUNT.search(rest)
+        if m is not None:
+            amount = parse_amount(m.group(0))
+            rest = rest[:m.start()] + " " + rest[m.end():]
+        for name in intents:
+            rest = _INTENTS[name].sub(" ", rest)
+            if name in _INTENT_WORDS:
+                rest = _INTENT_WORDS[name].sub(" ", rest)
+        listing = _LIST.search(rest) is not None
+        rest = _LIST.sub(" ", rest)
+        if not all(_is_filler(t) for t in _TOKEN.findall(rest)):
+            return None
+
+        if category is not None:
+            if amount is not None or len(intents) > 1:
+                return None
+            return self._answer_category(
+                q, category, intents[0] if intents else None, listing
+            )
+        if len(intents) != 1:
+            return None
+        intent = intents[0]
+        if (amount is not None) != (intent in ("over", "under")):
+            return None
+        if intent == "over":
+            start = bisect.bisect_left(self._amounts, amount)
+            return self._list_ranked(
+                start, len(self._amounts), True,
+                f"금액 {_won(amount)} 이상 품목"
+            )
+        if intent == "under":
+            end = bisect.bisect_right(self._amounts, amount)
+            return self._list_ranked(
+                0, end, False, f"금액 {_won(amount)} 이하 품목"
+            )
+        if intent == "max":
+            return self._extreme_price(self._priciest, "가장 비싼")
+        if intent == "min":
+            return self._extreme_price(self._cheapest, "가장 싼")
+        if intent == "count":
+            return f"품목은 모두 {len(self.items)}개입니다."
+        if intent == "tax":
+            return self._summary_value("tax_due", "세금은")
+        if intent == "subtotal":
+            return self._summary_value("subtotal", "소계는")
+        return self._total()
+
+    def _find_category(self, q):
+        key = self._key(q)
+        for name_key, name in self._category_keys:
+            if name_key in key:
+                return name
+        return None
+
+    def _answer_category(self, q, category, intent, listing):
+        """카테고리 품목 수/금액 합계/목록 (그 밖의 유형은 None)"""
+        items = self.categories[category]
+        if intent == "count":
+            return f"'{category}' 품목은 {len(items)}개입니다."
+        if intent == "total":
+            total = sum(_number(i.get("amount")) or 0 for i in items)
+            return (
+                f"'{category}' 품목 {len(items)}개의 금액 합계는 "
+                f"{_won(total)}입니다."
+            )
+        if intent is None and (listing or "품목" in q or "item" in q):
+            return self._list_items(items, f"'{category}' 품목")
+        return None
+
+    def _list_ranked(self, start, end, descending, title):
+        """금액순 목록의 [start, end) 구간에서 앞쪽 품목만 보여줍니다."""
+        if start >= end:
+            return f"{title}이 없습니다."
+        if descending:
+            shown = self._by_amount[max(start, end - MAX_LISTED):end][::-1]
+            title += " (금액 큰 순)"
+        else:
+            shown = self._by_amount[start:min(end, start + MAX_LISTED)]
+            title += " (금액 작은 순)"
+        items = [self.items[i] for _, i in shown]
+        return self._list_items(items, title, end - start)
+
+    def _list_items(self, items, title, count=None):
+        if not items:
+            return f"{title}이 없습니다."
+        count = len(items) if count is None else count
+        lines = [f"{title} {count}개:"]
+        for item in items[:MAX_LISTED]:
+            line = f"- {item.get('description')}"
+            if _number(item.get("amount")) is not None:
+                line += f": {_won(item.get('amount'))}"
+            lines.append(line)
+        if count > MAX_LISTED:
+            lines.append(f"... 외 {count - MAX_LISTED}개")
+        return "\n".join(lines)
+
+    def _extreme_price(self, item, label):
+        if item is None:
+            return None
+        return (
+            f"단가가 {label} 품목은 '{item.get('description')}' "
+            f"({_won(item.get('unit_krw'))})입니다."
+        )
+
+    def _summary_value(self, key, label):
+        value = self.summary.get(key)
+        if value is None:
+            return None
+        return f"{label} {_won(value)}입니다."
+
+    def _total(self):
+        if self.summary.get("total_due") is not None:
+            return f"총액은 {_won(self.summary['total_due'])}입니다."
+        return (
+            f"품목 금액 합계는 {_won(self._total_amount)}입니다 "
+            "(요약 총액 없음)."
+        )
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import re
+
+
+def normalize_label(text):
+    """소문자로 바꾸고 영문/숫자/한글 외 문자를 제거합니다."""
+    return re.sub(r'[^a-z0-9가-힣]', '', text.lower()) if text else ''
+
+
+def _compile_any(keys):
+    """keys 중 하나라도 포함되는지 한 번에 찾는 정규식"""
+    keys = sorted(set(k for k in keys if k), key=len, reverse=True)
+    if not keys:
+        return None
+    return re.compile("|".join(re.escape(k) for k in keys))
+
+
+class LabelMatcher:
+    """헤더/요약/제외 키워드 어휘를 한 번만 색인해 두는 매처
+
+    열 헤더와 상단 헤더 레이블은 dict 조회로, 요약 레이블과 제외
+    키워드는 미리 컴파일한 정규식 한 번으로 찾으므로 어휘가 늘어도
+    셀마다 드는 비용은 거의 같습니다.
+    """
+
+    def __init__(self, vocabulary):
+        # 어휘가 바뀌면 달라지는 값 (파싱 캐시 키에 사용)
+        self.fingerprint = hashlib.sha1(
+            json.dumps(vocabulary, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+        # 정규화된 헤더 텍스트 → 필드 목록
+        self._columns = {}
+        for field, keys in vocabulary["header_columns"].items():
+            for key in keys:
+                fields = self._columns.setdefault(normalize_label(key), [])
+                if field not in fields:
+                    fields.append(field)
+        self._header_labels = frozenset(vocabulary["header_labels"])
+
+        self._summary = [
+            (field, tuple(keys))
+            for field, keys in vocabulary["summary_labels"].items()
+        ]
+        self._summary_re = _compile_any(
+            k for _, keys in self._summary for k in keys
+        )
+        self._skip_re = _compile_any(
+            k.lower() for k in vocabulary["item_skip_keywords"]
+        )
+
+    def header_fields(self, norm_text):
+        """정규화된 셀 텍스트에 해당하는 열 헤더 필드 목록"""
+        return self._columns.get(norm_text, ())
+
+    def is_header_label(self, key):
+        return key in self._header_labels
+
+    def summary_fields(self, text):
+        """텍스트에 포함된 요약 레이블의 필드 목록 (어휘 순서)"""
+        if self._summary_re is None or not self._summary_re.search(text):
+            return ()
+        # 드물게 일치한 셀만 필드별로 확인 (겹치는 레이블 처리)
+        return [
+            field for field, keys in self._summary
+            if any(k in text for k in keys)
+        ]
+
+    def is_skip(self, text):
+        """요약 행처럼 품목에서 제외할 텍스트인지 확인합니다."""
+        return (
+            self._skip_re is not None
+            and self._skip_re.search(text.lower()) is not None
+        )
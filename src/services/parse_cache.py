@@ -0,0 +1,100 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+from .sheet_snapshot import SheetSnapshot
+
+
+class ParseCache:
+    """엑셀 파싱 결과를 파일 내용 해시로 저장하는 디스크 캐시
+
+    항목은 {"snapshot": SheetSnapshot 또는 None,
+    "extracted": (items, header, summary)} 형태이며,
+    tag는 추출 규칙(레이블 어휘 등)을 구분하는 문자열로 키에 포함됩니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터
+    지웁니다.
+    """
+
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # (경로, 수정 시각, 크기) → 내용 해시 (같은 파일 재해시 방지)
+        self._hashes = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _key(self, path, tag):
+        st = os.stat(path)
+        stamp = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        digest = self._hashes.get(stamp)
+        if digest is None:
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+            digest = self._hashes[stamp] = h.hexdigest()
+        key = f"{digest}-v{SheetSnapshot.FORMAT_VERSION}"
+        return f"{key}-{tag}" if tag else key
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ".pkl")
+
+    def get(self, path, tag=""):
+        """캐시된 항목을 반환합니다. 없거나 읽을 수 없으면 None."""
+        entry_path = self._entry_path(self._key(path, tag))
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(entry_path)
+            return None
+        # 최근 사용 시각 갱신 (LRU)
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, path, snapshot, extracted, tag=""):
+        """파싱 결과를 저장하고 크기 제한을 넘으면 오래된 항목을 지웁니다."""
+        entry_path = self._entry_path(self._key(path, tag))
+        entry = {"snapshot": snapshot, "extracted": extracted}
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".tmp-", suffix=".pkl", dir=self.cache_dir
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for e in it:
+                if not e.name.endswith(".pkl") or e.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = e.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+                total += st.st_size
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(entry_path)
+            total -= size
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
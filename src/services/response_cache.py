@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from ..utils.file_utils import atomic_write_json
+
+
+def normalize_messages(messages):
+    """캐시 키용 메시지 정규화 (앞뒤 공백 제거, 연속 공백을 하나로)"""
+    return [
+        [m.get("role", ""), " ".join(str(m.get("content", "")).split())]
+        for m in messages
+    ]
+
+
+class ResponseCache:
+    """GPT 답변을 (모델, 정규화한 메시지) 해시로 저장하는 디스크 캐시
+
+    메시지에 견적서 JSON이 들어 있으므로 견적서 내용이 바뀌면 키도
+    바뀝니다. 항목은 ttl초가 지나면 만료되고, 전체 크기가 max_bytes를
+    넘으면 가장 오래 쓰지 않은 항목부터 지웁니다 (ParseCache와 같이
+    파일 수정 시각을 최근 사용 시각으로 씀). 적중/실패 횟수를 셉니다.
+    """
+
+    def __init__(self, cache_dir, max_bytes=32 * 1024 * 1024,
+                 ttl=7 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def key(self, model, messages):
+        payload = json.dumps(
+            [model, normalize_messages(messages)], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, model, messages):
+        """저장된 답변을 반환합니다. 없거나 만료되었으면 None."""
+        entry_path = self._entry_path(self.key(model, messages))
+        answer = None
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["created"] <= self.ttl:
+                answer = entry["answer"]
+            else:
+                self._remove(entry_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            self._remove(entry_path)
+        with self._lock:
+            if answer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if answer is not None:
+            # 최근 사용 시각 갱신 (LRU)
+            try:
+                os.utime(entry_path)
+            except OSError:
+                pass
+        return answer
+
+    def put(self, model, messages, answer):
+        """답변을 저장하고 크기 제한을 넘으면 오래된 항목을 지웁니다."""
+        entry_path = self._entry_path(self.key(model, messages))
+        atomic_write_json(entry_path, {
+            "created": time.time(),
+            "model": model,
+            "answer": answer,
+        })
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        now = time.time()
+        with os.scandir(self.cache_dir) as it:
+            for e in it:
+                if not e.name.endswith(".json") or e.name.startswith("."):
+                    continue
+                try:
+                    st = e.stat()
+                except FileNotFoundError:
+                    continue
+                # 만료 후 한 번도 쓰지 않은 항목은 크기와 무관하게 지움
+                if now - st.st_mtime > self.ttl:
+                    self._remove(e.path)
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+                total += st.st_size
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(entry_path)
+            total -= size
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
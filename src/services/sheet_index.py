@@ -0,0 +1,97 @@
+import re
+from array import array
+
+from .label_matcher import normalize_label
+
+# 영문/숫자 단어와 한글 단어
+_WORD = re.compile(r'[a-z0-9]+|[가-힣]+')
+
+
+def tokenize(text):
+    """셀 텍스트의 검색 토큰 (단어 + normalize_label로 정규화한 전체)"""
+    tokens = set(_WORD.findall(text.lower()))
+    norm = normalize_label(text)
+    if norm:
+        tokens.add(norm)
+    return tokens
+
+
+class SheetIndex:
+    """시트 셀 텍스트의 역색인
+
+    토큰 → 셀 위치(행 우선 1차원 인덱스) 배열을 보관합니다. 검색은
+    셀 수가 아니라 서로 다른 토큰 수에 비례하며, 입력 중인 검색어는
+    직전 검색어가 찾은 토큰 안에서만 다시 찾습니다.
+    """
+
+    def __init__(self, values):
+        postings = {}
+        # 같은 텍스트는 한 번만 토큰화
+        token_cache = {}
+        for i, value in enumerate(values):
+            if not value:
+                continue
+            text = str(value)
+            tokens = token_cache.get(text)
+            if tokens is None:
+                tokens = token_cache[text] = tokenize(text)
+            for token in tokens:
+                cells = postings.get(token)
+                if cells is None:
+                    cells = postings[token] = array('I')
+                cells.append(i)
+        self._postings = postings
+        self._tokens = sorted(postings)
+        # 검색어 조각 → 그 조각을 포함하는 토큰 목록
+        self._matches = {}
+        # 편집된 셀 위치 → 새 토큰 (색인 대신 사용)
+        self._edited = {}
+
+    def update(self, i, value):
+        """편집된 셀의 값을 반영합니다."""
+        self._edited[i] = tokenize(str(value)) if value else set()
+
+    def search(self, query):
+        """검색어와 일치하는 셀 위치를 오름차순 리스트로 반환합니다.
+
+        정규화한 검색어가 셀 토큰에 포함되거나, 검색어의 모든 단어가
+        각각 셀 토큰 중 하나에 포함되면 일치로 봅니다.
+        """
+        norm = normalize_label(query)
+        if not norm:
+            return []
+        words = _WORD.findall(query.lower())
+        cells = self._cells(norm)
+        if len(words) > 1:
+            common = self._cells(words[0])
+            for word in words[1:]:
+                common = common & self._cells(word)
+            cells = cells | common
+        if self._edited:
+            cells = cells - self._edited.keys()
+            for i, tokens in self._edited.items():
+                if self._tokens_match(tokens, norm, words):
+                    cells.add(i)
+        return sorted(cells)
+
+    def _cells(self, fragment):
+        cells = set()
+        for token in self._matching_tokens(fragment):
+            cells.update(self._postings[token])
+        return cells
+
+    def _matching_tokens(self, fragment):
+        tokens = self._matches.get(fragment)
+        if tokens is None:
+            # 한 글자 덧붙인 검색어는 직전 결과 안에서만 찾음
+            candidates = self._matches.get(fragment[:-1], self._tokens)
+            tokens = [t for t in candidates if fragment in t]
+            self._matches[fragment] = tokens
+        return tokens
+
+    def _tokens_match(self, tokens, norm, words):
+        if any(norm in t for t in tokens):
+            return True
+        return len(words) > 1 and all(
+            any(word in t for t in tokens) for word in words
+        )
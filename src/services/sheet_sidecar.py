@@ -0,0 +1,371 @@
+import datetime
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+from ..utils.file_utils import sheet_file_stem
+from .sheet_snapshot import SheetSnapshot, StyleSpec
+
+# 파일 구조 (리틀 엔디언)
+#   헤더: magic, 버전, 행 수, 열 수, 원본 수정 시각(ns), 원본 크기, 섹션 수
+#   섹션 표: 섹션마다 (오프셋, 길이)
+#   섹션: 8바이트 정렬, SECTIONS 순서
+MAGIC = b"ISHT"
+VERSION = 3
+_HEADER = struct.Struct("<4sHxxIIqQI")
+_SECTION = struct.Struct("<QQ")
+SECTIONS = (
+    "kinds", "slots", "ints", "floats", "str_offsets", "str_data",
+    "style_ids", "styles", "merges", "dims",
+)
+
+# 셀 값 종류 (kinds 섹션) - slot은 종류별 배열의 인덱스
+(NONE, INT, FLOAT, STR, BOOL,
+ DATETIME, DATE, TIME, TIMEDELTA, BIGINT) = range(10)
+
+
+def sidecar_path(path, sheet=None):
+    """엑셀 파일 옆에 두는 사이드카 파일 경로 (시트마다 하나)"""
+    return sheet_file_stem(path, sheet) + ".sheet"
+
+
+def write_sidecar(path, snapshot, source_path=None):
+    """스냅샷을 열 단위 바이너리 사이드카 파일로 저장합니다.
+
+    값은 종류/슬롯 배열과 종류별 배열(정수, 실수, 중복 제거한 문자열)로
+    나누어 저장하고, 스타일 표와 병합 범위를 함께 담습니다.
+    source_path를 주면 원본의 수정 시각/크기를 기록해 최신 여부를
+    확인할 수 있게 합니다.
+    """
+    n = snapshot.rows * snapshot.cols
+    kinds = array('B', bytes(n))
+    slots = array('I', bytes(4 * n))
+    ints = array('q')
+    floats = array('d')
+    strings = {}
+
+    def intern(text):
+        slot = strings.get(text)
+        if slot is None:
+            slot = strings[text] = len(strings)
+        return slot
+
+    for i, v in enumerate(snapshot.values):
+        if v is None:
+            continue
+        if isinstance(v, bool):
+            kinds[i], slots[i] = BOOL, int(v)
+        elif isinstance(v, int):
+            if -2 ** 63 <= v < 2 ** 63:
+                kinds[i], slots[i] = INT, len(ints)
+                ints.append(v)
+            else:
+                kinds[i], slots[i] = BIGINT, intern(str(v))
+        elif isinstance(v, float):
+            kinds[i], slots[i] = FLOAT, len(floats)
+            floats.append(v)
+        elif isinstance(v, datetime.datetime):
+            kinds[i], slots[i] = DATETIME, intern(v.isoformat())
+        elif isinstance(v, datetime.date):
+            kinds[i], slots[i] = DATE, intern(v.isoformat())
+        elif isinstance(v, datetime.time):
+            kinds[i], slots[i] = TIME, intern(v.isoformat())
+        elif isinstance(v, datetime.timedelta):
+            kinds[i], slots[i] = TIMEDELTA, len(floats)
+            floats.append(v.total_seconds())
+        else:
+            kinds[i], slots[i] = STR, intern(str(v))
+
+    str_offsets = array('I', [0])
+    str_data = bytearray()
+    for text in strings:
+        str_data += text.encode("utf-8")
+        str_offsets.append(len(str_data))
+
+    merges = array('I')
+    for merged in snapshot.merged_ranges:
+        merges.extend(merged)
+    styles = {
+        str(sid): list(spec) for sid, spec in snapshot.styles.items()
+    }
+    dims = {
+        "col_widths": snapshot.col_widths,
+        "row_heights": snapshot.row_heights,
+    }
+    sections = [
+        kinds.tobytes(), slots.tobytes(), ints.tobytes(), floats.tobytes(),
+        str_offsets.tobytes(), bytes(str_data),
+        array('I', snapshot.style_ids).tobytes(),
+        json.dumps(styles, ensure_ascii=False).encode("utf-8"),
+        merges.tobytes(),
+        json.dumps(dims).encode("utf-8"),
+    ]
+
+    mtime_ns, size = 0, 0
+    if source_path is not None:
+        st = os.stat(source_path)
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+    header = _HEADER.pack(
+        MAGIC, VERSION, snapshot.rows, snapshot.cols,
+        mtime_ns, size, len(sections)
+    )
+    offset = _align(_HEADER.size + _SECTION.size * len(sections))
+    table = bytearray()
+    for data in sections:
+        table += _SECTION.pack(offset, len(data))
+        offset = _align(offset + len(data))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".tmp-", suffix=".sheet", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(table)
+            for data in sections:
+                f.write(b"\0" * (_align(f.tell()) - f.tell()))
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_sidecar(path, source_path=None):
+    """사이드카 파일을 메모리 매핑으로 열어 스냅샷을 반환합니다.
+
+    셀 값은 접근할 때 디코딩합니다. source_path를 주면 원본이
+    바뀌었는지 확인하고, 바뀌었거나 파일이 없으면 None을 반환합니다.
+    잘리거나 깨진 파일도 캐시 실패로 보고 None을 반환합니다.
+    """
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    mapping = SidecarMapping(mm)
+    try:
+        buf = memoryview(mm)
+        mapping.views.append(buf)
+        if len(buf) < _HEADER.size:
+            raise ValueError("header truncated")
+        (magic, version, rows, cols,
+         mtime_ns, size, count) = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION or count != len(SECTIONS):
+            raise ValueError("unsupported format")
+        if source_path is not None:
+            st = os.stat(source_path)
+            if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+                raise ValueError("stale")
+        snapshot = SheetSnapshot(0, 0)
+        snapshot.rows, snapshot.cols = rows, cols
+        _attach(snapshot, buf, mapping.views)
+    except (ValueError, TypeError, KeyError, IndexError, struct.error):
+        mapping.close()
+        return None
+    except BaseException:
+        mapping.close()
+        raise
+    mapping.snapshot = snapshot
+    snapshot._mapping = mapping
+    return snapshot
+
+
+def _sections(buf, rows, cols):
+    """섹션 표를 읽고 파일 크기/셀 수와 맞는지 확인합니다."""
+    start = _HEADER.size + _SECTION.size * len(SECTIONS)
+    if len(buf) < start:
+        raise ValueError("section table truncated")
+    sections = {}
+    for k, name in enumerate(SECTIONS):
+        offset, length = _SECTION.unpack_from(
+            buf, _HEADER.size + _SECTION.size * k
+        )
+        if offset < start or offset + length > len(buf):
+            raise ValueError(f"section {name} out of range")
+        sections[name] = (offset, length)
+    n = rows * cols
+    expected = {"kinds": n, "slots": 4 * n, "style_ids": 4 * n}
+    itemsizes = {"ints": 8, "floats": 8, "str_offsets": 4, "merges": 16}
+    for name, (_, length) in sections.items():
+        if name in expected and length != expected[name]:
+            raise ValueError(f"section {name} has wrong length")
+        if length % itemsizes.get(name, 1):
+            raise ValueError(f"section {name} has wrong length")
+    if sections["str_offsets"][1] < 4:
+        raise ValueError("section str_offsets is empty")
+    return sections
+
+
+def _attach(snapshot, buf, views, values_only=False):
+    """buf의 섹션으로 스냅샷의 값/스타일/병합/크기를 채웁니다.
+
+    values_only이면 셀 값과 스타일 id만 다시 연결합니다.
+    만든 메모리뷰는 views에 모아 매핑을 닫을 때 해제합니다.
+    """
+    def section(name, fmt=None):
+        offset, length = sections[name]
+        view = buf[offset:offset + length]
+        views.append(view)
+        if fmt is not None:
+            view = view.cast(fmt)
+            views.append(view)
+        return view
+
+    sections = _sections(buf, snapshot.rows, snapshot.cols)
+    str_offsets = section("str_offsets", 'I')
+    str_data = section("str_data")
+    if str_offsets[-1] > len(str_data):
+        raise ValueError("section str_offsets out of range")
+    overrides = getattr(snapshot.values, "_overrides", None)
+    snapshot.values = MappedValues(
+        section("kinds"),
+        section("slots", 'I'),
+        section("ints", 'q'),
+        section("floats", 'd'),
+        MappedStrings(str_offsets, str_data),
+    )
+    if overrides:
+        snapshot.values._overrides = overrides
+    snapshot.style_ids = section("style_ids", 'I')
+    if not values_only:
+        styles = json.loads(bytes(section("styles")).decode("utf-8"))
+        snapshot.styles = {
+            int(sid): StyleSpec(*(_to_tuple(field) for field in spec))
+            for sid, spec in styles.items()
+        }
+        merges = section("merges", 'I')
+        snapshot.merged_ranges = [
+            tuple(merges[i:i + 4]) for i in range(0, len(merges), 4)
+        ]
+        dims = json.loads(bytes(section("dims")).decode("utf-8"))
+        snapshot.col_widths = {
+            int(k): v for k, v in dims["col_widths"].items()
+        }
+        snapshot.row_heights = {
+            int(k): v for k, v in dims["row_heights"].items()
+        }
+
+
+class SidecarMapping:
+    """사이드카 파일의 메모리 매핑과 그 위에 만든 메모리뷰
+
+    Windows에서는 매핑된 파일을 os.replace로 덮어쓸 수 없으므로,
+    시트를 메모리에서 내릴 때 SheetSnapshot.close()로 닫습니다. 스냅샷이
+    아직 화면에 있을 수 있으므로 닫기 전에 섹션을 메모리로 복사해
+    다시 연결합니다 (편집한 값은 유지).
+    """
+
+    def __init__(self, mm):
+        self.mm = mm
+        self.views = []
+        self.snapshot = None
+
+    def close(self):
+        snapshot, self.snapshot = self.snapshot, None
+        if snapshot is not None:
+            data = memoryview(bytes(self.mm))
+            _attach(snapshot, data, [], values_only=True)
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        try:
+            self.mm.close()
+        except BufferError:
+            # 밖에서 잡고 있는 메모리뷰가 있으면 GC가 닫음
+            pass
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _to_tuple(value):
+    # JSON 배열을 StyleSpec과 같은 (중첩) 튜플로 되돌림
+    if isinstance(value, list):
+        return tuple(_to_tuple(v) for v in value)
+    return value
+
+
+class MappedStrings:
+    """오프셋 표로 나뉜 UTF-8 문자열 섹션 (읽은 문자열은 캐시)"""
+
+    def __init__(self, offsets, data):
+        self._offsets = offsets
+        self._data = data
+        self._cache = {}
+
+    def __getitem__(self, slot):
+        text = self._cache.get(slot)
+        if text is None:
+            start, end = self._offsets[slot], self._offsets[slot + 1]
+            text = self._cache[slot] = str(self._data[start:end], "utf-8")
+        return text
+
+
+class MappedValues:
+    """메모리 매핑된 열 단위 섹션에서 셀 값을 꺼내는 시퀀스
+
+    편집된 값은 원본 파일 대신 메모리에만 보관합니다.
+    """
+
+    def __init__(self, kinds, slots, ints, floats, strings):
+        self._kinds = kinds
+        self._slots = slots
+        self._ints = ints
+        self._floats = floats
+        self._strings = strings
+        self._overrides = {}
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def __iter__(self):
+        for i in range(len(self._kinds)):
+            yield self._get(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self._get(i)
+
+    def __setitem__(self, i, value):
+        self._overrides[i] = value
+
+    def __reduce__(self):
+        # 피클(파싱 캐시 등)에는 일반 리스트로 저장
+        return (list, (list(self),))
+
+    def _get(self, i):
+        if self._overrides and i in self._overrides:
+            return self._overrides[i]
+        kind = self._kinds[i]
+        if kind == NONE:
+            return None
+        slot = self._slots[i]
+        if kind == INT:
+            return self._ints[slot]
+        if kind == FLOAT:
+            return self._floats[slot]
+        if kind == STR:
+            return self._strings[slot]
+        if kind == BOOL:
+            return bool(slot)
+        if kind == DATETIME:
+            return datetime.datetime.fromisoformat(self._strings[slot])
+        if kind == DATE:
+            return datetime.date.fromisoformat(self._strings[slot])
+        if kind == TIME:
+            return datetime.time.fromisoformat(self._strings[slot])
+        if kind == TIMEDELTA:
+            return datetime.timedelta(seconds=self._floats[slot])
+        return int(self._strings[slot])
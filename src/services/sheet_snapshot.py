@@ -0,0 +1,202 @@
+import sys
+from array import array
+from collections import namedtuple
+
+from .sheet_index import SheetIndex
+
+# 셀 스타일의 Qt 독립 표현 (스타일 id마다 한 번만 계산)
+# border: (top, bottom, left, right) 변마다 None 또는 (스타일, 'RRGGBB'/None)
+StyleSpec = namedtuple(
+    "StyleSpec",
+    "font_name font_size bold italic background alignment border"
+)
+
+
+class SheetSnapshot:
+    """워크시트를 한 번만 순회해 만든 메모리 스냅샷
+
+    셀 값은 행 우선 1차원 리스트, 스타일 id는 array로 보관하고
+    병합 범위와 열 너비/행 높이를 함께 담습니다.
+    좌표는 openpyxl과 같이 1부터 시작합니다.
+    """
+
+    # 속성 구성(또는 추출 규칙)이 바뀌면 올려서 저장된 캐시를 무효화
+    FORMAT_VERSION = 5
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.values = [None] * (rows * cols)
+        self.style_ids = array('I', bytes(4 * rows * cols))
+        # 스타일 id → StyleSpec
+        self.styles = {}
+        # (min_row, min_col, max_row, max_col)
+        self.merged_ranges = []
+        self.col_widths = {}
+        self.row_heights = {}
+        # 추출 결과 (items, header, summary), finish_load에서 채움
+        self.extracted = None
+        self._merge_index = None
+        self._text_index = None
+        # 사이드카에서 읽은 경우 그 메모리 매핑 (SidecarMapping)
+        self._mapping = None
+
+    @classmethod
+    def for_worksheet(cls, ws):
+        """셀은 비워 둔 채 크기/병합 범위/열 너비/행 높이만 채웁니다."""
+        from openpyxl.utils import column_index_from_string
+
+        rows, cols = ws.max_row, ws.max_column
+        snapshot = cls(rows, cols)
+        snapshot.merged_ranges = [
+            (m.min_row, m.min_col, m.max_row, m.max_col)
+            for m in ws.merged_cells.ranges
+        ]
+        for idx, col_dim in ws.column_dimensions.items():
+            col = column_index_from_string(idx)
+            if col <= cols and col_dim.width:
+                snapshot.col_widths[col] = col_dim.width
+        for r, row_dim in ws.row_dimensions.items():
+            if row_dim.height is not None and r <= rows:
+                snapshot.row_heights[r] = row_dim.height
+        return snapshot
+
+    def scan(self, ws, resolve_style, block_rows=None):
+        """셀 값/스타일 id를 채우며 block_rows행마다 채운 행 수를 반환합니다.
+
+        block_rows가 None이면 마지막에 한 번만 반환합니다.
+        resolve_style(cell)은 처음 보는 스타일 id마다 한 번만 호출됩니다.
+        """
+        rows, cols = self.rows, self.cols
+        values = self.values
+        style_ids = self.style_ids
+        styles = self.styles
+        i = 0
+        for r, row in enumerate(
+            ws.iter_rows(min_row=1, max_row=rows, max_col=cols), 1
+        ):
+            for cell in row:
+                values[i] = cell.value
+                sid = cell.style_id
+                style_ids[i] = sid
+                if sid not in styles:
+                    styles[sid] = resolve_style(cell)
+                i += 1
+            if block_rows and r % block_rows == 0 and r < rows:
+                yield r
+        yield rows
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # 병합 조회표/검색 색인은 셀 값에서 다시 만듦
+        state["_merge_index"] = None
+        state["_text_index"] = None
+        state["_mapping"] = None
+        # 메모리 매핑된 사이드카에서 읽은 경우 일반 배열로 저장
+        if not isinstance(self.style_ids, array):
+            state["style_ids"] = array('I', self.style_ids)
+        return state
+
+    def close(self):
+        """사이드카 메모리 매핑을 닫습니다 (메모리에서 내릴 때).
+
+        값은 메모리로 복사되므로 스냅샷은 계속 쓸 수 있습니다.
+        """
+        mapping = getattr(self, "_mapping", None)
+        if mapping is not None:
+            self._mapping = None
+            mapping.close()
+
+    def merge_index(self):
+        """병합 범위 조회표 (처음 호출할 때 한 번 만듦)"""
+        if getattr(self, "_merge_index", None) is None:
+            self._merge_index = MergeIndex(
+                self.merged_ranges, self.rows, self.cols
+            )
+        return self._merge_index
+
+    def text_index(self):
+        """셀 텍스트 검색 색인 (처음 호출할 때 한 번 만듦)"""
+        if getattr(self, "_text_index", None) is None:
+            self._text_index = SheetIndex(self.values)
+        return self._text_index
+
+    def set_value(self, i, value):
+        """i번째(행 우선) 셀 값을 바꾸고 검색 색인에 반영합니다."""
+        self.values[i] = value
+        if getattr(self, "_text_index", None) is not None:
+            self._text_index.update(i, value)
+
+    def estimated_bytes(self):
+        """스냅샷이 차지하는 메모리 추정치 (메모리 예산 계산용)"""
+        size = len(self.style_ids) * 4
+        values = self.values
+        if isinstance(values, list):
+            size += sys.getsizeof(values)
+            size += sum(sys.getsizeof(v) for v in values if v is not None)
+        else:
+            # 메모리 매핑된 사이드카: 디코딩한 값만 힙을 차지
+            size += len(values) * 8
+        return size
+
+    def value(self, r, c):
+        """(r, c) 셀 값, 범위를 벗어나면 None"""
+        if 1 <= r <= self.rows and 1 <= c <= self.cols:
+            return self.values[(r - 1) * self.cols + c - 1]
+        return None
+
+    def row_values(self, r):
+        start = (r - 1) * self.cols
+        return self.values[start:start + self.cols]
+
+    def iter_rows(self):
+        """행 단위 값 목록을 위에서부터 순서대로 반환합니다."""
+        for r in range(1, self.rows + 1):
+            yield self.row_values(r)
+
+
+class MergeIndex:
+    """병합 범위에 속한 셀에서 기준(좌상단) 셀을 바로 찾는 조회표
+
+    행마다 {열: (첫 열, 끝 열, 기준 행)}을 보관하므로 셀마다 병합 범위
+    전체를 훑지 않습니다. 행은 1부터, 열은 0부터(행 값 리스트의
+    인덱스) 셉니다.
+    """
+
+    def __init__(self, merged_ranges, rows, cols):
+        self._rows = {}
+        for min_row, min_col, max_row, max_col in merged_ranges:
+            span = (min_col - 1, min(max_col, cols) - 1, min_row)
+            for r in range(min_row, min(max_row, rows) + 1):
+                cells = self._rows.setdefault(r, {})
+                for c in range(span[0], span[1] + 1):
+                    cells[c] = span
+
+    def __bool__(self):
+        return bool(self._rows)
+
+    def row_spans(self, r):
+        """r행의 병합 셀 {열: (첫 열, 끝 열, 기준 행)}, 없으면 None"""
+        return self._rows.get(r)
+
+    def fill_rows(self, rows):
+        """위에서부터 순서대로 받은 행의 세로 병합 셀을 기준 셀 값으로 채웁니다.
+
+        기준 셀 아래 행의 첫 열만 채우고, 가로로 이어진 셀은 비워 둡니다
+        (카테고리 행이 단가/수량 열까지 병합되어 있어도 그 열에 값이
+        생기지 않게). 기준 셀은 항상 범위의 첫 행에 있으므로 지나간 기준
+        셀 값만 기억하면 됩니다.
+        """
+        anchors = {}
+        for r, row in enumerate(rows, 1):
+            spans = self._rows.get(r)
+            if spans:
+                row = list(row)
+                for c, (first, _, anchor_row) in spans.items():
+                    if c != first or c >= len(row):
+                        continue
+                    if anchor_row == r:
+                        anchors[(r, c)] = row[c]
+                    else:
+                        row[c] = anchors.get((anchor_row, c))
+            yield row
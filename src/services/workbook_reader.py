@@ -0,0 +1,138 @@
+import posixpath
+import re
+import zipfile
+from xml.etree import ElementTree
+
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.utils.cell import range_boundaries
+
+# 시트 XML의 <mergeCell ref="A1:B2"/> (네임스페이스 접두사 허용)
+_MERGE_CELL = re.compile(
+    rb'<(?:\w+:)?mergeCell\s[^>]*?ref="([A-Z0-9:$]+)"'
+)
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+_PKG_REL_NS = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}"
+)
+
+
+class WorkbookReader(ExcelReader):
+    """워크북에서 필요한 시트만 읽는 ExcelReader
+
+    openpyxl.load_workbook은 모든 시트를 한 번에 파싱하므로, 시트가
+    많은 워크북에서는 목록 조회와 선택한 시트 하나만 읽도록 나눕니다.
+    ExcelReader의 내부 동작(parser.find_sheets/assign_names)에 기대므로
+    requirements.txt의 openpyxl 버전 범위(3.1.x)에서만 확인했습니다.
+    """
+
+    def __init__(self, path, sheet=None):
+        super().__init__(path, read_only=False, data_only=True)
+        # None이면 활성 시트
+        self.sheet = sheet
+
+    def list_sheets(self):
+        """(워크시트 이름 목록, 활성 시트 이름)을 반환합니다.
+
+        workbook.xml만 읽으며 셀/스타일/공유 문자열은 읽지 않습니다.
+        """
+        try:
+            self.read_manifest()
+            self.read_workbook()
+            return self._sheet_names()
+        finally:
+            self.archive.close()
+
+    def read_sheet(self):
+        """선택한 시트 하나만 담긴 워크북을 읽어 워크시트를 반환합니다."""
+        self.read()
+        if not self.wb.worksheets:
+            raise KeyError(f"시트를 찾을 수 없습니다: {self.sheet}")
+        return self.wb.worksheets[0]
+
+    def _sheet_names(self):
+        sheets = list(self.parser.find_sheets())
+        names = [
+            sheet.name for sheet, rel in sheets
+            if "chartsheet" not in rel.Type
+        ]
+        views = self.wb.views
+        active = views[0].activeTab if views else 0
+        if 0 <= active < len(sheets) and sheets[active][0].name in names:
+            return names, sheets[active][0].name
+        return names, names[0] if names else None
+
+    def read_worksheets(self):
+        if self.sheet is None:
+            _, self.sheet = self._sheet_names()
+        find_sheets = self.parser.find_sheets
+
+        def selected_sheets():
+            for sheet, rel in find_sheets():
+                if sheet.name == self.sheet:
+                    yield sheet, rel
+
+        self.parser.find_sheets = selected_sheets
+        # 시트 인덱스가 원본과 달라지므로 시트별 이름 정의는 연결하지 않음
+        self.parser.assign_names = lambda: None
+        super().read_worksheets()
+
+
+def sheet_part(archive, sheet):
+    """워크북 zip에서 시트 이름에 해당하는 시트 XML 경로를 찾습니다."""
+    rels = _relationships(archive, "_rels/.rels")
+    workbook = next(
+        target for rel_type, target in rels.values()
+        if rel_type.endswith("/officeDocument")
+    )
+    folder, name = posixpath.split(workbook)
+    sheet_rels = _relationships(
+        archive, posixpath.join(folder, "_rels", name + ".rels"), folder
+    )
+    root = ElementTree.fromstring(archive.read(workbook))
+    for node in root.iter(f"{_MAIN_NS}sheet"):
+        if node.get("name") == sheet:
+            return sheet_rels[node.get(f"{_REL_NS}id")][1]
+    raise KeyError(f"시트를 찾을 수 없습니다: {sheet}")
+
+
+def _relationships(archive, rels_path, folder=""):
+    """관계 파일의 {Id: (Type, zip 안의 대상 경로)}"""
+    root = ElementTree.fromstring(archive.read(rels_path))
+    rels = {}
+    for node in root.iter(f"{_PKG_REL_NS}Relationship"):
+        target = node.get("Target")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        rels[node.get("Id")] = (node.get("Type"), target)
+    return rels
+
+
+def read_merged_ranges(path, sheet, chunk_size=1024 * 1024):
+    """시트의 병합 범위를 워크북 zip의 시트 XML에서 직접 읽습니다.
+
+    읽기 전용 워크시트에는 merged_cells가 없으므로 셀을 파싱하지 않고
+    XML 바이트에서 mergeCell 요소만 찾습니다.
+    (min_row, min_col, max_row, max_col) 목록을 반환합니다.
+    """
+    ranges = []
+    tail = b""
+    with zipfile.ZipFile(path) as archive:
+        with archive.open(sheet_part(archive, sheet)) as src:
+            for chunk in iter(lambda: src.read(chunk_size), b""):
+                data = tail + chunk
+                end = 0
+                if b"mergeCell" in data:
+                    for m in _MERGE_CELL.finditer(data):
+                        min_col, min_row, max_col, max_row = (
+                            range_boundaries(m.group(1).decode("ascii"))
+                        )
+                        ranges.append((min_row, min_col, max_row, max_col))
+                        end = m.end()
+                # 청크 경계에 걸친 요소를 위해 끝부분을 남김
+                tail = data[max(end, len(data) - 256):]
+    return ranges
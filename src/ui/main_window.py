@@ -1,27 +1,104 @@
 import json
+import os
+import time
+from contextlib import contextmanager
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QFileDialog, QFrame, QTextBrowser,
-    QTextEdit, QSplitter, QLabel, QMessageBox
+    QTextEdit, QSplitter, QLabel, QMessageBox, QProgressBar, QComboBox,
+    QTabBar, QShortcut
 )
-from PyQt5.QtCore import Qt
-from src.config.settings import GPT_API_KEY, GPT_MODEL
-from src.services.gpt_service import ask_gpt_api
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QKeySequence, QTextCursor
+# 설정은 쓰는 시점에 settings.X로 읽음 (.env는 처음 읽을 때 불러옴)
+from src.config import settings
 from src.services.excel_service import ExcelService
-from src.services.gpt_service import GPTService
-from src.ui.widgets.zoomable_table import ZoomableTableWidget
+from src.services.gpt_context import InvoiceContext, TokenCounter
+from src.services.invoice_query import InvoiceQueryEngine
+from src.services.parse_cache import ParseCache
+from src.services.response_cache import ResponseCache
+from src.ui.widgets.zoomable_table import ZoomableTableView
 from src.ui.widgets.border_delegate import BorderDelegate
+from src.ui.widgets.search_bar import SheetSearchBar
+from src.ui.workers.excel_load_worker import ExcelLoadWorker
+from src.ui.workers.gpt_worker import GPTStreamWorker
+from src.utils.file_utils import atomic_write_json
+from src.utils.profiling import StageProfiler
+
+
+class WorkbookDocument:
+    """작업 공간 탭 하나에 열린 워크북
+
+    위젯이나 모델은 갖지 않고 상태만 보관합니다. 탭을 바꾸면 파싱해 둔
+    스냅샷으로 모델을 다시 만듭니다.
+    """
+
+    def __init__(self, path, sheet_names, active_sheet):
+        self.path = path
+        self.sheet_names = sheet_names
+        # 워크북의 활성 시트 (이 시트는 sheet=None으로 읽음)
+        self.active_sheet = active_sheet
+        # 보고 있던 시트와 스크롤 위치
+        self.sheet = active_sheet
+        self.scroll = (0, 0)
 
 
 class ExcelGPTViewer(QMainWindow):
+    # 워커 스레드의 로그를 GUI 스레드의 log()로 넘김
+    log_message = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
+        self.log_message.connect(self.log)
         self.setWindowTitle("Excel GPT Viewer")
         self.setGeometry(100, 100, 1200, 800)
         self.json_path = None
         self.excel_path = None
-        self.excel_service = ExcelService()
-        self.gpt_service = GPTService(GPT_API_KEY, GPT_MODEL)
+        # 현재 탭의 문서
+        self._document = None
+        # INVOICE_PROFILE이 켜져 있으면 단계별 시간을 로그와 추적 파일에 기록
+        self.profiler = StageProfiler(settings.PROFILE, settings.PROFILE_TRACE)
+        # 열린 문서의 시트는 메모리 예산 안에서 최근 사용 순으로 유지
+        self.excel_service = ExcelService(
+            parse_cache=ParseCache(
+                settings.PARSE_CACHE_DIR,
+                settings.PARSE_CACHE_MAX_MB * 1024 * 1024
+            ),
+            use_sidecar=True,
+            max_sheets=64,
+            max_sheet_bytes=settings.SHEET_CACHE_MAX_MB * 1024 * 1024,
+            profiler=self.profiler,
+            log=self.log_message.emit
+        )
+        self._gpt_service = None
+        # 같은 질문의 답변 캐시 (GPT_CACHE_MAX_MB=0이면 사용 안 함)
+        self.response_cache = None
+        if settings.GPT_CACHE_MAX_MB > 0:
+            self.response_cache = ResponseCache(
+                settings.GPT_CACHE_DIR,
+                settings.GPT_CACHE_MAX_MB * 1024 * 1024,
+                settings.GPT_CACHE_TTL_HOURS * 3600
+            )
+        # 질문 문맥 (JSON 파일이 바뀔 때만 다시 만듦)
+        self._token_counter = None
+        self._context = None
+        self._context_key = None
+        # 합계/개수 같은 집계 질문은 GPT 없이 바로 답함
+        self._query = None
+        # 답변을 받고 있는 질문: 작업자 → (답변을 이어 쓸 커서, 메시지)
+        self._gpt_streams = {}
+        self._load_worker = None
+        self._loading_snapshot = None
+        # 취소된 로딩/질문도 끝날 때까지 스레드를 추적
+        self._threads = set()
+        # 셀 편집 → JSON 동기화 (변경 행 캐시 + 지연 저장)
+        self._row_records = None
+        self._dirty_rows = set()
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(300)
+        self._sync_timer.timeout.connect(self._flush_json)
 
         self._init_ui()
 
@@ -47,16 +124,46 @@ class ExcelGPTViewer(QMainWindow):
         file_btn = QPushButton("엑셀 파일 열기")
         file_btn.clicked.connect(self.open_excel)
         top_layout.addWidget(file_btn)
+        # 시트 선택 (시트는 처음 선택할 때 파싱)
+        self.sheet_combo = QComboBox()
+        self.sheet_combo.setVisible(False)
+        self.sheet_combo.currentIndexChanged.connect(self._on_sheet_selected)
+        top_layout.addWidget(self.sheet_combo)
+        # 백그라운드 로딩 진행률/취소
+        self.load_progress = QProgressBar()
+        self.load_progress.setVisible(False)
+        top_layout.addWidget(self.load_progress)
+        self.cancel_load_btn = QPushButton("불러오기 취소")
+        self.cancel_load_btn.setVisible(False)
+        self.cancel_load_btn.clicked.connect(self.cancel_load)
+        top_layout.addWidget(self.cancel_load_btn)
         excel_layout.addLayout(top_layout)
+
+        # 열린 워크북 탭 (뷰는 하나를 공유)
+        self.tab_bar = QTabBar()
+        self.tab_bar.setTabsClosable(True)
+        self.tab_bar.setExpanding(False)
+        self.tab_bar.setDocumentMode(True)
+        self.tab_bar.currentChanged.connect(self._on_tab_changed)
+        self.tab_bar.tabCloseRequested.connect(self.close_tab)
+        excel_layout.addWidget(self.tab_bar)
         
-        # ZoomableTableWidget으로 변경
-        self.excel_view = ZoomableTableWidget()
+        # SheetTableModel을 표시하는 ZoomableTableView
+        self.excel_view = ZoomableTableView()
         # 기본 그리드(격자) 끄기
         self.excel_view.setShowGrid(False)
         # 셀별 테두리 그리도록 Delegate 설정
-        self.excel_view.setItemDelegate(BorderDelegate(self.excel_view))
-        self.excel_view.cellChanged.connect(self.on_cell_changed)
+        self.excel_view.setItemDelegate(BorderDelegate(
+            self.excel_view, self.excel_service.style_cache.border_pens
+        ))
         excel_layout.addWidget(self.excel_view)
+
+        # Ctrl+F 시트 검색/필터
+        self.search_bar = SheetSearchBar(self.excel_view)
+        self.search_bar.setVisible(False)
+        excel_layout.addWidget(self.search_bar)
+        find_shortcut = QShortcut(QKeySequence.Find, self)
+        find_shortcut.activated.connect(self.search_bar.open_search)
         
         self.splitter.addWidget(excel_panel)
 
@@ -65,7 +172,7 @@ class ExcelGPTViewer(QMainWindow):
         chat_layout = QVBoxLayout(chat_frame)
         chat_layout.setContentsMargins(8, 8, 8, 8)
         chat_layout.setSpacing(8)
-        self.model_label = QLabel(f"모델: {GPT_MODEL}")
+        self.model_label = QLabel(f"모델: {settings.GPT_MODEL}")
         self.model_label.setStyleSheet("font-weight:bold;color:#0057b8;")
         chat_layout.addWidget(self.model_label)
         self.chat_output = QTextBrowser()
@@ -88,6 +195,10 @@ class ExcelGPTViewer(QMainWindow):
         self.send_btn = QPushButton("질문하기")
         self.send_btn.clicked.connect(self.ask_gpt)
         btn_layout.addWidget(self.send_btn)
+        self.stop_gpt_btn = QPushButton("답변 중지")
+        self.stop_gpt_btn.setVisible(False)
+        self.stop_gpt_btn.clicked.connect(self.cancel_gpt)
+        btn_layout.addWidget(self.stop_gpt_btn)
         btn_layout.addStretch(1)
         btn_widget = QWidget()
         btn_widget.setLayout(btn_layout)
@@ -117,7 +228,7 @@ class ExcelGPTViewer(QMainWindow):
             font-weight: bold;
             border: 1px solid #555;
         }
-        QTableWidget {
+        QTableView {
             gridline-color: #AAAAAA;
         }
         """)
@@ -128,6 +239,14 @@ class ExcelGPTViewer(QMainWindow):
             self.log_output.append(msg)
         print(msg)
 
+    @contextmanager
+    def _profile(self, action, **meta):
+        """GUI 작업 하나를 프로파일링하고 요약을 로그에 남깁니다."""
+        with self.profiler.run(action, **meta) as trace:
+            yield
+        if trace is not None:
+            self.log(trace.summary())
+
     def open_excel(self):
         """엑셀 파일을 엽니다."""
         path, _ = QFileDialog.getOpenFileName(
@@ -135,13 +254,14 @@ class ExcelGPTViewer(QMainWindow):
         )
         if not path:
             return
+        index = self._find_tab(path)
+        if index >= 0:
+            self.tab_bar.setCurrentIndex(index)
+            return
         self.log(f"[작업] 엑셀 파일 열기: {path}")
         try:
-            self.excel_path = path
-            self.json_path, _ = (
-                self.excel_service.load_excel(path, self.excel_view)
-            )
-            self.log(f"[작업] JSON 파일 저장: {self.json_path}")
+            with self._profile("list_sheets", file=path):
+                names, active = self.excel_service.list_sheets(path)
         except Exception as e:
             self.log(f"[오류] 엑셀 파일 열기 실패: {e}")
             QMessageBox.critical(
@@ -149,19 +269,279 @@ class ExcelGPTViewer(QMainWindow):
                 "엑셀 파일 오류",
                 f"엑셀 파일을 불러올 수 없습니다:\n{e}"
             )
+            return
+        document = WorkbookDocument(path, names, active)
+        self._save_view_state()
+        self.tab_bar.blockSignals(True)
+        index = self.tab_bar.addTab(os.path.basename(path))
+        self.tab_bar.setTabToolTip(index, path)
+        self.tab_bar.setTabData(index, document)
+        self.tab_bar.setCurrentIndex(index)
+        self.tab_bar.blockSignals(False)
+        self._show_document(document)
+
+    def _find_tab(self, path):
+        path = os.path.abspath(path)
+        for index in range(self.tab_bar.count()):
+            if os.path.abspath(self.tab_bar.tabData(index).path) == path:
+                return index
+        return -1
+
+    def _on_tab_changed(self, index):
+        if index < 0:
+            return
+        document = self.tab_bar.tabData(index)
+        if document is self._document:
+            return
+        self._save_view_state()
+        self._show_document(document)
+        self.log(f"[작업] 문서 전환: {os.path.basename(document.path)}")
+
+    def _show_document(self, document):
+        """문서의 시트 목록과 보고 있던 시트를 표시합니다."""
+        self._document = document
+        self.excel_path = document.path
+        self.sheet_combo.blockSignals(True)
+        self.sheet_combo.clear()
+        self.sheet_combo.addItems(document.sheet_names)
+        self.sheet_combo.setCurrentText(document.sheet or "")
+        self.sheet_combo.blockSignals(False)
+        self.sheet_combo.setVisible(len(document.sheet_names) > 1)
+        self.load_sheet(document.sheet)
+
+    def close_tab(self, index):
+        """문서 탭을 닫고 파싱해 둔 시트를 메모리에서 내립니다."""
+        document = self.tab_bar.tabData(index)
+        if document is self._document:
+            self.cancel_load()
+            self._reset_json_sync()
+            self._document = None
+        self.excel_service.forget_sheets(document.path)
+        self.tab_bar.removeTab(index)
+        if self.tab_bar.count() == 0:
+            self.excel_path = None
+            self.json_path = None
+            self.sheet_combo.blockSignals(True)
+            self.sheet_combo.clear()
+            self.sheet_combo.blockSignals(False)
+            self.sheet_combo.setVisible(False)
+            old_model = self.excel_view.model()
+            self.excel_view.setModel(None)
+            if old_model is not None:
+                old_model.deleteLater()
+            self.excel_view.clearSpans()
+            self.search_bar.reset()
+
+    def _save_view_state(self):
+        if self._document is not None:
+            self._document.scroll = (
+                self.excel_view.horizontalScrollBar().value(),
+                self.excel_view.verticalScrollBar().value(),
+            )
+
+    def _restore_view_state(self):
+        document = self._document
+        if document is None:
+            return
+        x, y = document.scroll
+        # 모델을 바꾼 직후에는 스크롤 범위가 갱신되기 전이므로 지연 적용
+        QTimer.singleShot(0, lambda: (
+            self.excel_view.horizontalScrollBar().setValue(x),
+            self.excel_view.verticalScrollBar().setValue(y),
+        ))
+
+    def _on_sheet_selected(self, index):
+        if index >= 0 and self._document is not None:
+            name = self.sheet_combo.itemText(index)
+            self._document.scroll = (0, 0)
+            self.load_sheet(name)
+            self.log(f"[작업] 시트 전환: {name}")
+
+    def load_sheet(self, name):
+        """시트를 표시합니다. 이미 파싱한 시트는 바로 다시 보여줍니다."""
+        self.cancel_load()
+        self._reset_json_sync()
+        self.json_path = None
+        document = self._document
+        document.sheet = name
+        sheet = None if name == document.active_sheet else name
+        snapshot = self.excel_service.cached_sheet(document.path, sheet)
+        if snapshot is not None:
+            self._show_cached(snapshot, sheet)
+            return
+
+        # 워커 스레드에서 읽고, 행 블록이 도착하는 대로 표시
+        thread = QThread(self)
+        worker = ExcelLoadWorker(
+            self.excel_service, self.excel_path, sheet=sheet
+        )
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.snapshot_ready.connect(self._on_snapshot_ready)
+        worker.rows_ready.connect(self._on_rows_ready)
+        worker.progress.connect(self._on_load_progress)
+        worker.loaded.connect(self._on_load_finished)
+        worker.failed.connect(self._on_load_failed)
+        worker.cancelled.connect(self._on_load_cancelled)
+        worker.profiled.connect(self.log)
+        worker.done.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda: self._threads.discard(thread))
+        self._threads.add(thread)
+        self._load_worker = worker
+        self._set_loading(True)
+        thread.start()
+
+    def _show_cached(self, snapshot, sheet):
+        prof = self.profiler
+        with self._profile("show_sheet", file=self.excel_path, sheet=sheet):
+            with prof.stage("view"):
+                self.excel_service.show_snapshot(snapshot, self.excel_view)
+            self.excel_view.model().dataChanged.connect(
+                self._on_data_changed
+            )
+            self.json_path = self.excel_service.json_path(
+                self.excel_path, sheet
+            )
+            with prof.stage("sizes"):
+                self.excel_view.set_initial_sizes()
+            with prof.stage("search"):
+                self.search_bar.reset()
+            self._restore_view_state()
+
+    def cancel_load(self):
+        """진행 중인 엑셀 로딩을 취소합니다."""
+        if self._load_worker is not None:
+            self._load_worker.cancel()
+            self._load_worker = None
+            self._loading_snapshot = None
+            self._set_loading(False)
+
+    def _set_loading(self, loading):
+        self.load_progress.setValue(0)
+        self.load_progress.setVisible(loading)
+        self.cancel_load_btn.setVisible(loading)
+
+    def _is_current_load(self):
+        return (
+            self._load_worker is not None
+            and self.sender() is self._load_worker
+        )
+
+    def _on_snapshot_ready(self, snapshot):
+        """빈 스냅샷으로 뷰를 준비합니다 (행은 블록 단위로 추가)."""
+        if not self._is_current_load():
+            return
+        self._loading_snapshot = snapshot
+        self.excel_service.show_snapshot(
+            snapshot, self.excel_view, loaded_rows=0
+        )
+        self.search_bar.reset()
+
+    def _on_rows_ready(self, rows_done):
+        if not self._is_current_load():
+            return
+        self.excel_view.model().set_loaded_rows(rows_done)
+
+    def _on_load_progress(self, rows_done, total_rows):
+        if not self._is_current_load():
+            return
+        self.load_progress.setMaximum(max(total_rows, 1))
+        self.load_progress.setValue(rows_done)
+
+    def _on_load_finished(self, json_path, items):
+        if not self._is_current_load():
+            return
+        snapshot = self._loading_snapshot
+        prof = self.profiler
+        with self._profile("show_loaded", file=self.excel_path):
+            self.excel_view.model().set_loaded_rows(snapshot.rows)
+            with prof.stage("layout"):
+                self.excel_service.apply_layout(snapshot, self.excel_view)
+            self.excel_view.model().dataChanged.connect(
+                self._on_data_changed
+            )
+            self.json_path = json_path
+            self._finish_load()
+            with prof.stage("sizes"):
+                self.excel_view.set_initial_sizes()
+            with prof.stage("search"):
+                self.search_bar.reset()
+            self._restore_view_state()
+        self.log(f"[작업] JSON 파일 저장: {self.json_path}")
+
+    def _on_load_failed(self, message):
+        if not self._is_current_load():
+            return
+        self._finish_load()
+        self.log(f"[오류] 엑셀 파일 열기 실패: {message}")
+        QMessageBox.critical(
+            self,
+            "엑셀 파일 오류",
+            f"엑셀 파일을 불러올 수 없습니다:\n{message}"
+        )
+
+    def _on_load_cancelled(self):
+        self.log("[작업] 엑셀 파일 불러오기 취소")
+
+    def _finish_load(self):
+        self._load_worker = None
+        self._loading_snapshot = None
+        self._set_loading(False)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        """모델 편집 신호를 셀 변경 처리로 전달합니다."""
+        if roles and Qt.EditRole not in roles:
+            # 검색 강조 등 표시만 바뀐 경우
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.on_cell_changed(row, top_left.column())
 
     def on_cell_changed(self, row, col):
-        """셀이 변경되었을 때 호출됩니다."""
+        """셀이 변경되었을 때 호출됩니다.
+
+        변경된 행만 표시해 두고, 짧은 타이머로 여러 편집을 모아
+        한 번에 JSON에 반영합니다.
+        """
         if not self.json_path:
             return
+        self._dirty_rows.add(row)
+        self._sync_timer.start()
+
+    def _flush_json(self):
+        """변경된 행을 반영한 JSON을 원자적으로 저장합니다."""
+        self._sync_timer.stop()
+        if not self.json_path or not self._dirty_rows:
+            return
+        changed = len(self._dirty_rows)
         data_dict = self._widget_to_json_schema()
-        with open(self.json_path, "w", encoding="utf-8") as f:
-            json.dump(data_dict, f, ensure_ascii=False, indent=2)
-        self.log(f"[작업] 셀 변경: ({row},{col}) → JSON 동기화")
+        atomic_write_json(self.json_path, data_dict, indent=2)
+        self.log(f"[작업] 셀 변경: {changed}행 → JSON 동기화")
+
+    def _reset_json_sync(self):
+        """새 시트를 열기 전 남은 변경을 저장하고 캐시를 비웁니다."""
+        self._flush_json()
+        self._dirty_rows.clear()
+        self._row_records = None
 
     def _widget_to_json_schema(self):
-        """테이블 위젯의 내용을 JSON 스키마로 변환합니다."""
-        table = self.excel_view
+        """테이블 모델의 내용을 JSON 스키마로 변환합니다.
+
+        행별 해석 결과를 캐시해 두고 변경된 행만 다시 해석합니다.
+        """
+        model = self.excel_view.model()
+        rows = model.rowCount()
+        if self._row_records is None or len(self._row_records) != rows:
+            self._row_records = [
+                self._parse_row(model, row) for row in range(rows)
+            ]
+        else:
+            for row in self._dirty_rows:
+                if row < rows:
+                    self._row_records[row] = self._parse_row(model, row)
+        self._dirty_rows.clear()
+
         result = {
             "meta": {},
             "items": [],
@@ -170,78 +550,106 @@ class ExcelGPTViewer(QMainWindow):
             "comments": ""
         }
         current_category = None
-        for row in range(table.rowCount()):
-            a_item = table.item(row, 0)
-            d_item = table.item(row, 3)
-            a = a_item.text() if a_item else ""
-            d = d_item.text() if d_item else ""
-            # 1) 섹션 헤더
-            if a and not d:
-                current_category = a.strip()
-                continue
-            # 2) 품목 행
-            if a and d:
-                try:
-                    item = {
-                        "category": current_category,
-                        "description": a.strip(),
-                        "unit_price": (
-                            float(table.item(row, 1).text())
-                            if table.item(row, 1)
-                            and table.item(row, 1).text()
-                            else 0
-                        ),
-                        "quantity": (
-                            float(table.item(row, 2).text())
-                            if table.item(row, 2)
-                            and table.item(row, 2).text()
-                            else 0
-                        ),
-                        "unit_count": float(table.item(row, 3).text()),
-                        "amount": (
-                            float(table.item(row, 4).text())
-                            if table.columnCount() > 4
-                            and table.item(row, 4)
-                            and table.item(row, 4).text()
-                            else None
-                        )
-                    }
-                    result["items"].append(item)
-                except Exception:
-                    continue
-                continue
-            # 3) 요약/할인/합계 행 (A열 비어있고 D열에 숫자)
-            if not a and d:
-                try:
-                    val = float(d)
-                    if val < 0:
-                        result["discounts"].append({
-                            "description": "",
-                            "amount": -val
-                        })
-                    else:
-                        if "subtotal" not in result["summary"]:
-                            result["summary"]["subtotal"] = val
-                        elif "tax_amount" not in result["summary"]:
-                            result["summary"]["tax_amount"] = val
-                        else:
-                            result["summary"]["total_due"] = val
-                except Exception:
-                    continue
+        for record in self._row_records:
+            if record is None:
                 continue
+            kind, value = record
+            if kind == "category":
+                current_category = value
+            elif kind == "item":
+                item = {"category": current_category}
+                item.update(value)
+                result["items"].append(item)
+            elif kind == "discount":
+                result["discounts"].append({
+                    "description": "",
+                    "amount": value
+                })
+            elif "subtotal" not in result["summary"]:
+                result["summary"]["subtotal"] = value
+            elif "tax_amount" not in result["summary"]:
+                result["summary"]["tax_amount"] = value
+            else:
+                result["summary"]["total_due"] = value
         return result
 
+    def _parse_row(self, model, row):
+        """한 행을 (종류, 값) 레코드로 해석합니다. 해당 없으면 None."""
+        cols = model.columnCount()
+
+        def text(col):
+            if col >= cols:
+                return ""
+            return model.index(row, col).data() or ""
+
+        a = text(0)
+        d = text(3)
+        # 1) 섹션 헤더
+        if a and not d:
+            return ("category", a.strip())
+        # 2) 품목 행
+        if a and d:
+            try:
+                return ("item", {
+                    "description": a.strip(),
+                    "unit_price": float(text(1)) if text(1) else 0,
+                    "quantity": float(text(2)) if text(2) else 0,
+                    "unit_count": float(d),
+                    "amount": float(text(4)) if text(4) else None
+                })
+            except Exception:
+                return None
+        # 3) 요약/할인/합계 행 (A열 비어있고 D열에 숫자)
+        if not a and d:
+            try:
+                val = float(d)
+            except Exception:
+                return None
+            if val < 0:
+                return ("discount", -val)
+            return ("total", val)
+        return None
+
+    @property
+    def gpt_service(self):
+        """GPT 클라이언트 (HTTP 모듈은 첫 질문 때 불러옴)"""
+        if self._gpt_service is None:
+            from src.services.gpt_service import GPTService
+            self._gpt_service = GPTService(
+                settings.GPT_API_KEY, settings.GPT_MODEL,
+                base_url=settings.GPT_BASE_URL,
+                connect_timeout=settings.GPT_CONNECT_TIMEOUT,
+                read_timeout=settings.GPT_READ_TIMEOUT,
+                max_retries=settings.GPT_MAX_RETRIES
+            )
+        return self._gpt_service
+
     def ask_gpt(self):
         """GPT에 질문을 보냅니다."""
         user_q = self.chat_input.toPlainText().strip()
         if not user_q or not self.json_path:
             return
-        with open(self.json_path, "r", encoding="utf-8") as f:
-            quotation_json = f.read()
+        context = self._invoice_context()
+        if self._answer_locally(user_q):
+            return
+        quotation_json, tokens, included = context.build(
+            user_q, settings.GPT_CONTEXT_TOKENS
+        )
+        instruction = "아래 견적서 JSON을 참고해 질문에 답변해 주세요."
+        if included < len(context.items):
+            instruction += (
+                f" 품목(items)은 전체 {len(context.items)}개 중 질문과 관련된"
+                f" {included}개만 포함되어 있습니다."
+            )
+        self.log(
+            f"[GPT 문맥] {tokens}토큰"
+            f"{'' if context.exact else '(추정)'}, "
+            f"품목 {included}/{len(context.items)}"
+        )
         messages = [
             {
                 "role": "system",
-                "content": "아래 견적서 JSON을 참고해 질문에 답변해 주세요."
+                "content": instruction
             },
             {
                 "role": "user",
@@ -251,12 +659,165 @@ class ExcelGPTViewer(QMainWindow):
                 )
             }
         ]
-        answer = ask_gpt_api(messages, GPT_API_KEY, GPT_MODEL)
         self.chat_output.append(f"<b>질문:</b> {user_q}")
         self.chat_output.append("<b>GPT:</b>")
-        self.chat_output.append(answer)
         self.chat_input.clear()
-        self.log("[작업] GPT 질문 전송 및 응답 수신 완료")
+        if not settings.GPT_API_KEY:
+            self.chat_output.append("[OpenAI API 키를 .env에 입력하세요]")
+            return
+        if self._answer_from_cache(messages):
+            return
+        self._start_gpt_stream(messages)
+        self.log("[작업] GPT 질문 전송")
+
+    def _invoice_context(self):
+        """현재 JSON 파일의 InvoiceContext (파일이 바뀌었으면 다시 읽음)"""
+        self._flush_json()
+        st = os.stat(self.json_path)
+        key = (self.json_path, st.st_mtime_ns, st.st_size)
+        if key != self._context_key:
+            with open(self.json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if self._token_counter is None:
+                # tiktoken 인코딩은 GUI를 멈추지 않게 백그라운드에서 불러옴
+                self._token_counter = TokenCounter(
+                    settings.GPT_MODEL, background=True
+                )
+            self._context = InvoiceContext(data, self._token_counter)
+            self._query = InvoiceQueryEngine(data)
+            self._context_key = key
+        elif self._token_counter.exact and not self._context.exact:
+            # 인코딩이 준비되면 품목별 토큰 수를 정확히 다시 셈
+            self._context = InvoiceContext(
+                self._context.data, self._token_counter
+            )
+        return self._context
+
+    def _answer_locally(self, user_q):
+        """견적서 데이터만으로 답할 수 있으면 바로 표시하고 True를 반환합니다."""
+        started = time.perf_counter()
+        answer = self._query.answer(user_q)
+        elapsed = (time.perf_counter() - started) * 1000000
+        if answer is None:
+            return False
+        self.chat_output.append(f"<b>질문:</b> {user_q}")
+        self.chat_output.append("<b>답변(견적서 데이터):</b>")
+        self.chat_output.append("")
+        cursor = QTextCursor(self.chat_output.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(answer)
+        self.chat_input.clear()
+        self.log(f"[로컬 답변] GPT 없이 답변 ({elapsed:.0f}µs)")
+        return True
+
+    def _answer_from_cache(self, messages):
+        """저장해 둔 답변이 있으면 바로 표시하고 True를 반환합니다."""
+        cache = self.response_cache
+        if cache is None:
+            return False
+        started = time.perf_counter()
+        try:
+            answer = cache.get(settings.GPT_MODEL, messages)
+        except OSError as e:
+            self.log(f"[GPT 캐시 오류] {e}")
+            return False
+        elapsed = (time.perf_counter() - started) * 1000
+        rate = (
+            f"적중률 {cache.hit_rate:.0%} "
+            f"({cache.hits}/{cache.hits + cache.misses})"
+        )
+        if answer is None:
+            self.log(f"[GPT 캐시] 없음, {rate}")
+            return False
+        self.chat_output.append("")
+        cursor = QTextCursor(self.chat_output.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(answer)
+        self.log(f"[GPT 캐시] 저장된 답변 사용 ({elapsed:.1f}ms), {rate}")
+        return True
+
+    def _start_gpt_stream(self, messages):
+        """답변을 워커 스레드에서 받아 답변 자리에 이어 씁니다."""
+        # 답변 자리 표시 문자(폭 0 공백) 앞에 커서를 두면, 그 뒤에 다른
+        # 질문이 추가되어도 커서가 밀리지 않음
+        self.chat_output.append("\u200b")
+        cursor = QTextCursor(self.chat_output.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.movePosition(QTextCursor.Left)
+
+        thread = QThread(self)
+        worker = GPTStreamWorker(self.gpt_service, messages)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.delta.connect(self._on_gpt_delta)
+        worker.finished.connect(self._on_gpt_finished)
+        worker.failed.connect(self._on_gpt_failed)
+        worker.cancelled.connect(self._on_gpt_cancelled)
+        worker.log.connect(self.log)
+        worker.done.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda: self._threads.discard(thread))
+        self._threads.add(thread)
+        self._gpt_streams[worker] = (cursor, messages)
+        self.stop_gpt_btn.setVisible(True)
+        thread.start()
+
+    def cancel_gpt(self):
+        """답변을 받고 있는 모든 질문을 중단합니다."""
+        for worker in self._gpt_streams:
+            worker.cancel()
+
+    def _on_gpt_delta(self, text):
+        stream = self._gpt_streams.get(self.sender())
+        if stream is None:
+            return
+        stream[0].insertText(text)
+        bar = self.chat_output.verticalScrollBar()
+        if bar.value() >= bar.maximum() - 40:
+            bar.setValue(bar.maximum())
+
+    def _end_gpt_stream(self, note=None):
+        """답변 자리를 정리하고 질문 메시지를 반환합니다."""
+        stream = self._gpt_streams.pop(self.sender(), None)
+        if stream is None:
+            return None
+        cursor, messages = stream
+        if note:
+            cursor.insertText(note)
+        # 자리 표시 문자 제거
+        cursor.deleteChar()
+        self.stop_gpt_btn.setVisible(bool(self._gpt_streams))
+        return messages
+
+    def _on_gpt_finished(self, answer):
+        messages = self._end_gpt_stream()
+        self.log("[작업] GPT 응답 수신 완료")
+        if messages is not None and self.response_cache is not None:
+            try:
+                self.response_cache.put(settings.GPT_MODEL, messages, answer)
+            except OSError as e:
+                self.log(f"[GPT 캐시 오류] {e}")
+
+    def _on_gpt_failed(self, message):
+        self._end_gpt_stream(f"[GPT 호출 오류] {message}")
+        self.log(f"[오류] GPT 호출 실패: {message}")
+
+    def _on_gpt_cancelled(self):
+        self._end_gpt_stream(" [중지됨]")
+        self.log("[작업] GPT 답변 중지")
+
+    def closeEvent(self, event):
+        """창을 닫을 때 남은 변경을 저장하고 로딩 스레드를 정리합니다."""
+        self._flush_json()
+        self.cancel_load()
+        self.cancel_gpt()
+        for thread in list(self._threads):
+            thread.quit()
+            thread.wait()
+        if self._gpt_service is not None:
+            self._gpt_service.close()
+        super().closeEvent(event)
 
     def eventFilter(self, obj, event):
         """이벤트 필터: 엔터키로 질문 전송"""
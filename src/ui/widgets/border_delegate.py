@@ -1,30 +1,48 @@
 from PyQt5.QtWidgets import QStyledItemDelegate
-from PyQt5.QtGui import QPainter, QPen
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QLine
+
+from src.utils.style_cache import (
+    BORDER_TOP, BORDER_BOTTOM, BORDER_LEFT, BORDER_RIGHT
+)
+
 
 class BorderDelegate(QStyledItemDelegate):
-    """openpyxl border 정보에 따라 셀 테두리만 그려주는 Delegate"""
+    """openpyxl border 정보에 따라 셀 테두리만 그려주는 Delegate
+
+    모델은 Qt.UserRole로 (테두리 표 인덱스 << 4) | 변 비트마스크 정수를
+    주고, 변마다의 QPen은 StyleCache.border_pens 공유 표에서 꺼냅니다.
+    같은 펜으로 그리는 변은 drawLines 한 번으로 그립니다.
+    """
+    def __init__(self, parent=None, border_pens=None):
+        super().__init__(parent)
+        self.border_pens = border_pens if border_pens is not None else []
+
     def paint(self, painter, option, index):
         # 1) 기본 렌더링 (배경·글자 등)
         super().paint(painter, option, index)
-        # 2) border_info에 따라 테두리만 그림
-        border_info = index.data(Qt.UserRole)
-        if not border_info:
+        # 2) 테두리 코드에 따라 테두리만 그림
+        code = index.data(Qt.UserRole)
+        if not code:
             return
-        painter.save()
-        pen = QPen(Qt.black, 1)
-        painter.setPen(pen)
+        top, bottom, left, right = self.border_pens[code >> 4]
         rect = option.rect
-        # 위쪽 테두리
-        if border_info.get("top"):
-            painter.drawLine(rect.topLeft(), rect.topRight())
-        # 아래쪽
-        if border_info.get("bottom"):
-            painter.drawLine(rect.bottomLeft(), rect.bottomRight())
-        # 왼쪽
-        if border_info.get("left"):
-            painter.drawLine(rect.topLeft(), rect.bottomLeft())
-        # 오른쪽
-        if border_info.get("right"):
-            painter.drawLine(rect.topRight(), rect.bottomRight())
-        painter.restore() 
\ No newline at end of file
+        edges = []
+        if code & BORDER_TOP:
+            edges.append((top, QLine(rect.topLeft(), rect.topRight())))
+        if code & BORDER_BOTTOM:
+            edges.append(
+                (bottom, QLine(rect.bottomLeft(), rect.bottomRight()))
+            )
+        if code & BORDER_LEFT:
+            edges.append((left, QLine(rect.topLeft(), rect.bottomLeft())))
+        if code & BORDER_RIGHT:
+            edges.append(
+                (right, QLine(rect.topRight(), rect.bottomRight()))
+            )
+        painter.save()
+        while edges:
+            pen = edges[0][0]
+            painter.setPen(pen)
+            painter.drawLines([line for p, line in edges if p is pen])
+            edges = [edge for edge in edges if edge[0] is not pen]
+        painter.restore()
@@ -0,0 +1,137 @@
+from PyQt5.QtWidgets import (
+    QWidget, QHBoxLayout, QLineEdit, QPushButton, QCheckBox, QLabel
+)
+from PyQt5.QtCore import Qt
+
+
+class SheetSearchBar(QWidget):
+    """시트 검색/필터 바 (Ctrl+F)
+
+    모델 스냅샷의 검색 색인으로 일치하는 셀을 찾아 강조하고,
+    이전/다음 결과로 이동하거나 일치하는 행만 보이도록 거릅니다.
+    """
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self._matches = []
+        self._current = -1
+        self._hidden_rows = set()
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("시트에서 찾기 (품목명, 헤더 등)")
+        self.query_edit.setClearButtonEnabled(True)
+        self.query_edit.textChanged.connect(self.refresh)
+        self.query_edit.returnPressed.connect(self.next_match)
+        layout.addWidget(self.query_edit)
+        self.count_label = QLabel()
+        layout.addWidget(self.count_label)
+        prev_btn = QPushButton("이전")
+        prev_btn.clicked.connect(self.prev_match)
+        layout.addWidget(prev_btn)
+        next_btn = QPushButton("다음")
+        next_btn.clicked.connect(self.next_match)
+        layout.addWidget(next_btn)
+        self.filter_check = QCheckBox("일치하는 행만 보기")
+        self.filter_check.toggled.connect(self._apply_filter)
+        layout.addWidget(self.filter_check)
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.close_search)
+        layout.addWidget(close_btn)
+
+    def open_search(self):
+        self.setVisible(True)
+        self.query_edit.setFocus()
+        self.query_edit.selectAll()
+
+    def close_search(self):
+        """검색어를 지우고 강조/필터를 해제합니다."""
+        self.query_edit.clear()
+        self.setVisible(False)
+        self.view.setFocus()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.close_search()
+            return
+        super().keyPressEvent(event)
+
+    def refresh(self):
+        """현재 모델에서 검색어를 다시 찾습니다 (시트가 바뀐 뒤에도 호출)."""
+        model = self.view.model()
+        query = self.query_edit.text().strip()
+        if (model is None or not hasattr(model, "snapshot") or not query
+                or model.rowCount() < model.snapshot.rows):
+            # 로딩 중인 시트는 모든 행이 채워진 뒤 다시 찾음
+            self._matches = []
+        else:
+            self._matches = model.snapshot.text_index().search(query)
+        self._current = 0 if self._matches else -1
+        if model is not None and hasattr(model, "set_matches"):
+            model.set_matches(self._matches, self._current_cell())
+        self._update_count()
+        self._apply_filter()
+        self._scroll_to_current()
+
+    def next_match(self):
+        self._step(1)
+
+    def prev_match(self):
+        self._step(-1)
+
+    def _step(self, delta):
+        if not self._matches:
+            return
+        self._current = (self._current + delta) % len(self._matches)
+        self.view.model().set_current_match(self._current_cell())
+        self._update_count()
+        self._scroll_to_current()
+
+    def _current_cell(self):
+        return self._matches[self._current] if self._matches else None
+
+    def _update_count(self):
+        query = self.query_edit.text().strip()
+        if not query:
+            self.count_label.clear()
+        elif not self._matches:
+            self.count_label.setText("결과 없음")
+        else:
+            self.count_label.setText(
+                f"{self._current + 1}/{len(self._matches)}"
+            )
+
+    def _scroll_to_current(self):
+        cell = self._current_cell()
+        model = self.view.model()
+        if cell is None or model is None:
+            return
+        index = model.index(*divmod(cell, model.columnCount()))
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index)
+
+    def _apply_filter(self):
+        """필터가 켜져 있으면 일치하는 셀이 없는 행을 숨깁니다.
+
+        이전 상태와 달라진 행만 숨기거나 다시 보이게 합니다.
+        """
+        model = self.view.model()
+        hidden = set()
+        if (model is not None and self.filter_check.isChecked()
+                and self.query_edit.text().strip()):
+            cols = model.columnCount()
+            keep = {i // cols for i in self._matches}
+            hidden = set(range(model.rowCount())) - keep
+        for row in self._hidden_rows - hidden:
+            self.view.setRowHidden(row, False)
+        for row in hidden - self._hidden_rows:
+            self.view.setRowHidden(row, True)
+        self._hidden_rows = hidden
+
+    def reset(self):
+        """모델이 바뀌었을 때 호출합니다 (숨긴 행 상태를 버리고 다시 검색)."""
+        self._hidden_rows = set()
+        if self.isVisible():
+            self.refresh()
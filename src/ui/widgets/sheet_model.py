@@ -0,0 +1,133 @@
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor, QFont
+
+# 검색 결과 강조 (현재 결과는 더 진하게)
+MATCH_BRUSH = QBrush(QColor("#FFF2A8"))
+CURRENT_MATCH_BRUSH = QBrush(QColor("#FFB347"))
+
+
+class SheetTableModel(QAbstractTableModel):
+    """SheetSnapshot을 그대로 보여주는 테이블 모델
+
+    셀마다 아이템을 만들지 않고, 뷰가 요청한 셀의 값과 스타일만
+    스냅샷에서 바로 꺼내 반환합니다. loaded_rows를 주면 백그라운드
+    로딩 중 채워진 행까지만 노출합니다.
+    """
+
+    def __init__(self, snapshot, style_cache, parent=None, loaded_rows=None):
+        super().__init__(parent)
+        self.snapshot = snapshot
+        self._style_cache = style_cache
+        self.loaded_rows = (
+            snapshot.rows if loaded_rows is None else loaded_rows
+        )
+        # 스타일 id → CellStyle (처음 그려질 때 채움)
+        self._styles = {}
+        # 확대 비율과 스타일 id → 확대한 QFont
+        self._zoom = 1.0
+        self._zoomed_fonts = {}
+        # 검색 결과 셀 위치와 현재 결과
+        self._matches = frozenset()
+        self._current_match = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.snapshot.cols
+
+    def set_loaded_rows(self, rows):
+        """새로 채워진 행을 뷰에 추가합니다."""
+        if rows <= self.loaded_rows:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded_rows, rows - 1)
+        self.loaded_rows = rows
+        self.endInsertRows()
+
+    def set_zoom(self, zoom):
+        """셀 폰트 크기를 zoom 비율로 바꿉니다 (확대한 폰트는 캐시)."""
+        if zoom == self._zoom:
+            return
+        self._zoom = zoom
+        self._zoomed_fonts.clear()
+        if self.loaded_rows and self.snapshot.cols:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.loaded_rows - 1, self.snapshot.cols - 1),
+                [Qt.FontRole]
+            )
+
+    def _font(self, i):
+        font = self._style(i).font
+        if self._zoom == 1.0:
+            return font
+        sid = self.snapshot.style_ids[i]
+        zoomed = self._zoomed_fonts.get(sid)
+        if zoomed is None:
+            zoomed = QFont(font)
+            zoomed.setPointSizeF(font.pointSizeF() * self._zoom)
+            self._zoomed_fonts[sid] = zoomed
+        return zoomed
+
+    def set_matches(self, matches, current=None):
+        """검색 결과 셀을 강조합니다 (셀 위치는 행 우선 1차원 인덱스)."""
+        if not matches and not self._matches:
+            return
+        self._matches = frozenset(matches)
+        self._current_match = current
+        if self.loaded_rows and self.snapshot.cols:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.loaded_rows - 1, self.snapshot.cols - 1),
+                [Qt.BackgroundRole]
+            )
+
+    def set_current_match(self, current):
+        previous, self._current_match = self._current_match, current
+        cols = self.snapshot.cols
+        for i in (previous, current):
+            if i is not None:
+                index = self.index(i // cols, i % cols)
+                self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+    def _style(self, i):
+        sid = self.snapshot.style_ids[i]
+        style = self._styles.get(sid)
+        if style is None:
+            style = self._style_cache.get(self.snapshot.styles[sid])
+            self._styles[sid] = style
+        return style
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i = index.row() * self.snapshot.cols + index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return str(self.snapshot.values[i] or "")
+        if role == Qt.FontRole:
+            return self._font(i)
+        if role == Qt.BackgroundRole:
+            if i in self._matches:
+                if i == self._current_match:
+                    return CURRENT_MATCH_BRUSH
+                return MATCH_BRUSH
+            return self._style(i).brush
+        if role == Qt.TextAlignmentRole:
+            return self._style(i).alignment
+        if role == Qt.UserRole:
+            return self._style(i).border
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """편집된 값을 스냅샷에 반영합니다."""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        i = index.row() * self.snapshot.cols + index.column()
+        self.snapshot.set_value(i, value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
@@ -1,9 +1,11 @@
-from PyQt5.QtWidgets import QTableWidget
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QTableView, QTableWidget
+from PyQt5.QtCore import Qt, QTimer
 
+from .sheet_model import SheetTableModel
 
-class ZoomableTableWidget(QTableWidget):
-    """확대/축소가 가능한 테이블 위젯"""
+
+class ZoomMixin:
+    """테이블 뷰에 Ctrl + 휠 확대/축소 기능을 더하는 믹스인"""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setMouseTracking(True)
@@ -16,20 +18,40 @@ class ZoomableTableWidget(QTableWidget):
         self.last_mouse_pos = None
         self.snap_zoom_levels = [0.9, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5]
         self.snap_threshold = 0.05
-        # 초기 열 너비/행 높이 저장
-        self._init_col_widths = []
-        self._init_row_heights = []
+        # 100% 기준 크기: 기본 열 너비/행 높이와 기본값과 다른 열/행
+        # (엑셀에서 읽은 크기)만 저장
+        self._base_col_width = self.horizontalHeader().defaultSectionSize()
+        self._base_row_height = self.verticalHeader().defaultSectionSize()
+        self._base_point_size = self.font().pointSizeF()
+        self._init_col_widths = {}
+        self._init_row_heights = {}
+        self.verticalHeader().setMinimumSectionSize(4)
+        self.horizontalHeader().setMinimumSectionSize(4)
+        # 연속된 휠 이벤트를 모아 한 프레임에 한 번만 다시 배치
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
 
     def set_initial_sizes(self):
-        """초기 열 너비/행 높이 저장 (엑셀 로드 후 1회 호출)"""
-        self._init_col_widths = [
-            self.columnWidth(col)
-            for col in range(self.columnCount())
-        ]
-        self._init_row_heights = [
-            self.rowHeight(row)
-            for row in range(self.rowCount())
-        ]
+        """초기 열 너비/행 높이 저장 (엑셀 로드 후, 모델이 바뀔 때마다 호출)
+
+        현재 확대 비율이 100%가 아니면 저장한 크기에 바로 적용합니다.
+        """
+        self._init_col_widths = self._explicit_sizes(self.horizontalHeader())
+        self._init_row_heights = self._explicit_sizes(self.verticalHeader())
+        if self.zoom_factor != 1.0:
+            self._apply_zoom()
+
+    def _explicit_sizes(self, header):
+        # 기본 크기(현재 확대 비율 반영)와 다른 구역만 저장
+        default = header.defaultSectionSize()
+        sizes = {}
+        for section in range(header.count()):
+            size = header.sectionSize(section)
+            if size != default and not header.isSectionHidden(section):
+                sizes[section] = size
+        return sizes
 
     def wheelEvent(self, event):
         """Ctrl + 휠로 확대/축소 (방향 전환 즉시 반응)"""
@@ -44,21 +66,45 @@ class ZoomableTableWidget(QTableWidget):
 
     def zoom_in(self):
         if self.zoom_factor < self.max_zoom:
-            self.zoom_factor *= 1.1
-            self._apply_zoom()
+            self.zoom_factor = min(self.zoom_factor * 1.1, self.max_zoom)
+            self._schedule_zoom()
 
     def zoom_out(self):
         if self.zoom_factor > self.min_zoom:
-            self.zoom_factor /= 1.1
-            self._apply_zoom()
+            self.zoom_factor = max(self.zoom_factor / 1.1, self.min_zoom)
+            self._schedule_zoom()
+
+    def _schedule_zoom(self):
+        # 이미 예약되어 있으면 다시 시작하지 않음 (계속 굴려도 16ms마다
+        # 한 번씩 적용되게)
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
 
     def _apply_zoom(self):
-        """현재 zoom_factor를 기준값에 곱해서 적용"""
+        """현재 zoom_factor를 저장해 둔 기준 크기와 폰트에 곱해서 적용
+
+        셀 텍스트를 다시 재지 않으므로 시트 크기와 무관하게 빠릅니다.
+        기본 크기 행/열은 기본 크기 하나만 바꾸고, 엑셀에서 크기를
+        지정한 행/열만 따로 설정합니다.
+        """
+        self._zoom_timer.stop()
+        zoom = self.zoom_factor
+        horizontal = self.horizontalHeader()
+        vertical = self.verticalHeader()
+        horizontal.setDefaultSectionSize(round(self._base_col_width * zoom))
+        vertical.setDefaultSectionSize(round(self._base_row_height * zoom))
+        for col, width in self._init_col_widths.items():
+            self.setColumnWidth(col, max(round(width * zoom), 1))
+        for row, height in self._init_row_heights.items():
+            self.setRowHeight(row, max(round(height * zoom), 1))
+
         font = self.font()
-        font.setPointSize(int(10 * self.zoom_factor))
+        font.setPointSizeF(self._base_point_size * zoom)
         self.setFont(font)
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
+        # 셀별 폰트(SheetTableModel)는 모델이 같은 비율로 키움
+        model = self.model()
+        if hasattr(model, "set_zoom"):
+            model.set_zoom(zoom)
 
     def _apply_snap_zoom(self, zoom_value):
         """가장 가까운 스냅 레벨로 확대/축소 값 조정"""
@@ -107,4 +153,22 @@ class ZoomableTableWidget(QTableWidget):
             
             # 스크롤 위치 업데이트
             h_scroll.setValue(new_h_value)
-            v_scroll.setValue(new_v_value) 
\ No newline at end of file
+            v_scroll.setValue(new_v_value) 
+
+
+class ZoomableTableWidget(ZoomMixin, QTableWidget):
+    """확대/축소가 가능한 테이블 위젯"""
+
+
+class ZoomableTableView(ZoomMixin, QTableView):
+    """확대/축소가 가능한 테이블 뷰 (SheetTableModel용)"""
+
+    def set_snapshot(self, snapshot, style_cache, loaded_rows=None):
+        """스냅샷을 보여주는 SheetTableModel로 모델을 바꿉니다."""
+        old_model = self.model()
+        self.setModel(
+            SheetTableModel(snapshot, style_cache, self, loaded_rows)
+        )
+        if old_model is not None:
+            old_model.deleteLater()
+        self.clearSpans()
@@ -0,0 +1,66 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class ExcelLoadWorker(QObject):
+    """엑셀 파일을 백그라운드 스레드에서 읽는 작업자
+
+    QThread로 옮긴 뒤 run()을 실행하면, 빈 스냅샷을 먼저 알리고
+    행 블록이 채워질 때마다 rows_ready로 진행 상황을 보냅니다.
+    프로파일링이 켜져 있으면 단계별 기록 요약을 profiled로 보냅니다.
+    """
+    snapshot_ready = pyqtSignal(object)
+    rows_ready = pyqtSignal(int)
+    progress = pyqtSignal(int, int)
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    done = pyqtSignal()
+    profiled = pyqtSignal(str)
+
+    def __init__(self, excel_service, path, block_rows=200, sheet=None):
+        super().__init__()
+        self.excel_service = excel_service
+        self.path = path
+        # None이면 활성 시트
+        self.sheet = sheet
+        self.block_rows = block_rows
+        self._cancelled = False
+
+    def cancel(self):
+        """다음 행 블록을 읽기 전에 작업을 중단합니다."""
+        self._cancelled = True
+
+    def run(self):
+        profiler = self.excel_service.profiler
+        try:
+            with profiler.run(
+                "load", file=self.path, sheet=self.sheet
+            ) as trace:
+                self._load()
+            if trace is not None:
+                self.profiled.emit(trace.summary())
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.done.emit()
+
+    def _load(self):
+        snapshot = None
+        for snapshot, rows_done in self.excel_service.iter_load(
+            self.path, self.block_rows, self.sheet
+        ):
+            if self._cancelled:
+                self.cancelled.emit()
+                return
+            if rows_done == 0:
+                self.snapshot_ready.emit(snapshot)
+            else:
+                self.rows_ready.emit(rows_done)
+            self.progress.emit(rows_done, snapshot.rows)
+        if self._cancelled:
+            self.cancelled.emit()
+            return
+        json_path, items = self.excel_service.finish_load(
+            self.path, snapshot, self.sheet
+        )
+        self.loaded.emit(json_path, items)
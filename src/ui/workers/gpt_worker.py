@@ -0,0 +1,51 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class GPTStreamWorker(QObject):
+    """GPT 답변을 백그라운드 스레드에서 스트리밍으로 받는 작업자
+
+    QThread로 옮긴 뒤 run()을 실행하면, 답변 조각이 도착할 때마다
+    delta로 보내고 끝나면 전체 답변을 finished로 보냅니다. 질문마다
+    작업자를 따로 만들므로 여러 질문이 서로를 기다리지 않습니다.
+    재시도 알림은 GUI 로그에 남기도록 log로 보냅니다.
+    """
+    delta = pyqtSignal(str)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    done = pyqtSignal()
+    log = pyqtSignal(str)
+
+    def __init__(self, gpt_service, messages):
+        super().__init__()
+        self.gpt_service = gpt_service
+        self.messages = messages
+        self._cancelled = False
+        self._stream = None
+
+    def cancel(self):
+        """응답 연결을 닫아 바로 중단합니다 (GUI 스레드에서 호출)."""
+        self._cancelled = True
+        stream = self._stream
+        if stream is not None:
+            stream.close()
+
+    def run(self):
+        parts = []
+        try:
+            self._stream = self.gpt_service.stream_chat(
+                self.messages, log=self.log.emit
+            )
+            if self._cancelled:
+                self._stream.close()
+            for text in self._stream:
+                parts.append(text)
+                self.delta.emit(text)
+            if self._cancelled:
+                self.cancelled.emit()
+            else:
+                self.finished.emit("".join(parts))
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.done.emit()
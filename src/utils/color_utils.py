@@ -1,14 +1,115 @@
-from PyQt5.QtGui import QColor
-
-def apply_tint(hex_rgb, tint):
-    """hex_rgb: 'RRGGBB', tint: -1.0~1.0"""
-    ch = [int(hex_rgb[0:2], 16), int(hex_rgb[2:4], 16), int(hex_rgb[4:6], 16)]
-    out = [0, 0, 0]
-    for i in range(3):
-        c = ch[i]
+import colorsys
+from functools import lru_cache
+from xml.etree import ElementTree
+
+
+@lru_cache(maxsize=None)
+def hex_to_rgb(hex_rgb):
+    """'RRGGBB' 또는 'AARRGGBB' 문자열을 (r, g, b) 튜플로 변환합니다."""
+    hex_rgb = hex_rgb[-6:]
+    return (
+        int(hex_rgb[0:2], 16), int(hex_rgb[2:4], 16), int(hex_rgb[4:6], 16)
+    )
+
+
+@lru_cache(maxsize=4096)
+def tint_hex(hex_rgb, tint):
+    """hex_rgb: 'RRGGBB', tint: -1.0~1.0 → 틴트가 적용된 'RRGGBB'"""
+    out = []
+    for c in hex_to_rgb(hex_rgb):
         if tint < 0:
             nc = c * (1 + tint)
         else:
             nc = c * (1 - tint) + 255 * tint
-        out[i] = max(0, min(int(round(nc)), 255))
-    return QColor(out[0], out[1], out[2]) 
\ No newline at end of file
+        out.append(max(0, min(int(round(nc)), 255)))
+    return "%02X%02X%02X" % tuple(out)
+
+
+# Office 기본 테마 (clrScheme 순서: dk1, lt1, dk2, lt2, accent1~6,
+# hlink, folHlink)
+DEFAULT_THEME_COLORS = [
+    "000000", "FFFFFF", "44546A", "E7E6E6",
+    "4472C4", "ED7D31", "A5A5A5", "FFC000", "5B9BD5", "70AD47",
+    "0563C1", "954F72",
+]
+# 셀 색의 theme 인덱스 → clrScheme 순서 (0~3은 밝은/어두운 색이 바뀜)
+_THEME_INDEX_ORDER = [1, 0, 3, 2, 4, 5, 6, 7, 8, 9, 10, 11]
+_DRAWING_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+
+class ThemePalette:
+    """워크북 테마 색을 (테마 인덱스, 틴트)로 해석하는 팔레트
+
+    엑셀과 같이 HLS 밝기에 틴트를 적용합니다. 테마 색마다 밝기 0~255에
+    대한 RGB 표를 처음 쓸 때 한 번 만들고, 해석 결과는 메모해 둡니다.
+    """
+
+    def __init__(self, colors=None):
+        self.colors = list(colors or DEFAULT_THEME_COLORS)
+        self._luts = {}
+        self._resolved = {}
+
+    @classmethod
+    def from_workbook(cls, wb):
+        return cls.from_theme_xml(getattr(wb, "loaded_theme", None))
+
+    @classmethod
+    def from_theme_xml(cls, xml):
+        """theme1.xml 내용에서 clrScheme 색을 읽습니다 (실패 시 기본 테마)."""
+        if not xml:
+            return cls()
+        try:
+            root = ElementTree.fromstring(xml)
+        except ElementTree.ParseError:
+            return cls()
+        scheme = root.find(f".//{_DRAWING_NS}clrScheme")
+        if scheme is None:
+            return cls()
+        colors = list(DEFAULT_THEME_COLORS)
+        for i, entry in enumerate(list(scheme)[:len(colors)]):
+            for color in entry:
+                if color.tag.endswith("srgbClr"):
+                    value = color.get("val")
+                else:
+                    value = color.get("lastClr")
+                if value and len(value) == 6:
+                    colors[i] = value.upper()
+                    break
+        return cls(colors)
+
+    def color(self, index, tint=0.0):
+        """테마 인덱스와 틴트에 해당하는 'RRGGBB' (범위 밖이면 None)"""
+        key = (index, tint)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        hex_rgb = self._resolved[key] = self._resolve(index, tint)
+        return hex_rgb
+
+    def _resolve(self, index, tint):
+        if index is None or not 0 <= index < len(_THEME_INDEX_ORDER):
+            return None
+        if not tint:
+            return self.colors[_THEME_INDEX_ORDER[index]]
+        lightness, lut = self._lut(index)
+        if tint < 0:
+            lightness = lightness * (1 + tint)
+        else:
+            lightness = lightness * (1 - tint) + tint
+        return lut[max(0, min(255, int(round(lightness * 255))))]
+
+    def _lut(self, index):
+        """테마 색의 원래 밝기와 밝기별 RGB 표"""
+        entry = self._luts.get(index)
+        if entry is None:
+            r, g, b = hex_to_rgb(self.colors[_THEME_INDEX_ORDER[index]])
+            h, lightness, s = colorsys.rgb_to_hls(r / 255, g / 255, b / 255)
+            lut = []
+            for level in range(256):
+                rgb = colorsys.hls_to_rgb(h, level / 255, s)
+                lut.append("%02X%02X%02X" % tuple(
+                    int(round(c * 255)) for c in rgb
+                ))
+            entry = self._luts[index] = (lightness, lut)
+        return entry
@@ -0,0 +1,44 @@
+import json
+import os
+import re
+import tempfile
+
+# 파일 이름에 쓸 수 없는 문자 (시트 이름 → 파일 이름)
+_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|\[\]\s]+')
+
+
+def sheet_file_stem(path, sheet=None):
+    """엑셀 파일 옆에 두는 파생 파일의 경로(확장자 제외)
+
+    sheet가 None이면 활성 시트로 보고 엑셀 파일 이름을 그대로 쓰며,
+    그 외의 시트는 '파일.시트' 형태로 구분합니다.
+    """
+    stem = os.path.splitext(path)[0]
+    if sheet is None:
+        return stem
+    return f"{stem}.{_UNSAFE_CHARS.sub('_', sheet).strip('_') or '_'}"
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    """임시 파일에 쓴 뒤 이름을 바꿔 JSON 파일을 원자적으로 저장합니다.
+
+    저장 도중 프로그램이 종료되어도 기존 파일이 반쯤 쓰인 상태로
+    남지 않습니다.
+    """
+    dump_kwargs.setdefault("ensure_ascii", False)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".tmp-", suffix=".json", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,154 @@
+import json
+import os
+import platform
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class _Trace:
+    """프로파일 실행 하나 (작업 이름, 단계별 누적 시간/할당량)"""
+
+    def __init__(self, action, meta):
+        self.action = action
+        self.meta = meta
+        # 단계 이름 → [시간(초), 할당 바이트, 횟수], 처음 시작한 순서
+        self.stages = {}
+        self.total = 0.0
+        self.peak = 0
+        # switch()로 시작한 단계 (이름, 시작 시각, 시작 시 메모리)
+        self.open_stage = None
+
+    def add(self, name, seconds, allocated):
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = [0.0, 0, 0]
+        stage[0] += seconds
+        stage[1] += allocated
+        stage[2] += 1
+
+    def record(self):
+        """추적 파일에 쓰는 JSON 레코드"""
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "action": self.action,
+            **self.meta,
+            "total_ms": round(self.total * 1000, 2),
+            "peak_kb": round(self.peak / 1024, 1),
+            "stages": {
+                name: {
+                    "ms": round(seconds * 1000, 2),
+                    "alloc_kb": round(allocated / 1024, 1) or 0.0,
+                    "calls": calls,
+                }
+                for name, (seconds, allocated, calls) in self.stages.items()
+            },
+            "python": platform.python_version(),
+        }
+
+    def summary(self):
+        """로그 창에 표시할 한 줄 요약"""
+        parts = [
+            f"{name} {seconds * 1000:.0f}ms/"
+            f"{round(allocated / 1048576, 1) or 0.0:+.1f}MB"
+            for name, (seconds, allocated, _) in self.stages.items()
+        ]
+        target = self.meta.get("file") or ""
+        return (
+            f"[프로파일] {self.action} {target} "
+            f"{self.total * 1000:.0f}ms, 최대 {self.peak / 1048576:.1f}MB"
+            + (f" ({', '.join(parts)})" if parts else "")
+        )
+
+
+class StageProfiler:
+    """단계별 실행 시간과 메모리 할당을 기록하는 프로파일러
+
+    enabled가 False이면 모든 호출이 아무 일도 하지 않습니다.
+    run()으로 작업 하나를 감싸고, 그 안에서 stage()/switch()로 단계를
+    나눕니다. 실행 중인 작업은 스레드마다 따로 추적하므로 로딩 스레드와
+    GUI 스레드에서 함께 쓸 수 있습니다. 끝난 작업은 trace_path에 JSON
+    한 줄로 덧붙입니다. 메모리는 tracemalloc 기준이며 프로세스 전체를
+    재므로, 두 스레드가 동시에 기록하면 서로의 할당이 섞일 수 있습니다.
+    """
+
+    def __init__(self, enabled=False, trace_path=None):
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _current(self):
+        return getattr(self._local, "trace", None)
+
+    @contextmanager
+    def run(self, action, **meta):
+        """작업 하나를 기록합니다. 꺼져 있거나 중첩되면 None을 줍니다."""
+        if not self.enabled or self._current() is not None:
+            yield None
+            return
+        if "file" in meta and meta["file"]:
+            meta["file"] = os.path.basename(meta["file"])
+        trace = _Trace(action, meta)
+        self._local.trace = trace
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            self.switch(None)
+            trace.total = time.perf_counter() - start
+            trace.peak = max(0, tracemalloc.get_traced_memory()[1] - base)
+            self._local.trace = None
+            self._write(trace)
+
+    @contextmanager
+    def stage(self, name):
+        """실행 중인 작업에 name 단계의 시간/할당량을 더합니다."""
+        trace = self._current() if self.enabled else None
+        if trace is None:
+            yield
+            return
+        mem = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            trace.add(
+                name, time.perf_counter() - start,
+                tracemalloc.get_traced_memory()[0] - mem
+            )
+
+    def switch(self, name):
+        """앞서 switch()로 시작한 단계를 끝내고 name 단계를 시작합니다.
+
+        한 반복문 안에서 단계가 바뀌는 경우에 씁니다. None이면 끝내기만
+        합니다.
+        """
+        trace = self._current() if self.enabled else None
+        if trace is None:
+            return
+        now = time.perf_counter()
+        mem = tracemalloc.get_traced_memory()[0]
+        if trace.open_stage is not None:
+            prev, start, prev_mem = trace.open_stage
+            trace.add(prev, now - start, mem - prev_mem)
+        trace.open_stage = (name, now, mem) if name is not None else None
+
+    def _write(self, trace):
+        if not self.trace_path:
+            return
+        line = json.dumps(trace.record(), ensure_ascii=False)
+        try:
+            with self._write_lock:
+                folder = os.path.dirname(self.trace_path)
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
+                with open(self.trace_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            print(f"[프로파일 오류] {e}")
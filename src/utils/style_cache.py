@@ -0,0 +1,89 @@
+from collections import namedtuple
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QColor, QFont, QPen
+
+from .color_utils import hex_to_rgb
+
+# StyleSpec을 Qt 객체로 변환한 결과 (셀 사이에서 공유)
+# border: (테두리 표 인덱스 << 4) | 변 비트마스크, 테두리가 없으면 0
+CellStyle = namedtuple("CellStyle", "font brush alignment border")
+
+# 테두리 변 비트 (StyleSpec.border 순서: 위, 아래, 왼쪽, 오른쪽)
+BORDER_TOP, BORDER_BOTTOM, BORDER_LEFT, BORDER_RIGHT = 1, 2, 4, 8
+BORDER_EDGES = (BORDER_TOP, BORDER_BOTTOM, BORDER_LEFT, BORDER_RIGHT)
+
+# openpyxl 테두리 스타일 → (선 두께, 선 모양)
+BORDER_STYLES = {
+    "hair": (1, Qt.DotLine),
+    "thin": (1, Qt.SolidLine),
+    "dotted": (1, Qt.DotLine),
+    "dashed": (1, Qt.DashLine),
+    "dashDot": (1, Qt.DashDotLine),
+    "dashDotDot": (1, Qt.DashDotDotLine),
+    "medium": (2, Qt.SolidLine),
+    "mediumDashed": (2, Qt.DashLine),
+    "mediumDashDot": (2, Qt.DashDotLine),
+    "mediumDashDotDot": (2, Qt.DashDotDotLine),
+    "slantDashDot": (2, Qt.DashDotLine),
+    "double": (3, Qt.SolidLine),
+    "thick": (3, Qt.SolidLine),
+}
+
+
+class StyleCache:
+    """StyleSpec별 QFont/QBrush/정렬/테두리 정보를 한 번만 만드는 캐시
+
+    테두리는 변마다 QPen을 담은 공유 표(border_pens)에 한 번만 만들고,
+    셀 스타일에는 표 인덱스와 변 비트마스크를 합친 정수만 둡니다.
+    """
+
+    def __init__(self):
+        self._styles = {}
+        # (스타일, 색) → QPen
+        self._pens = {}
+        # 변 조합 → border_pens 인덱스 (0번은 테두리 없음)
+        self._border_ids = {}
+        self.border_pens = [(None, None, None, None)]
+
+    def get(self, spec):
+        style = self._styles.get(spec)
+        if style is None:
+            style = self._styles[spec] = self._build(spec)
+        return style
+
+    def _build(self, spec):
+        font = QFont(spec.font_name, spec.font_size)
+        font.setBold(spec.bold)
+        font.setItalic(spec.italic)
+        brush = (
+            QBrush(QColor(*hex_to_rgb(spec.background)))
+            if spec.background else None
+        )
+        border = self._border(spec.border)
+        return CellStyle(font, brush, spec.alignment, border)
+
+    def _border(self, edges):
+        """변별 (스타일, 색) 튜플을 (표 인덱스 << 4) | 비트마스크로 바꿉니다."""
+        mask = 0
+        for bit, edge in zip(BORDER_EDGES, edges):
+            if edge is not None:
+                mask |= bit
+        if not mask:
+            return 0
+        border_id = self._border_ids.get(edges)
+        if border_id is None:
+            border_id = self._border_ids[edges] = len(self.border_pens)
+            self.border_pens.append(tuple(
+                self._pen(*edge) if edge is not None else None
+                for edge in edges
+            ))
+        return border_id << 4 | mask
+
+    def _pen(self, style, color):
+        pen = self._pens.get((style, color))
+        if pen is None:
+            width, line = BORDER_STYLES.get(style, (1, Qt.SolidLine))
+            qcolor = QColor(*hex_to_rgb(color)) if color else QColor(Qt.black)
+            pen = self._pens[(style, color)] = QPen(qcolor, width, line)
+        return pen
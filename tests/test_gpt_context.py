@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from src.services.gpt_context import InvoiceContext
+
+
+class CharCounter:
+    """글자 수를 토큰 수로 쓰는 계산기 (결과를 예측할 수 있게)"""
+    exact = True
+
+    def count(self, text):
+        return len(text)
+
+
+def make_data(items=50):
+    return {
+        "meta": {"file_name": "quote.json"},
+        "items": [
+            {"description": f"품목 {i}", "amount": i * 1000}
+            for i in range(items)
+        ],
+        "header": {f"label{i}": "값" * 40 for i in range(5)},
+        "summary": {"subtotal": 1000, "tax_due": 100, "total_due": 1100},
+    }
+
+
+def test_full_data_when_it_fits():
+    data = make_data(3)
+    context = InvoiceContext(data, CharCounter())
+    text, tokens, included = context.build("질문", 100000)
+    assert json.loads(text) == data
+    assert (tokens, included) == (len(text), 3)
+
+
+@pytest.mark.parametrize("max_tokens", [600, 800, 1200])
+def test_items_trimmed_to_budget(max_tokens):
+    context = InvoiceContext(make_data(), CharCounter())
+    text, tokens, included = context.build("품목 7", max_tokens)
+    assert tokens == len(text) <= max_tokens
+    data = json.loads(text)
+    assert data["items_total"] == 50
+    assert len(data["items"]) == included > 0
+    assert "truncated" not in data
+
+
+def test_budget_smaller_than_header_and_summary():
+    context = InvoiceContext(make_data(), CharCounter())
+    text, tokens, included = context.build("총액", 150)
+    assert tokens == len(text) <= 150
+    data = json.loads(text)
+    assert data["truncated"] is True
+    assert included == 0
+    # 헤더가 먼저 빠지고 합계가 담긴 요약은 남음
+    assert data["summary"] == make_data()["summary"]
+    assert "header" not in data
+
+
+def test_budget_too_small_for_anything():
+    context = InvoiceContext(make_data(), CharCounter())
+    assert context.build("총액", 10) == ("", 0, 0)
@@ -0,0 +1,92 @@
+import pytest
+
+from src.services.invoice_query import InvoiceQueryEngine, parse_amount
+
+DATA = {
+    "items": [
+        {"description": "조명"},
+        {"description": "LED 패널", "unit_krw": 1000000, "quantity": 1,
+         "unit": "EA", "amount": 1000000},
+        {"description": "스탠드", "unit_krw": 50000, "quantity": 2,
+         "unit": "EA", "amount": 100000},
+        {"description": "Category 1"},
+        {"description": "케이블", "unit_krw": 10000, "quantity": 25,
+         "unit": "M", "amount": 250000},
+        {"description": "설치비", "unit_krw": 150000, "quantity": 1,
+         "unit": "식", "amount": 150000},
+    ],
+    "header": {},
+    "summary": {
+        "subtotal": 1500000, "tax_rate": 0.1, "tax_due": 150000,
+        "total_due": 1650000,
+    },
+}
+
+# 질문 → 답변 (None이면 GPT에 넘겨야 함)
+CASES = [
+    ("총액이 얼마야?", "총액은 1,650,000원입니다."),
+    ("What is the grand total?", "총액은 1,650,000원입니다."),
+    ("부가세는?", "세금은 150,000원입니다."),
+    ("what is the subtotal?", "소계는 1,500,000원입니다."),
+    ("품목 몇 개야?", "품목은 모두 4개입니다."),
+    ("how many items?", "품목은 모두 4개입니다."),
+    ("가장 비싼 품목은?",
+     "단가가 가장 비싼 품목은 'LED 패널' (1,000,000원)입니다."),
+    ("what is the cheapest item",
+     "단가가 가장 싼 품목은 '케이블' (10,000원)입니다."),
+    ("100만원 이상 품목",
+     "금액 1,000,000원 이상 품목 (금액 큰 순) 1개:\n"
+     "- LED 패널: 1,000,000원"),
+    ("items over 1M won",
+     "금액 1,000,000원 이상 품목 (금액 큰 순) 1개:\n"
+     "- LED 패널: 1,000,000원"),
+    ("15만원 이하 품목 보여줘",
+     "금액 150,000원 이하 품목 (금액 작은 순) 2개:\n"
+     "- 스탠드: 100,000원\n- 설치비: 150,000원"),
+    ("조명 카테고리 합계",
+     "'조명' 품목 2개의 금액 합계는 1,100,000원입니다."),
+    ("How many items in Category 1?", "'Category 1' 품목은 2개입니다."),
+    ("items in 조명",
+     "'조명' 품목 2개:\n- LED 패널: 1,000,000원\n- 스탠드: 100,000원"),
+    # 카테고리와 함께 쓰인 다른 조건
+    ("카테고리 Category 1 중 가장 비싼 품목은?", None),
+    ("Category 1 에서 100만원 이상 품목", None),
+    # 수량/단위/순번/세율 같은 필드
+    ("2번째 품목 수량은?", None),
+    ("How many EA of 조명?", None),
+    ("what is the tax rate?", None),
+    ("부가세율은?", None),
+    ("스탠드 단가는?", None),
+    ("가장 비싼 금액은?", None),
+    # 검증/설명 요청
+    ("Is the total correct?", None),
+    ("총액이 맞는지 확인해줘", None),
+    ("왜 이렇게 비싸?", None),
+    # 유형이 없거나 둘 이상
+    ("배송은 언제?", None),
+    ("총액과 세금은?", None),
+    ("100만원", None),
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return InvoiceQueryEngine(DATA)
+
+
+@pytest.mark.parametrize("question, expected", CASES)
+def test_answer(engine, question, expected):
+    assert engine.answer(question) == expected
+
+
+def test_no_items_falls_back():
+    engine = InvoiceQueryEngine({"items": [], "summary": {}})
+    assert engine.answer("총액이 얼마야?") is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("100만원", 1000000), ("1.5억", 150000000), ("500k", 500000),
+    ("1,200,000원", 1200000), ("over 1m won", 1000000), ("총액", None),
+])
+def test_parse_amount(text, expected):
+    assert parse_amount(text) == expected